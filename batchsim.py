@@ -0,0 +1,234 @@
+"""
+일괄(lock-step) 시뮬레이션
+==========================
+simulate.play_game 은 한 판씩 list-of-lists 보드로 진행한다. 여기서는 K 판을
+정수 하나에 이어 붙인 비트보드로 들고 다니며 대부분의 수를 K 판 동시에 둔다.
+
+- 배치: 게임 g 는 비트 [g·S, g·S + rows·cols) 를 행 우선으로 차지하고
+  (S = (rows+1)·cols), 게임 사이에 빈 행 하나를 둬서 위·아래 시프트가
+  다른 게임으로 번지지 않게 한다. 좌·우 시프트는 열 마스크로 자른다.
+- 숫자 필드 / 이웃 수: 8방향 시프트 8장을 비트 단위 가산기로 더한
+  4장의 비트 평면 (0~8)
+- 연쇄 열기: 0 셀 경계를 마스크한 팽창(dilation) 반복
+- 단순 규칙 (숫자 = 이웃 깃발 수 → 나머지 안전, 숫자 = 열리지 않은 이웃 수
+  → 나머지 지뢰) 을 모든 게임에 동시에 적용
+- 모든 게임이 단순 규칙으로 더 못 나가면, 그 게임들만 하나씩 전체 solver 로
+  내려가 play_game 과 같은 방식 (확정 수 → 없으면 ⭐ 전략) 으로 한 수를 둔다
+
+numpy 없이 파이썬 정수 연산만 쓴다 (정수 하나가 K 판 전체의 한 비트 평면).
+보드는 play_game 과 같은 seed → 같은 보드. 다만 단순 규칙을 먼저 쓰므로
+solver 호출 수가 다르고, 대그룹 무작위 열거용 전역 난수는 판마다 고정하지 않는다.
+"""
+
+import time
+
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG, generate_board
+from solver import calc_probabilities
+from strategies import make_strategy
+
+BATCH_SIZE = 64     # 기본 동시 진행 판 수
+
+
+class BoardBatch:
+    """K 판의 비트보드 묶음. mines / open / flags 는 K 판 전체를 담은 정수."""
+
+    def __init__(self, rows, cols, masks):
+        self.rows, self.cols, self.k = rows, cols, len(masks)
+        W = cols
+        self.stride = S = (rows + 1) * W
+        self.game_bits = (1 << rows * W) - 1
+        rep = sum(1 << (g * S) for g in range(self.k))     # 게임마다 1 비트
+        self.valid = self.game_bits * rep                   # 게임 영역 (겹침 없음)
+        col0 = sum(1 << (r * W) for r in range(rows)) * rep
+        self.not_first = self.valid & ~col0                 # 0 열 제외
+        self.not_last  = self.valid & ~(col0 << (W - 1))    # 마지막 열 제외
+
+        self.mines = 0
+        for g, mask in enumerate(masks):
+            base = g * S
+            for r, row in enumerate(mask):
+                for c, m in enumerate(row):
+                    if m:
+                        self.mines |= 1 << (base + r * W + c)
+        self.num  = self.count8(self.mines)
+        self.zero = self.valid & ~self.mines & ~(self.num[0] | self.num[1] |
+                                                 self.num[2] | self.num[3])
+        self.open  = 0
+        self.flags = 0
+
+    # ──────────────────────────────────────────
+    #  비트 연산
+    # ──────────────────────────────────────────
+    def _shifts(self, x):
+        """x 를 8방향 이웃 자리로 옮긴 8장 (셀 i 에 '이웃 i 의 값')"""
+        W = self.cols
+        w = (x << 1) & self.not_first       # 왼쪽 이웃 값
+        e = (x >> 1) & self.not_last        # 오른쪽 이웃 값
+        valid = self.valid
+        return (w, e,
+                (x << W) & valid, (x >> W) & valid,
+                (w << W) & valid, (w >> W) & valid,
+                (e << W) & valid, (e >> W) & valid)
+
+    def count8(self, x):
+        """셀마다 x 가 켜진 이웃 수 (0~8) → 비트 평면 4장 (하위 비트부터)"""
+        p0 = p1 = p2 = p3 = 0
+        for s in self._shifts(x):
+            c = p0 & s;  p0 ^= s
+            d = p1 & c;  p1 ^= c
+            e = p2 & d;  p2 ^= d
+            p3 |= e
+        return p0, p1, p2, p3
+
+    def dilate(self, x):
+        """x 와 8방향 이웃 전체"""
+        W = self.cols
+        h = x | ((x << 1) & self.not_first) | ((x >> 1) & self.not_last)
+        return (h | (h << W) | (h >> W)) & self.valid
+
+    def _equal(self, a, b):
+        """두 비트 평면 수의 같은 자리"""
+        return self.valid & ~((a[0] ^ b[0]) | (a[1] ^ b[1]) | (a[2] ^ b[2]) | (a[3] ^ b[3]))
+
+    def flood(self, seeds):
+        """seeds (안전 셀) 열기 + 0 영역 연쇄 (모든 게임 동시)"""
+        opened = self.open | seeds
+        front  = seeds & self.zero
+        while front:
+            grow    = self.dilate(front) & ~opened & ~self.flags & self.valid
+            opened |= grow
+            front   = grow & self.zero
+        self.open = opened
+
+    def trivial_moves(self, active):
+        """단순 규칙으로 확정되는 (안전, 지뢰) 셀 — active 게임 영역만"""
+        closed = active & ~self.open & ~self.flags
+        if not closed:
+            return 0, 0
+        src = self.open & active & ~self.zero
+        by_flag   = self._equal(self.num, self.count8(self.flags))
+        by_closed = self._equal(self.num, self.count8(self.valid & ~self.open))
+        safe = self.dilate(src & by_flag) & closed
+        mine = self.dilate(src & by_closed) & closed
+        return safe, mine
+
+    # ──────────────────────────────────────────
+    #  게임 단위 변환
+    # ──────────────────────────────────────────
+    def region(self, g):
+        return self.game_bits << (g * self.stride)
+
+    def segment(self, x, g):
+        return (x >> (g * self.stride)) & self.game_bits
+
+    def cell_bit(self, g, r, c):
+        return 1 << (g * self.stride + r * self.cols + c)
+
+    def cell_state(self, g):
+        """게임 g 의 cell_state (list-of-lists)"""
+        n   = self.rows * self.cols
+        op  = format(self.segment(self.open, g), f"0{n}b")[::-1]
+        fl  = format(self.segment(self.flags, g), f"0{n}b")[::-1]
+        st  = [STATE_OPEN if o == "1" else STATE_FLAG if f == "1" else STATE_CLOSED
+               for o, f in zip(op, fl)]
+        W = self.cols
+        return [st[r * W:(r + 1) * W] for r in range(self.rows)]
+
+
+# ─────────────────────────────────────────────
+#  K 판 진행
+# ─────────────────────────────────────────────
+def play_batch(rows, cols, mines, seeds, strategy="min"):
+    """
+    seeds 마다 한 판 (play_game 과 같은 보드) 을 lock-step 으로 진행
+    → 결과 dict 목록 (won, false_safe, guesses, guess_time_s, solver_calls,
+      latencies, seed, time_s). time_s 는 묶음 전체 시간을 판 수로 나눈 값.
+    """
+    import random
+    t_start = time.perf_counter()
+    sr, sc  = rows // 2, cols // 2
+    boards, masks = [], []
+    for seed in seeds:
+        board, mask = generate_board(rows, cols, mines, sr, sc, random.Random(seed))
+        boards.append(board)
+        masks.append(mask)
+    bb = BoardBatch(rows, cols, masks)
+    k  = len(seeds)
+    bb.flood(sum(bb.cell_bit(g, sr, sc) for g in range(k)))
+
+    results = [{"won": False, "false_safe": 0, "guesses": 0, "guess_time_s": 0.0,
+                "solver_calls": 0, "latencies": [], "seed": s} for s in seeds]
+    guesses = [make_strategy(strategy) for _ in seeds]
+    live    = set(range(k))
+    goal    = rows * cols - mines
+
+    while live:
+        active = sum(bb.region(g) for g in live)
+        # ── 모든 게임 동시: 단순 규칙이 더 못 나갈 때까지 ──
+        while True:
+            safe, mine = bb.trivial_moves(active)
+            if not (safe or mine):
+                break
+            bb.flags |= mine
+            if safe & bb.mines:         # 잘못 꽂힌 깃발 (solver 반올림) 때문
+                for g in list(live):
+                    if bb.segment(safe & bb.mines, g):
+                        results[g]["false_safe"] += 1
+                        live.discard(g)
+                        active &= ~bb.region(g)
+                safe &= active
+            bb.flood(safe)
+
+        # ── 막힌 게임만 하나씩: 전체 solver 로 한 수 ──
+        for g in sorted(live):
+            if bb.segment(bb.open, g).bit_count() >= goal:
+                results[g]["won"] = True
+                live.discard(g)
+                continue
+            if not _solver_move(bb, g, boards[g], rows, cols, mines,
+                                guesses[g], results[g]):
+                live.discard(g)
+
+    per_game = (time.perf_counter() - t_start) / max(1, k)
+    for res in results:
+        res["time_s"] = per_game
+    return results
+
+
+def _solver_move(bb, g, board, rows, cols, mines, guess, result):
+    """게임 g 에 play_game 방식으로 한 수. 계속 둘 수 있으면 True"""
+    cs    = bb.cell_state(g)
+    flags = bb.segment(bb.flags, g).bit_count()
+    t0    = time.perf_counter()
+    probs = calc_probabilities(board, cs, rows, cols, mines, flags)
+    result["latencies"].append(time.perf_counter() - t0)
+    result["solver_calls"] += 1
+
+    closed = {k: p for k, p in probs.items() if cs[k[0]][k[1]] == STATE_CLOSED}
+    safe = [k for k, p in closed.items() if round(p * 100) == 0]
+    mine = [k for k, p in closed.items() if round(p * 100) == 100]
+    for r, c in mine:
+        bb.flags |= bb.cell_bit(g, r, c)
+    if safe:
+        seeds = 0
+        for r, c in safe:
+            if board[r][c] == -1:
+                result["false_safe"] += 1
+                return False
+            seeds |= bb.cell_bit(g, r, c)
+        bb.flood(seeds)
+        return True
+    if mine:
+        return True
+
+    t0   = time.perf_counter()
+    cell = guess(board, cs, rows, cols, mines, flags, probs)
+    result["guess_time_s"] += time.perf_counter() - t0
+    if cell is None:
+        return False
+    result["guesses"] += 1
+    r, c = cell
+    if board[r][c] == -1:
+        return False
+    bb.flood(bb.cell_bit(g, r, c))
+    return True
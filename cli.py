@@ -0,0 +1,307 @@
+"""
+명령줄 모드 (창 없이 실행)
+==========================
+python minesweeper.py bench --difficulty 고급 --games 200 --workers 4 --format json
+python minesweeper.py arena -d 중급 --games 500 -j 4 --strategies min corner info
+python minesweeper.py play --profile      # 게임 창 + UI 지연 프로파일러
+python minesweeper.py startup --runs 5    # 시작 시간 (첫 프레임 / 입력 가능) 측정
+python minesweeper.py serve --port 8765 -j 4          # 로컬 solver 서비스 (HTTP)
+python minesweeper.py serve-bench --positions 2000    # 서비스 처리량 측정
+python minesweeper.py env-bench --envs 32             # 학습 환경 step 처리량
+python minesweeper.py world-bench --moves 2000        # 무한 월드 자동 탐험 (메모리 · 수당 시간)
+
+인자 없이 실행하면 minesweeper.main() 이 평소처럼 게임 창을 띄운다.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from mineboard import DIFFICULTIES
+
+# 영문 별칭 (스크립트에서 쓰기 편하도록)
+DIFF_ALIASES = {"beginner": "초급", "intermediate": "중급", "expert": "고급"}
+
+STARTUP_BUDGET_MS = 500   # 입력 가능까지 허용 시간 (startup 명령 기본값)
+
+
+def _board_size(args):
+    """--difficulty 또는 --rows/--cols/--mines → (rows, cols, mines)"""
+    if args.rows or args.cols or args.mines:
+        if not (args.rows and args.cols and args.mines):
+            raise SystemExit("사용자 정의 크기는 --rows, --cols, --mines 를 모두 지정하세요.")
+        if args.mines > args.rows * args.cols - 9:
+            raise SystemExit("지뢰 수가 너무 많습니다 (최대 rows*cols-9).")
+        return args.rows, args.cols, args.mines
+    diff = DIFF_ALIASES.get(args.difficulty, args.difficulty)
+    if diff not in DIFFICULTIES:
+        raise SystemExit(f"알 수 없는 난이도: {args.difficulty}")
+    return DIFFICULTIES[diff]
+
+
+def _add_size_args(p):
+    p.add_argument("--difficulty", "-d", default="고급",
+                   help="초급/중급/고급 (beginner/intermediate/expert)")
+    p.add_argument("--rows",  type=int, help="사용자 정의 행 수")
+    p.add_argument("--cols",  type=int, help="사용자 정의 열 수")
+    p.add_argument("--mines", type=int, help="사용자 정의 지뢰 수")
+
+
+def _cmd_bench(args):
+    from simulate import run_benchmark, format_report
+    rows, cols, mines = _board_size(args)
+    history = None
+    if args.history and args.batch:
+        raise SystemExit("--batch 결과는 --history 에 기록할 수 없습니다.")
+    if args.batch and args.solver != "exact":
+        raise SystemExit("--batch 는 exact solver 만 씁니다 (--solver 와 같이 쓸 수 없음).")
+    if args.history:
+        from history import HistoryStore
+        history = HistoryStore(args.history)
+    rep = run_benchmark(rows, cols, mines, args.games, solver=args.solver,
+                        strategy=args.strategy, workers=args.workers, seed=args.seed,
+                        history=history, batch=args.batch, forced_guesses=args.metrics)
+    if history is not None:
+        history.close()
+    if args.format == "json":
+        print(json.dumps(rep, ensure_ascii=False))
+    else:
+        print(format_report(rep))
+    return 0
+
+
+def _cmd_arena(args):
+    from simulate import run_arena, format_arena
+    rows, cols, mines = _board_size(args)
+    rep = run_arena(rows, cols, mines, args.games, strategies=args.strategies,
+                    solver=args.solver, workers=args.workers, seed=args.seed)
+    if args.format == "json":
+        print(json.dumps(rep, ensure_ascii=False))
+    else:
+        print(format_arena(rep))
+    return 0
+
+
+def _cmd_play(args):
+    from minesweeper import run_gui
+    run_gui(profile=args.profile, startup_probe=args.startup_probe)
+    return 0
+
+
+def _cmd_startup(args):
+    """
+    새 프로세스로 게임 창을 runs 번 띄워 프로세스 시작부터
+    첫 프레임(time-to-first-frame)·입력 가능(time-to-interactive)까지 시간 측정.
+    중앙값이 예산을 넘으면 종료 코드 1.
+    """
+    from simulate import percentile
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "minesweeper.py")
+    ttff, tti = [], []
+    for _ in range(args.runs):
+        t0  = time.time()
+        out = subprocess.run([sys.executable, script, "play", "--startup-probe"],
+                             capture_output=True, text=True, timeout=60)
+        if out.returncode != 0:
+            print(out.stderr.strip(), file=sys.stderr)
+            return out.returncode
+        rec = json.loads(out.stdout.strip().splitlines()[-1])
+        ttff.append((rec["first_frame"] - t0) * 1e3)
+        tti.append((rec["interactive"] - t0) * 1e3)
+    ttff.sort()
+    tti.sort()
+    rep = {
+        "runs": args.runs, "budget_ms": args.budget,
+        "first_frame_ms": {"p50": round(percentile(ttff, 50), 1), "max": round(ttff[-1], 1)},
+        "interactive_ms": {"p50": round(percentile(tti, 50), 1), "max": round(tti[-1], 1)},
+    }
+    ok = rep["interactive_ms"]["p50"] <= args.budget
+    if args.format == "json":
+        print(json.dumps(rep, ensure_ascii=False))
+    else:
+        print(f"[시작 시간] {args.runs}회, 예산 {args.budget}ms")
+        print(f"  첫 프레임  : p50 {rep['first_frame_ms']['p50']}ms · max {rep['first_frame_ms']['max']}ms")
+        print(f"  입력 가능  : p50 {rep['interactive_ms']['p50']}ms · max {rep['interactive_ms']['max']}ms")
+        print(f"  판정       : {'✅ 예산 이내' if ok else '❌ 예산 초과'}")
+    return 0 if ok else 1
+
+
+def _cmd_serve(args):
+    from service import make_server
+    server = make_server(args.host, args.port, args.workers)
+    host, port = server.server_address[:2]
+    print(f"[solver 서비스] http://{host}:{port}  (작업자 {server.service.workers}, "
+          f"POST /solve · GET /health, Ctrl+C 로 종료)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
+    return 0
+
+
+def _cmd_serve_bench(args):
+    """
+    국면을 --batch 개씩 보내 처리량 측정. 같은 국면을 두 번 보내
+    cold (처음 계산) / warm (서버 결과 캐시) 를 따로 보고한다.
+    --url 이 없으면 이 프로세스 안에 서버를 띄운다.
+    """
+    import threading
+    from service import SolverClient, make_server, run_client_bench, sample_positions
+    rows, cols, mines = _board_size(args)
+    server = None
+    url = args.url
+    if url is None:
+        server = make_server("127.0.0.1", 0, args.workers)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = "http://127.0.0.1:%d" % server.server_address[1]
+    client = SolverClient(url)
+    positions = sample_positions(rows, cols, mines, args.positions, args.seed)
+    try:
+        rep = {"rows": rows, "cols": cols, "mines": mines, "url": url,
+               "cold": run_client_bench(client, positions, args.batch),
+               "warm": run_client_bench(client, positions, args.batch),
+               "server": client.health()}
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            server.service.close()
+    if args.format == "json":
+        print(json.dumps(rep, ensure_ascii=False))
+    else:
+        print(f"[solver 서비스 벤치마크] {rows}×{cols} 지뢰 {mines} · 국면 {args.positions}개 · "
+              f"요청당 {args.batch}개 · {url}")
+        for name in ("cold", "warm"):
+            b = rep[name]
+            print(f"  {name:<5}: {b['positions_per_s']:>9} 국면/s · 요청 p50 "
+                  f"{b['request_ms']['p50']}ms · p95 {b['request_ms']['p95']}ms · "
+                  f"전체 {b['time_s']}s")
+        print(f"  서버 : 작업자 {rep['server']['workers']} · 캐시 {rep['server']['cache_size']}개 · "
+              f"적중 {rep['server']['cache_hits']}회")
+    return 0
+
+
+def _cmd_env_bench(args):
+    from env import run_env_bench
+    rows, cols, mines = _board_size(args)
+    rep = run_env_bench(rows, cols, mines, args.steps, n_envs=args.envs, seed=args.seed)
+    if args.format == "json":
+        print(json.dumps(rep, ensure_ascii=False))
+    else:
+        print(f"[환경 벤치마크] {rows}×{cols} 지뢰 {mines} · 판 {args.envs}개 동시 · 무작위 열기")
+        print(f"  {rep['steps_per_s']} step/s · step {rep['steps']} · 끝난 판 {rep['episodes']} · "
+              f"{rep['time_s']}s")
+    return 0
+
+
+def _cmd_world_bench(args):
+    from world import run_world_bench
+    rep = run_world_bench(args.moves, seed=args.seed, density=args.density,
+                          max_resident=args.resident, path=args.db or ":memory:")
+    if args.format == "json":
+        print(json.dumps(rep, ensure_ascii=False))
+    else:
+        a, b = rep["move_ms_first_half"], rep["move_ms_second_half"]
+        print(f"[무한 월드] {rep['moves']}수 · 열린 셀 {rep['opened']} · 지뢰 {rep['mine_hits']}회 · "
+              f"동쪽 {rep['reached_col']}열까지")
+        print(f"  청크 : 상주 최대 {rep['peak_resident_chunks']} · 저장 {rep['stored_chunks']} · "
+              f"내보냄 {rep['evicted']} · 다시 읽음 {rep['loaded']}")
+        print(f"  한 수: 앞 절반 p50 {a['p50']}ms · p95 {a['p95']}ms | "
+              f"뒤 절반 p50 {b['p50']}ms · p95 {b['p95']}ms")
+    return 0
+
+
+def build_parser():
+    from simulate import SOLVERS, STRATEGIES
+    parser = argparse.ArgumentParser(prog="minesweeper.py",
+                                     description="지뢰찾기 명령줄 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    bench = sub.add_parser("bench", help="N판 시뮬레이션 벤치마크")
+    _add_size_args(bench)
+    bench.add_argument("--games",    "-n", type=int, default=100)
+    bench.add_argument("--solver",   choices=sorted(SOLVERS), default="exact")
+    bench.add_argument("--strategy", choices=sorted(STRATEGIES), default="min")
+    bench.add_argument("--workers",  "-j", type=int, default=1)
+    bench.add_argument("--seed",     type=int, default=0)
+    bench.add_argument("--format",   choices=("text", "json"), default="text")
+    bench.add_argument("--history",  metavar="PATH",
+                       help="각 판을 게임 기록 DB(SQLite)에 추가")
+    bench.add_argument("--batch",    type=int, default=0, metavar="K",
+                       help="K 판씩 비트보드로 lock-step 진행 (batchsim, exact solver 고정)")
+    bench.add_argument("--metrics",  action="store_true",
+                       help="판마다 강제 추측 횟수를 세어 구간별 클리어율 출력 (느림)")
+    bench.set_defaults(func=_cmd_bench)
+
+    arena = sub.add_parser("arena", help="⭐ 전략 비교 (같은 보드, 클리어율 신뢰구간)")
+    _add_size_args(arena)
+    arena.add_argument("--strategies", "-s", nargs="+", choices=sorted(STRATEGIES),
+                       help="비교할 전략 (기본: 전부)")
+    arena.add_argument("--games",   "-n", type=int, default=200, help="전략당 게임 수")
+    arena.add_argument("--solver",  choices=sorted(SOLVERS), default="exact")
+    arena.add_argument("--workers", "-j", type=int, default=1)
+    arena.add_argument("--seed",    type=int, default=0)
+    arena.add_argument("--format",  choices=("text", "json"), default="text")
+    arena.set_defaults(func=_cmd_arena)
+
+    play = sub.add_parser("play", help="게임 창 실행")
+    play.add_argument("--profile", action="store_true",
+                      help="핸들러 지연 측정 (F9 또는 종료 시 p50/p95/p99 출력)")
+    play.add_argument("--startup-probe", action="store_true", help=argparse.SUPPRESS)
+    play.set_defaults(func=_cmd_play)
+
+    startup = sub.add_parser("startup", help="시작 시간 벤치마크 (첫 프레임 / 입력 가능)")
+    startup.add_argument("--runs",   "-n", type=int, default=5)
+    startup.add_argument("--budget", type=float, default=STARTUP_BUDGET_MS,
+                         help="입력 가능까지 허용 시간 (ms, 중앙값 기준)")
+    startup.add_argument("--format", choices=("text", "json"), default="text")
+    startup.set_defaults(func=_cmd_startup)
+
+    serve = sub.add_parser("serve", help="로컬 solver 서비스 (HTTP, 국면 묶음 요청)")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--workers", "-j", type=int, default=1, help="solver 작업자 프로세스 수")
+    serve.set_defaults(func=_cmd_serve)
+
+    sbench = sub.add_parser("serve-bench", help="solver 서비스 처리량 벤치마크")
+    _add_size_args(sbench)
+    sbench.add_argument("--url", help="서버 주소 (없으면 이 프로세스 안에 서버를 띄움)")
+    sbench.add_argument("--positions", "-n", type=int, default=500)
+    sbench.add_argument("--batch",   type=int, default=50, help="요청당 국면 수")
+    sbench.add_argument("--workers", "-j", type=int, default=1,
+                        help="직접 띄우는 서버의 작업자 수")
+    sbench.add_argument("--seed",    type=int, default=0)
+    sbench.add_argument("--format",  choices=("text", "json"), default="text")
+    sbench.set_defaults(func=_cmd_serve_bench)
+
+    ebench = sub.add_parser("env-bench", help="학습 환경 (env.py) step 처리량")
+    _add_size_args(ebench)
+    ebench.add_argument("--steps",  "-n", type=int, default=20_000, help="전체 판-step 수")
+    ebench.add_argument("--envs",   type=int, default=1, help="VectorEnv 판 수")
+    ebench.add_argument("--seed",   type=int, default=0)
+    ebench.add_argument("--format", choices=("text", "json"), default="text")
+    ebench.set_defaults(func=_cmd_env_bench)
+
+    wbench = sub.add_parser("world-bench", help="무한 월드 자동 탐험 벤치마크")
+    wbench.add_argument("--moves",    "-n", type=int, default=1000)
+    wbench.add_argument("--seed",     type=int, default=0)
+    wbench.add_argument("--density",  type=float, default=0.18, help="셀당 지뢰 확률")
+    wbench.add_argument("--resident", type=int, default=256, help="메모리에 둘 최대 청크 수")
+    wbench.add_argument("--db",       metavar="PATH", help="청크 내보내기 SQLite 파일 (기본: 메모리)")
+    wbench.add_argument("--format",   choices=("text", "json"), default="text")
+    wbench.set_defaults(func=_cmd_world_bench)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+국소 패턴 추론 (확정 셀 빠른 탐색)
+===================================
+클릭 뒤 대부분의 확정 셀은 숫자 하나, 또는 겹치는 숫자 두 개만 보면 나온다
+(부분집합 규칙, 1-2-1 / 1-2-2-1 패턴). 전체 solver (수집 → Gauss → Union-Find
+→ 열거 → Convolution) 를 돌리기 전에 이 단계에서 먼저 찾는다.
+
+- 증분 처리: 직전 호출 이후 상태가 바뀐 셀 주변의 숫자 셀만 다시 검사
+  (cell_state 사본과 행 단위로 비교해 바뀐 셀을 찾으므로 호출 측 훅이 필요 없음).
+  찾은 셀은 근거 숫자 셀과 함께 남겨 두고, 근거 주변이 바뀌면 (깃발 해제 등) 버린다
+- 규칙
+    · 단일 제약: 남은 지뢰 0 → 전부 안전, 남은 지뢰 = 닫힌 셀 수 → 전부 지뢰
+    · 두 제약 A, B: 교집합 지뢰 수 x 의 범위로 A\\B, B\\A, A∩B 각각의
+      지뢰 수 범위를 구해 0 이면 안전, 크기와 같으면 지뢰
+- 바로 둘 수 있는 확정 셀 (STATE_CLOSED) 만 돌려주며, 못 찾으면 빈 결과
+  → 호출 측이 전체 solver 사용
+"""
+
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG, neighbors
+
+
+class LocalDeducer:
+    """게임마다 하나. 새 게임이면 reset()."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._snap    = None     # 마지막으로 본 cell_state 사본
+        self._dirty   = set()    # 다시 검사할 셀
+        self._pending = ({}, {})  # 찾았지만 아직 적용되지 않은 (안전, 지뢰): 셀 → 근거 집합들
+
+    def _sync(self, cs, rows, cols):
+        """사본과 비교해 바뀐 셀과 그 이웃을 dirty 로 표시"""
+        if self._snap is None or len(self._snap) != rows or len(self._snap[0]) != cols:
+            self.reset()
+            self._snap = [[STATE_CLOSED] * cols for _ in range(rows)]
+        dirty = self._dirty
+        for r, (srow, crow) in enumerate(zip(self._snap, cs)):
+            if srow == crow:
+                continue
+            for c, (a, b) in enumerate(zip(srow, crow)):
+                if a != b:
+                    dirty.add((r, c))
+                    dirty.update(neighbors(r, c, rows, cols))
+            self._snap[r] = crow[:]
+
+    def notify(self, cells, cs, rows, cols):
+        """
+        호출 측이 바뀐 셀을 알고 있으면 (일괄 열기) 사본과 dirty 를 바로 갱신 →
+        다음 _sync 의 행 비교가 그 행들을 건너뛴다
+        """
+        if self._snap is None or len(self._snap) != rows or len(self._snap[0]) != cols:
+            return
+        for r, c in cells:
+            self._snap[r][c] = cs[r][c]
+            self._dirty.add((r, c))
+            self._dirty.update(neighbors(r, c, rows, cols))
+
+    @staticmethod
+    def _constraint(board, cs, rows, cols, r, c):
+        """열린 숫자 셀 → (남은 지뢰 수, 닫힌 이웃 frozenset), 없거나 모순이면 None"""
+        if cs[r][c] != STATE_OPEN or board[r][c] <= 0:
+            return None
+        rem, closed = board[r][c], []
+        c0, c1 = max(0, c - 1), min(cols, c + 2)
+        for nr in range(max(0, r - 1), min(rows, r + 2)):
+            srow = cs[nr]
+            for nc in range(c0, c1):
+                st = srow[nc]
+                if st == STATE_FLAG:
+                    rem -= 1
+                elif st != STATE_OPEN:
+                    closed.append((nr, nc))
+        if not closed or not 0 <= rem <= len(closed):
+            return None
+        return rem, frozenset(closed)
+
+    def deduce(self, board, cs, rows, cols):
+        """
+        확정 (안전 셀 집합, 지뢰 셀 집합), 둘 다 STATE_CLOSED 셀만.
+        물음표 셀은 제약에서는 닫힌 셀로 취급하지만 (전체 solver 와 달리 빼지 않음)
+        결과로는 돌려주지 않는다.
+        """
+        self._sync(cs, rows, cols)
+        dirty = self._dirty
+        safe, mine = (self._still_valid(found, cs, dirty) for found in self._pending)
+
+        cache = {}
+        def cst(cell):
+            if cell not in cache:
+                cache[cell] = self._constraint(board, cs, rows, cols, *cell)
+            return cache[cell]
+
+        for cell in dirty:
+            a = cst(cell)
+            if a is None:
+                continue
+            ra, sa = a
+            if ra == 0:
+                self._mark(safe, sa, (cell,))
+            elif ra == len(sa):
+                self._mark(mine, sa, (cell,))
+            # 단일 규칙으로 끝난 제약도 dirty 가 아닌 이웃 제약과의 쌍은 여기서만 검사된다
+            r, c = cell
+            for nr in range(max(0, r - 2), min(rows, r + 3)):
+                for nc in range(max(0, c - 2), min(cols, c + 3)):
+                    other = (nr, nc)
+                    if other == cell or (other in dirty and other < cell):
+                        continue        # 둘 다 dirty 인 쌍은 한 번만
+                    b = cst(other)
+                    if b is not None:
+                        self._pair(ra, sa, *b, (cell, other), safe, mine)
+        dirty.clear()
+
+        self._pending = (self._still_valid(safe, cs, dirty),
+                         self._still_valid(mine, cs, dirty))
+        safe, mine = set(self._pending[0]), set(self._pending[1])
+        return safe, mine - safe     # 모순 (잘못 꽂은 깃발 등) 이면 지뢰 쪽을 버림
+
+    @staticmethod
+    def _still_valid(found, cs, dirty):
+        """
+        셀 → 근거 집합들 중 아직 닫힌 셀이고, 근거 숫자 셀 주변이 바뀌지 않은
+        (dirty 가 아닌) 근거가 남은 것만
+        """
+        out = {}
+        for (r, c), srcs in found.items():
+            if cs[r][c] != STATE_CLOSED:
+                continue
+            srcs = {s for s in srcs if dirty.isdisjoint(s)}
+            if srcs:
+                out[r, c] = srcs
+        return out
+
+    @staticmethod
+    def _mark(found, cells, src):
+        """cells 를 근거 src (숫자 셀 튜플) 와 함께 found 에 추가"""
+        src = frozenset(src)
+        for p in cells:
+            found.setdefault(p, set()).add(src)
+
+    @classmethod
+    def _pair(cls, ra, sa, rb, sb, src, safe, mine):
+        """두 제약의 겹침으로 확정되는 셀을 safe / mine 에 추가"""
+        both = sa & sb
+        if not both:
+            return
+        only_a, only_b = sa - both, sb - both
+        x_lo = max(0, ra - len(only_a), rb - len(only_b))
+        x_hi = min(ra, rb, len(both))
+        if x_lo > x_hi:
+            return
+        for part, rem in ((only_a, ra), (only_b, rb)):
+            if not part:
+                continue
+            if rem - x_lo == 0:
+                cls._mark(safe, part, src)
+            elif rem - x_hi == len(part):
+                cls._mark(mine, part, src)
+        if x_hi == 0:
+            cls._mark(safe, both, src)
+        elif x_lo == len(both):
+            cls._mark(mine, both, src)
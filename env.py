@@ -0,0 +1,237 @@
+"""
+강화학습 / 자동 플레이어용 환경 (gym 스타일, tkinter 없음)
+===========================================================
+env = MinesweeperEnv(16, 30, 99)
+obs, info = env.reset(seed=0)
+obs, reward, terminated, truncated, info = env.step(env.action(ACTION_OPEN, 8, 15))
+
+- 행동: 정수 하나 = kind·rows·cols + r·cols + c (action / decode_action)
+    · ACTION_OPEN  : 닫힌 셀 열기 (첫 열기에서 지뢰 배치, 주변 3×3 안전 — 게임 창과 같은
+                     generate_board(…, 첫 클릭) 규칙, 같은 seed → 같은 보드)
+    · ACTION_FLAG  : 닫힘 ↔ 깃발 토글 (물음표 단계 없음)
+    · ACTION_CHORD : 열린 숫자 셀에서 깃발 수 == 숫자면 닫힌 이웃 모두 열기
+                     (게임 창 _try_chord 와 같음: 지뢰가 있으면 나머지를 연 뒤 패배)
+- 관찰: (numbers, states) — 둘 다 rows·cols 바이트 (행 우선)
+    · numbers : 열린 셀의 숫자, 나머지 0
+    · states  : STATE_CLOSED / STATE_OPEN / STATE_FLAG
+  바뀐 셀만 내부 bytearray 에 고치고 step 마다 bytes 로 복사해 돌려준다.
+- 보상: 새로 열린 셀 수 / 안전 셀 수, 클리어 REWARD_WIN, 지뢰 REWARD_LOSE,
+  아무 변화 없는 행동 REWARD_INVALID (info["invalid"])
+- VectorEnv: n 판을 한 번에 step. 끝난 판은 다음 seed 로 자동 reset 하고
+  info["final"] 에 끝난 판의 결과를 남긴다 (관찰은 새 판).
+"""
+
+from gamestate import GameState
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG, generate_board, neighbors
+
+ACTION_OPEN, ACTION_FLAG, ACTION_CHORD = 0, 1, 2
+N_ACTION_KINDS = 3
+
+REWARD_WIN     = 1.0
+REWARD_LOSE    = -1.0
+REWARD_INVALID = -0.01
+
+
+class MinesweeperEnv:
+    """보드 한 판. reset(seed) 전에는 step 할 수 없다."""
+
+    def __init__(self, rows: int, cols: int, mines: int, max_steps: int = None):
+        if mines > rows * cols - 9:
+            raise ValueError("지뢰 수가 너무 많습니다 (최대 rows*cols-9)")
+        self.rows, self.cols, self.mines = rows, cols, mines
+        self.n_cells   = rows * cols
+        self.n_actions = N_ACTION_KINDS * self.n_cells
+        self.max_steps = max_steps if max_steps is not None else 4 * self.n_cells
+        self.state = None
+
+    # ──────────────────────────────────────────
+    #  행동 인코딩
+    # ──────────────────────────────────────────
+    def action(self, kind: int, r: int, c: int) -> int:
+        return kind * self.n_cells + r * self.cols + c
+
+    def decode_action(self, action: int):
+        """정수 행동 → (kind, r, c). 범위 밖이면 ValueError"""
+        if not 0 <= action < self.n_actions:
+            raise ValueError(f"행동 범위 밖: {action}")
+        kind, idx = divmod(action, self.n_cells)
+        return kind, idx // self.cols, idx % self.cols
+
+    # ──────────────────────────────────────────
+    #  reset / step
+    # ──────────────────────────────────────────
+    def reset(self, seed=None):
+        import random
+        self.seed  = seed
+        # 게임 창처럼 32비트 보드 seed 로 생성 (첫 열기 위치와 함께 보드를 결정)
+        self.board_seed = random.Random(seed).getrandbits(32)
+        self.board = None                 # 첫 열기에서 배치
+        self.state = GameState([[0] * self.cols for _ in range(self.rows)],
+                               self.rows, self.cols, self.mines)
+        self.steps = 0
+        self.done  = False
+        self._numbers = bytearray(self.n_cells)
+        self._states  = bytearray(self.n_cells)       # STATE_CLOSED == 0
+        return self.observation(), {"seed": seed, "board_seed": self.board_seed}
+
+    def observation(self):
+        return bytes(self._numbers), bytes(self._states)
+
+    def step(self, action: int):
+        reward, terminated, truncated, info = self._step(action)
+        return self.observation(), reward, terminated, truncated, info
+
+    def _step(self, action: int):
+        """step 에서 관찰 복사만 뺀 것 (VectorEnv 는 n 판 관찰을 한 번에 만든다)"""
+        if self.state is None or self.done:
+            raise RuntimeError("reset() 후, 판이 끝나기 전에만 step 할 수 있습니다")
+        kind, r, c = self.decode_action(action)
+        self.steps += 1
+        st = self.state
+        opened, hit, changed = [], None, []
+
+        if kind == ACTION_OPEN:
+            if st.cell_state[r][c] == STATE_CLOSED:
+                if self.board is None:
+                    self._place_mines(r, c)
+                opened, hit = st.open_many([(r, c)])
+        elif kind == ACTION_FLAG:
+            cur = st.cell_state[r][c]
+            if cur in (STATE_CLOSED, STATE_FLAG):
+                st.set(r, c, STATE_FLAG if cur == STATE_CLOSED else STATE_CLOSED)
+                changed.append((r, c))
+        elif self._chord_ready(r, c):
+            opened, hit = st.open_many(neighbors(r, c, self.rows, self.cols))
+
+        cols, numbers, states, board = self.cols, self._numbers, self._states, self.board
+        for cr, cc in opened:
+            i = cr * cols + cc
+            numbers[i], states[i] = board[cr][cc], STATE_OPEN
+        for cr, cc in changed:
+            states[cr * cols + cc] = st.cell_state[cr][cc]
+
+        safe_total = self.n_cells - self.mines
+        reward = len(opened) / safe_total
+        won    = hit is None and st.open_count >= safe_total
+        info   = {"opened": len(opened), "invalid": not (opened or changed or hit)}
+        if hit is not None:
+            reward, info["hit"] = REWARD_LOSE, hit
+        elif won:
+            reward += REWARD_WIN
+        elif info["invalid"]:
+            reward = REWARD_INVALID
+        terminated = hit is not None or won
+        truncated  = not terminated and self.steps >= self.max_steps
+        self.done  = terminated or truncated
+        info["won"] = won
+        return reward, terminated, truncated, info
+
+    def _place_mines(self, r: int, c: int):
+        """첫 열기: (r, c) 주변 3×3 을 비우고 배치 (게임 창 _place_mines 와 같은 생성기)"""
+        import random
+        self.board, _ = generate_board(self.rows, self.cols, self.mines, r, c,
+                                       random.Random(self.board_seed))
+        self.state.board = self.board
+
+    def _chord_ready(self, r: int, c: int) -> bool:
+        st = self.state
+        return (st.cell_state[r][c] == STATE_OPEN and self.board[r][c] > 0
+                and st.flag_adj[r][c] == self.board[r][c])
+
+    # ──────────────────────────────────────────
+    #  보조
+    # ──────────────────────────────────────────
+    def valid_actions(self):
+        """변화를 일으키는 행동 목록 (무작위 / 마스크 정책용)"""
+        st, out = self.state, []
+        for r in range(self.rows):
+            for c in range(self.cols):
+                s = st.cell_state[r][c]
+                if s == STATE_CLOSED:
+                    out.append(self.action(ACTION_OPEN, r, c))
+                    out.append(self.action(ACTION_FLAG, r, c))
+                elif s == STATE_FLAG:
+                    out.append(self.action(ACTION_FLAG, r, c))
+                elif (self.board is not None and self._chord_ready(r, c)
+                      and st.hidden_adj[r][c] > st.flag_adj[r][c]):
+                    out.append(self.action(ACTION_CHORD, r, c))
+        return out
+
+
+class VectorEnv:
+    """같은 크기 n 판을 한 번에 step. 관찰은 n 판을 이어 붙인 (numbers, states) 바이트."""
+
+    def __init__(self, n: int, rows: int, cols: int, mines: int, max_steps: int = None):
+        self.envs = [MinesweeperEnv(rows, cols, mines, max_steps) for _ in range(n)]
+        self.n = n
+        self._next_seed = 0
+
+    def reset(self, seed: int = 0):
+        """판 i 는 seed + i, 자동 reset 은 그 뒤 seed 를 차례로 쓴다"""
+        for i, env in enumerate(self.envs):
+            env.reset(seed + i)
+        self._next_seed = seed + self.n
+        return self.observation(), {}
+
+    def observation(self):
+        return (b"".join(env._numbers for env in self.envs),
+                b"".join(env._states for env in self.envs))
+
+    def step(self, actions):
+        """actions[i] → 판 i. → (관찰, 보상 목록, terminated 목록, truncated 목록, info 목록)"""
+        rewards, terms, truncs, infos = [], [], [], []
+        for env, a in zip(self.envs, actions):
+            rew, term, trunc, info = env._step(a)
+            if term or trunc:
+                info = {"final": dict(info, seed=env.seed)}
+                env.reset(self._next_seed)
+                self._next_seed += 1
+            rewards.append(rew)
+            terms.append(term)
+            truncs.append(trunc)
+            infos.append(info)
+        return self.observation(), rewards, terms, truncs, infos
+
+
+# ─────────────────────────────────────────────
+#  처리량 벤치마크
+# ─────────────────────────────────────────────
+def run_env_bench(rows: int, cols: int, mines: int, steps: int,
+                  n_envs: int = 1, seed: int = 0) -> dict:
+    """
+    무작위 정책 (닫힌 셀 무작위 열기) 으로 steps 번 step → steps/s, 끝난 판 수.
+    n_envs > 1 이면 VectorEnv 로 n_envs 판씩 (steps 는 전체 판-step 수)
+    """
+    import random
+    import time
+    rng = random.Random(seed)
+    venv = VectorEnv(n_envs, rows, cols, mines)
+    venv.reset(seed)
+    closed = [[i for i in range(rows * cols)] for _ in range(n_envs)]
+    episodes = wins = done_steps = 0
+    t0 = time.perf_counter()
+    while done_steps < steps:
+        actions = []
+        for i, env in enumerate(venv.envs):
+            states = env._states
+            cand = closed[i]
+            # 이미 열린 셀은 뽑힐 때 지운다 (전체 목록을 매번 만들지 않음)
+            while True:
+                j = rng.randrange(len(cand))
+                if states[cand[j]] == STATE_CLOSED:
+                    break
+                cand[j] = cand[-1]
+                cand.pop()
+            actions.append(cand[j])          # ACTION_OPEN == 0 → 행동 = 셀 번호
+        _, _, terms, truncs, infos = venv.step(actions)
+        done_steps += n_envs
+        for i, (term, trunc, info) in enumerate(zip(terms, truncs, infos)):
+            if term or trunc:
+                episodes += 1
+                wins += info["final"]["won"]
+                closed[i] = list(range(rows * cols))
+    elapsed = time.perf_counter() - t0
+    return {"rows": rows, "cols": cols, "mines": mines, "envs": n_envs,
+            "steps": done_steps, "episodes": episodes, "wins": wins,
+            "time_s": round(elapsed, 3),
+            "steps_per_s": round(done_steps / elapsed, 1) if elapsed else None}
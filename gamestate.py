@@ -0,0 +1,107 @@
+"""
+되돌릴 수 있는 게임 상태
+========================
+cell_state, 카운터 (open_count, flags_count), solver 용 증분 색인
+(셀마다 깃발 이웃 수 / 열리지 않은 이웃 수) 을 한 객체에 두고, 모든 변경을
+저널에 (r, c, 이전 상태) 로 남긴다.
+
+- snapshot() → 저널 위치 (O(1))
+- rollback(mark) → 그 뒤 변경만 거꾸로 되돌림 (O(변경 수)), 바뀐 셀 목록 반환
+- 보드 사본을 만들지 않으므로 가상 수를 수천 번 두고 되돌려도 싸다
+  (lookahead · 노게스 검증용), 게임 창의 되돌리기 (Ctrl+Z) 도 같은 저널을 쓴다
+- board 는 읽기만 한다. 첫 클릭 뒤 지뢰를 배치하면 board 속성을 바꿔 끼운다.
+"""
+
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG, STATE_QUESTION, open_many
+
+# 우클릭 표시 순환: 닫힘 → 깃발 → 물음표 → 닫힘
+_MARK_CYCLE = {STATE_CLOSED: STATE_FLAG, STATE_FLAG: STATE_QUESTION,
+               STATE_QUESTION: STATE_CLOSED}
+
+
+class GameState:
+    """보드 한 판의 가변 상태 + 변경 저널"""
+
+    def __init__(self, board, rows: int, cols: int, mines: int):
+        self.board = board
+        self.rows, self.cols, self.mines = rows, cols, mines
+        self.cell_state  = [[STATE_CLOSED] * cols for _ in range(rows)]
+        self.open_count  = 0
+        self.flags_count = 0
+        # 증분 색인: 이웃 중 깃발 수 / 열리지 않은 (닫힘·깃발·물음표) 수
+        # (처음엔 모두 닫혀 있으니 이웃 수 = 행 방향 칸 수 × 열 방향 칸 수 − 1)
+        span_r = [min(rows, r + 2) - max(0, r - 1) for r in range(rows)]
+        span_c = [min(cols, c + 2) - max(0, c - 1) for c in range(cols)]
+        self.flag_adj   = [[0] * cols for _ in range(rows)]
+        self.hidden_adj = [[a * b - 1 for b in span_c] for a in span_r]
+        self._journal = []
+
+    # ──────────────────────────────────────────
+    #  변경
+    # ──────────────────────────────────────────
+    def _apply(self, r: int, c: int, new: int):
+        """상태 변경 + 카운터 · 색인 갱신 (저널은 건드리지 않음)"""
+        old = self.cell_state[r][c]
+        self.cell_state[r][c] = new
+        d_open = (new == STATE_OPEN) - (old == STATE_OPEN)
+        d_flag = (new == STATE_FLAG) - (old == STATE_FLAG)
+        self.open_count  += d_open
+        self.flags_count += d_flag
+        if d_open or d_flag:
+            # 3×3 전체를 고친 뒤 자기 자신만 되돌림 (neighbors 목록을 만들지 않음)
+            c0, c1 = max(0, c - 1), min(self.cols, c + 2)
+            for nr in range(max(0, r - 1), min(self.rows, r + 2)):
+                hrow, frow = self.hidden_adj[nr], self.flag_adj[nr]
+                for nc in range(c0, c1):
+                    hrow[nc] -= d_open
+                    frow[nc] += d_flag
+            self.hidden_adj[r][c] += d_open
+            self.flag_adj[r][c]   -= d_flag
+
+    def set(self, r: int, c: int, new: int):
+        old = self.cell_state[r][c]
+        if old != new:
+            self._journal.append((r, c, old))
+            self._apply(r, c, new)
+
+    def cycle_mark(self, r: int, c: int):
+        """우클릭: 닫힘 → 깃발 → 물음표 → 닫힘. 열린 셀이면 None, 아니면 새 상태"""
+        new = _MARK_CYCLE.get(self.cell_state[r][c])
+        if new is not None:
+            self.set(r, c, new)
+        return new
+
+    def open_many(self, cells):
+        """
+        mineboard.open_many 와 같음 (지뢰 대상은 열지 않고 hit 로 보고)
+        → (새로 열린 셀 목록, 행 우선 첫 지뢰 또는 None)
+        """
+        cs = self.cell_state
+        opened, hit = open_many(self.board, cs, cells, self.rows, self.cols)
+        for r, c in opened:         # open_many 가 이미 열었으니 색인만 맞춘다
+            cs[r][c] = STATE_CLOSED
+            self._apply(r, c, STATE_OPEN)
+        self._journal.extend((r, c, STATE_CLOSED) for r, c in opened)
+        return opened, hit
+
+    # ──────────────────────────────────────────
+    #  스냅숏 / 되돌리기
+    # ──────────────────────────────────────────
+    def snapshot(self) -> int:
+        return len(self._journal)
+
+    def rollback(self, mark: int):
+        """mark 이후 변경을 되돌림 → 바뀐 셀 목록 (중복 없음)"""
+        journal, changed = self._journal, {}
+        while len(journal) > mark:
+            r, c, old = journal.pop()
+            self._apply(r, c, old)
+            changed[(r, c)] = None
+        return list(changed)
+
+    # ──────────────────────────────────────────
+    #  solver 용 조회
+    # ──────────────────────────────────────────
+    def remaining(self, r: int, c: int) -> int:
+        """열린 숫자 셀 (r, c) 의 남은 지뢰 수 (숫자 − 깃발 이웃 수)"""
+        return self.board[r][c] - self.flag_adj[r][c]
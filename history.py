@@ -0,0 +1,241 @@
+"""
+게임 기록 저장소 (SQLite, WAL, 추가 전용)
+=========================================
+- 끝난 게임마다 한 행: 크기, 지뢰 수, 시간, 승패, 클릭 수, 3BV, 힌트 사용, seed
+- 쓰기는 백그라운드 스레드가 큐에서 모아 한 트랜잭션으로 일괄 기록
+  (UI 스레드는 큐에 넣기만 함)
+- 조회가 게임 수와 무관하게 즉시 끝나도록 쓰기 시점에 요약을 함께 갱신
+    · 최고 기록  : (source, rows, cols, mines, won, time_s) 인덱스
+    · 백분위     : 0.1초 단위 승리 시간 히스토그램 (win_time_hist)
+    · 연승       : 설정별 현재/최고 연승 (config_stats)
+- 요약과 조회는 source 별로 나뉜다 ('ui' 게임 창 · 'sim' 시뮬레이션).
+  조회 메서드의 기본값은 source='ui' 라서 봇 기록이 사람 기록에 섞이지 않는다.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "game_history.sqlite3")
+BATCH_SIZE     = 5000    # 한 트랜잭션에 모으는 최대 행 수
+FLUSH_INTERVAL = 0.5     # 첫 행을 받은 뒤 더 모으며 기다리는 최대 초
+HIST_BUCKET    = 10      # 히스토그램 해상도: 1초당 버킷 수 (0.1초)
+
+COLUMNS = ("finished_at", "rows", "cols", "mines", "won", "time_s",
+           "clicks", "bbbv", "hints", "seed", "source")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id          INTEGER PRIMARY KEY,
+    finished_at REAL    NOT NULL,
+    rows        INTEGER NOT NULL,
+    cols        INTEGER NOT NULL,
+    mines       INTEGER NOT NULL,
+    won         INTEGER NOT NULL,
+    time_s      REAL    NOT NULL,
+    clicks      INTEGER,
+    bbbv        INTEGER,
+    hints       INTEGER,
+    seed        INTEGER,
+    source      TEXT    NOT NULL DEFAULT 'ui'
+);
+CREATE INDEX IF NOT EXISTS idx_games_best
+    ON games (source, rows, cols, mines, won, time_s);
+
+CREATE TABLE IF NOT EXISTS win_time_hist (
+    source TEXT, rows INTEGER, cols INTEGER, mines INTEGER, bucket INTEGER,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (source, rows, cols, mines, bucket)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS config_stats (
+    source TEXT, rows INTEGER, cols INTEGER, mines INTEGER,
+    games       INTEGER NOT NULL,
+    wins        INTEGER NOT NULL,
+    cur_streak  INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL,
+    PRIMARY KEY (source, rows, cols, mines)
+) WITHOUT ROWID;
+"""
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class HistoryStore:
+    """
+    record() 는 큐에 넣고 바로 반환. 조회 메서드는 읽기 전용 연결을 사용하며
+    WAL 덕분에 기록 중에도 막히지 않는다.
+    """
+
+    def __init__(self, path: str = HISTORY_FILE):
+        self.path    = path
+        self._queue  = queue.Queue()
+        self._read   = _connect(path)
+        self._lock   = threading.Lock()     # 읽기 연결 보호
+        self._thread = threading.Thread(target=self._writer, daemon=True,
+                                        name="history-writer")
+        self._thread.start()
+
+    # ──────────────────────────────────────────
+    #  기록
+    # ──────────────────────────────────────────
+    def record(self, rows, cols, mines, won, time_s, clicks=None, bbbv=None,
+               hints=None, seed=None, source="ui", finished_at=None):
+        """게임 1판 기록 예약 (비동기)"""
+        self._queue.put((finished_at or time.time(), rows, cols, mines, int(bool(won)),
+                         float(time_s), clicks, bbbv, hints, seed, source))
+
+    def record_many(self, games):
+        """COLUMNS 순서 튜플 목록을 한꺼번에 기록 예약 (시뮬레이션용)"""
+        for g in games:
+            self._queue.put(tuple(g))
+
+    def flush(self, timeout=None):
+        """지금까지 예약된 기록이 디스크에 반영될 때까지 대기"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        with self._lock:
+            self._read.close()
+
+    def _writer(self):
+        conn = _connect(self.path)
+        while True:
+            item = self._queue.get()
+            batch, events, stop = [], [], False
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    batch.append(item)
+                if stop or events or len(batch) >= BATCH_SIZE:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    with conn:
+                        self._write_batch(conn, batch)
+                except sqlite3.Error as e:
+                    print(f"[기록 저장 실패] {e}")
+            for ev in events:
+                ev.set()
+            if stop:
+                conn.close()
+                return
+
+    @staticmethod
+    def _write_batch(conn, batch):
+        conn.executemany(
+            f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+            batch,
+        )
+        # 히스토그램 (승리만)
+        hist = {}
+        for g in batch:
+            if g[4]:
+                key = (g[10], g[1], g[2], g[3], int(g[5] * HIST_BUCKET))
+                hist[key] = hist.get(key, 0) + 1
+        conn.executemany(
+            "INSERT INTO win_time_hist VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (source, rows, cols, mines, bucket) "
+            "DO UPDATE SET count = count + excluded.count",
+            [(*k, n) for k, n in hist.items()],
+        )
+        # 설정별 연승 — 배치 안의 순서대로 이어서 계산
+        stats = {}
+        for g in batch:
+            cfg = (g[10], g[1], g[2], g[3])
+            if cfg not in stats:
+                row = conn.execute(
+                    "SELECT games, wins, cur_streak, best_streak FROM config_stats "
+                    "WHERE source = ? AND rows = ? AND cols = ? AND mines = ?",
+                    cfg).fetchone()
+                stats[cfg] = list(row) if row else [0, 0, 0, 0]
+            s = stats[cfg]
+            s[0] += 1
+            if g[4]:
+                s[1] += 1
+                s[2] += 1
+                s[3] = max(s[3], s[2])
+            else:
+                s[2] = 0
+        conn.executemany(
+            "INSERT OR REPLACE INTO config_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(*cfg, *s) for cfg, s in stats.items()],
+        )
+
+    # ──────────────────────────────────────────
+    #  조회
+    # ──────────────────────────────────────────
+    def _query(self, sql, args=()):
+        with self._lock:
+            return self._read.execute(sql, args).fetchall()
+
+    def best_times(self, rows, cols, mines, limit=10, source="ui"):
+        """승리 기록 빠른 순 [(time_s, finished_at, clicks, bbbv), ...]"""
+        return self._query(
+            "SELECT time_s, finished_at, clicks, bbbv FROM games "
+            "WHERE source = ? AND rows = ? AND cols = ? AND mines = ? AND won = 1 "
+            "ORDER BY time_s LIMIT ?", (source, rows, cols, mines, limit))
+
+    def best_time(self, rows, cols, mines, source="ui"):
+        row = self.best_times(rows, cols, mines, 1, source)
+        return row[0][0] if row else None
+
+    def percentile_of(self, rows, cols, mines, time_s, source="ui"):
+        """time_s 보다 빠른 승리 기록의 비율 (0~100, 기록 없으면 None)"""
+        hist = self._query(
+            "SELECT bucket, count FROM win_time_hist "
+            "WHERE source = ? AND rows = ? AND cols = ? AND mines = ?",
+            (source, rows, cols, mines))
+        total = sum(n for _, n in hist)
+        if not total:
+            return None
+        b = int(time_s * HIST_BUCKET)
+        faster = sum(n for bucket, n in hist if bucket < b)
+        return faster / total * 100
+
+    def time_at_percentile(self, rows, cols, mines, q, source="ui"):
+        """승리 시간의 q(0~100) 백분위 (버킷 해상도, 기록 없으면 None)"""
+        hist = self._query(
+            "SELECT bucket, count FROM win_time_hist "
+            "WHERE source = ? AND rows = ? AND cols = ? AND mines = ? ORDER BY bucket",
+            (source, rows, cols, mines))
+        total = sum(n for _, n in hist)
+        if not total:
+            return None
+        need, acc = q / 100 * total, 0
+        for bucket, n in hist:
+            acc += n
+            if acc >= need:
+                return (bucket + 1) / HIST_BUCKET
+        return (hist[-1][0] + 1) / HIST_BUCKET
+
+    def stats(self, rows, cols, mines, source="ui"):
+        """{'games', 'wins', 'cur_streak', 'best_streak'} (기록 없으면 None)"""
+        row = self._query(
+            "SELECT games, wins, cur_streak, best_streak FROM config_stats "
+            "WHERE source = ? AND rows = ? AND cols = ? AND mines = ?",
+            (source, rows, cols, mines))
+        if not row:
+            return None
+        return dict(zip(("games", "wins", "cur_streak", "best_streak"), row[0]))
@@ -0,0 +1,209 @@
+"""
+⭐ 추측 셀 선택 — 시간 제한 lookahead
+=====================================
+0% 셀이 없을 때 단순 최저 확률 대신,
+  점수(x) = 생존확률(x) × E_k[ 1 + 진전(x 를 열어 숫자 k 가 나온 국면) ]
+로 후보를 비교한다.
+
+- k 의 분포: 가상 국면 (x 열림, 숫자 k) 의 배치 수 비율
+  (solver.solve_position 의 가중치, 모순이면 0)
+- 진전: 가상 국면에서 확정 안전 셀 수. 확정 셀이 없으면
+  깊이가 남아 있는 한 그 국면에서 다시 최선의 추측 점수로 평가
+- 전치표(transposition table): 보이는 국면 전체를 키로 solver 결과와
+  평가값을 보관 → 수순만 다른 같은 국면, 다음 호출의 같은 국면을 재계산하지 않음
+- 반복 심화: 깊이 1 을 모든 후보에 대해 끝낸 뒤 시간이 남으면 깊이 2 …
+  시간 초과 시 마지막으로 끝난 깊이의 결과 사용
+- 재현성: 시간 제한은 기계 부하에 따라 끝나는 깊이가 달라지므로 같은 seed 라도
+  같은 수를 보장하지 않는다. 테스트 · 벤치마크는 max_solves (수 하나당 solver
+  호출 수 예산) 를 주면 시간 대신 호출 수로 자른다. 이때 대그룹 무작위 열거가
+  전역 random 을 쓰므로 호출 측이 random.seed 로 고정해야 같은 수가 나온다.
+"""
+
+import time
+from collections import OrderedDict
+
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG, neighbors
+from solver import solve_position
+
+LOOKAHEAD_BUDGET   = 0.3      # 기본 시간 제한 (초)
+MAX_CANDIDATES     = 6        # 루트에서 평가할 후보 수
+MAX_SUB_CANDIDATES = 3        # 하위 국면에서 평가할 후보 수
+MAX_DEPTH          = 3
+PROB_TOLERANCE     = 0.05     # 최저 확률 + 이 값 이내 셀만 후보 (생존 우선)
+TT_SIZE            = 50_000   # 전치표 최대 항목 수 (LRU)
+FIXED_MAX_SOLVES   = 200      # lookahead-fixed 전략의 수당 solver 호출 수 예산
+
+
+class _Timeout(Exception):
+    """시간 또는 solver 호출 수 예산 초과"""
+
+
+class LookaheadEngine:
+    """⭐ 추측 셀 선택기. 전치표를 호출 간에 유지하므로 인스턴스를 재사용할 것."""
+
+    def __init__(self, budget: float = LOOKAHEAD_BUDGET, tt_size: int = TT_SIZE,
+                 max_solves: int = None):
+        self.budget     = budget
+        self.max_solves = max_solves     # 주면 시간 대신 solver 호출 수로 제한
+        self.tt_size    = tt_size
+        self._tt     = OrderedDict()    # (국면키, 종류) → 값
+        self.stats   = {"solves": 0, "tt_hits": 0, "depth": 0}
+
+    # ──────────────────────────────────────────
+    #  전치표
+    # ──────────────────────────────────────────
+    def _tt_get(self, key):
+        val = self._tt.get(key)
+        if val is not None:
+            self._tt.move_to_end(key)
+            self.stats["tt_hits"] += 1
+        return val
+
+    def _tt_put(self, key, val):
+        self._tt[key] = val
+        if len(self._tt) > self.tt_size:
+            self._tt.popitem(last=False)
+
+    def _position_key(self):
+        """보이는 국면: 열린 셀은 숫자, 닫힘 9, 깃발 10, 물음표 11"""
+        vis, cs = self._vis, self._cs
+        code = {STATE_CLOSED: 9, STATE_FLAG: 10}
+        return (self._mines, self._rows, self._cols, b"".join(
+            bytes(v if s == STATE_OPEN else code.get(s, 11)
+                  for v, s in zip(vrow, srow))
+            for vrow, srow in zip(vis, cs)
+        ))
+
+    def _solve(self, key):
+        """국면 키 → (확률, 가중치), 전치표 캐시"""
+        hit = self._tt_get((key, "solve"))
+        if hit is not None:
+            return hit
+        self._check_budget()
+        self.stats["solves"] += 1
+        res = solve_position(self._vis, self._cs, self._rows, self._cols,
+                             self._mines, self._flags)
+        self._tt_put((key, "solve"), res)
+        return res
+
+    def _check_budget(self):
+        if self._solves_left is not None:
+            if self._solves_left <= 0:
+                raise _Timeout
+            self._solves_left -= 1
+        elif time.perf_counter() > self._deadline:
+            raise _Timeout
+
+    # ──────────────────────────────────────────
+    #  평가
+    # ──────────────────────────────────────────
+    def _candidates(self, probs, limit):
+        """
+        낮은 확률 순 후보 (최저 확률 + PROB_TOLERANCE 이내).
+        열린 셀과 닿지 않은 안쪽 셀은 서로 구분이 안 되므로
+        (같은 확률) 최대 2개만 포함.
+        """
+        rows, cols, cs = self._rows, self._cols, self._cs
+        out, interior = [], 0
+        p_max = None
+        for cell in sorted(probs, key=lambda k: (probs[k], k)):
+            p = probs[cell]
+            if p >= 1.0 or cs[cell[0]][cell[1]] != STATE_CLOSED:
+                continue
+            if p_max is None:
+                p_max = p + PROB_TOLERANCE
+            elif p > p_max:
+                break
+            if not any(cs[nr][nc] == STATE_OPEN
+                       for nr, nc in neighbors(*cell, rows, cols)):
+                interior += 1
+                if interior > 2:
+                    continue
+            out.append(cell)
+            if len(out) >= limit:
+                break
+        return out
+
+    def _score(self, cell, p, depth):
+        """생존확률 × E_k[1 + 진전]"""
+        r, c = cell
+        vis, cs = self._vis, self._cs
+        old_v, old_s = vis[r][c], cs[r][c]
+        nbrs  = neighbors(r, c, self._rows, self._cols)
+        lo    = sum(1 for nr, nc in nbrs if cs[nr][nc] == STATE_FLAG)
+        hi    = lo + sum(1 for nr, nc in nbrs if cs[nr][nc] == STATE_CLOSED)
+
+        outcomes = []
+        cs[r][c] = STATE_OPEN
+        try:
+            for k in range(lo, hi + 1):
+                vis[r][c] = k
+                key = self._position_key()
+                probs, weight = self._solve(key)
+                if weight > 0:
+                    outcomes.append((weight, self._value(key, probs, depth - 1)))
+        finally:
+            vis[r][c], cs[r][c] = old_v, old_s
+
+        total = sum(w for w, _ in outcomes)
+        if not total:
+            return 0.0
+        return (1.0 - p) * sum(w * (1.0 + v) for w, v in outcomes) / total
+
+    def _value(self, key, probs, depth):
+        """국면 가치: 확정 안전 셀 수, 없으면 (깊이가 남으면) 최선의 추측 점수"""
+        safe = sum(1 for p in probs.values() if p == 0.0)
+        if safe or depth <= 0:
+            return float(safe)
+        hit = self._tt_get((key, depth))
+        if hit is not None:
+            return hit
+        best = 0.0
+        for cell in self._candidates(probs, MAX_SUB_CANDIDATES):
+            best = max(best, self._score(cell, probs[cell], depth))
+        self._tt_put((key, depth), best)
+        return best
+
+    # ──────────────────────────────────────────
+    #  공개 API
+    # ──────────────────────────────────────────
+    def choose(self, board, cell_state, rows, cols, mine_count, flags_count,
+               probs=None, budget=None, max_solves=None):
+        """
+        추측할 셀 (r, c) 반환 (닫힌 셀이 없으면 None).
+        board 는 열린 셀의 숫자만 읽으며 내부 사본에서만 가상 수를 둔다.
+        max_solves (또는 생성자의 max_solves) 가 있으면 시간 제한 대신
+        solver 호출 수로 탐색을 자른다 (재현용).
+        """
+        if probs is None:
+            probs = solve_position(board, cell_state, rows, cols,
+                                   mine_count, flags_count)[0]
+        closed = {k: p for k, p in probs.items()
+                  if cell_state[k[0]][k[1]] == STATE_CLOSED}
+        if not closed:
+            return None
+        fallback = min(closed, key=lambda k: (closed[k], k))
+
+        self._rows, self._cols = rows, cols
+        self._mines, self._flags = mine_count, flags_count
+        self._cs  = [row[:] for row in cell_state]
+        self._vis = [[v if s == STATE_OPEN else 0 for v, s in zip(vrow, srow)]
+                     for vrow, srow in zip(board, cell_state)]
+        self._deadline = time.perf_counter() + (self.budget if budget is None else budget)
+        self._solves_left = self.max_solves if max_solves is None else max_solves
+        self.stats["depth"] = 0
+
+        cands = self._candidates(closed, MAX_CANDIDATES)
+        if len(cands) <= 1:
+            return cands[0] if cands else fallback
+
+        best = fallback
+        try:
+            for depth in range(1, MAX_DEPTH + 1):
+                scores = {cell: self._score(cell, closed[cell], depth)
+                          for cell in cands}
+                best = max(cands, key=lambda k: (scores[k], -closed[k]))
+                self.stats["depth"] = depth
+        except _Timeout:
+            pass
+        return best
@@ -0,0 +1,103 @@
+"""
+보드 난이도 지표
+================
+지뢰 배치 직후 한 번 계산하는 보드 단위 지표.
+  · bbbv           : 3BV (최소 클릭 수) = openings + isolated
+  · openings       : 0 영역 수 (8방향 연결)
+  · isolated       : 0 영역에 닿지 않은 숫자 셀 수
+  · forced_guesses : 결정적 풀이(제약 전파 + Gaussian Elimination + 전역 지뢰 수)가
+                     끝까지 가는 데 필요한 추측 횟수 (막힐 때마다 정답 보드에서
+                     안전한 셀 하나를 대신 열어 줌)
+앞의 세 지표는 보드 비트보드 한 벌 (mineboard.zero_region_counts) 로 구해
+보드 생성보다 싸다 (16×30/99 기준 생성 약 0.3ms, 지표 약 0.14ms).
+추측 횟수는 풀이를 끝까지 돌리므로 수십 ms (생성의 100배 이상) 라서 요청할 때만
+계산한다 (forced_guesses=True, simulate 집계용). 게임 창의 지뢰 배치 직후에는 끈다.
+"""
+
+from mineboard import (
+    STATE_CLOSED, STATE_OPEN, neighbors, open_cells, zero_region_counts,
+)
+
+# simulate 집계용 추측 횟수 구간 (마지막은 "이상")
+GUESS_BUCKETS = (0, 1, 2, 3)
+
+
+def _oracle_cell(board, cs, rows, cols):
+    """
+    막힌 국면에서 대신 열어 줄 안전한 셀.
+    열린 셀에 닿은 경계 셀 → 안쪽 0 셀 → 아무 안전한 셀 순 (행 우선 첫 셀).
+    """
+    interior_zero = other = None
+    for r in range(rows):
+        for c in range(cols):
+            if cs[r][c] != STATE_CLOSED or board[r][c] == -1:
+                continue
+            if any(cs[nr][nc] == STATE_OPEN for nr, nc in neighbors(r, c, rows, cols)):
+                return r, c
+            if board[r][c] == 0:
+                interior_zero = interior_zero or (r, c)
+            else:
+                other = other or (r, c)
+    return interior_zero or other
+
+
+def count_forced_guesses(board, rows: int, cols: int, n_mines: int,
+                         safe_r: int, safe_c: int) -> int:
+    """첫 클릭 (safe_r, safe_c) 부터 클리어까지 결정적 풀이가 막힌 횟수"""
+    from noguess import solve_from      # solver 까지 끌어오므로 필요할 때만
+    cs = [[STATE_CLOSED] * cols for _ in range(rows)]
+    open_cells(board, cs, safe_r, safe_c, rows, cols)
+    flags = guesses = 0
+    while True:
+        ok, flags = solve_from(board, cs, rows, cols, n_mines, flags)
+        if ok:
+            return guesses
+        cell = _oracle_cell(board, cs, rows, cols)
+        if cell is None:
+            return guesses
+        guesses += 1
+        open_cells(board, cs, *cell, rows, cols)
+
+
+def board_metrics(board, mask=None, safe_r=None, safe_c=None,
+                  forced_guesses: bool = False) -> dict:
+    """
+    보드 1개의 지표 dict. mask 가 있으면 지뢰 수를 거기서 읽는다.
+    forced_guesses=True 이고 첫 클릭 위치가 있을 때만 forced_guesses 를 세고
+    (비쌈), 아니면 None.
+    """
+    rows, cols = len(board), len(board[0])
+    openings, isolated = zero_region_counts(board)
+    if mask is not None:
+        n_mines = sum(map(sum, mask))
+    else:
+        n_mines = sum(row.count(-1) for row in board)
+
+    guesses = None
+    if forced_guesses and safe_r is not None:
+        guesses = count_forced_guesses(board, rows, cols, n_mines, safe_r, safe_c)
+    return {
+        "bbbv":           openings + isolated,
+        "openings":       openings,
+        "isolated":       isolated,
+        "mines":          n_mines,
+        "forced_guesses": guesses,
+    }
+
+
+def metrics_bulk(boards, safe_r=None, safe_c=None, forced_guesses: bool = False):
+    """
+    generate_boards 결과 [(board, mask), ...] (또는 board 목록) 일괄 계산
+    → 지표 dict 목록
+    """
+    out = []
+    for item in boards:
+        board, mask = item if isinstance(item, tuple) else (item, None)
+        out.append(board_metrics(board, mask, safe_r, safe_c, forced_guesses))
+    return out
+
+
+def guess_bucket(guesses) -> str:
+    """추측 횟수 → 집계 구간 이름 ("0", "1", "2", "3+")"""
+    top = GUESS_BUCKETS[-1]
+    return f"{top}+" if guesses >= top else str(guesses)
@@ -0,0 +1,278 @@
+"""
+지뢰찾기 보드 생성 유틸리티
+===========================
+- 첫 클릭 3×3 안전지대를 제외한 지뢰 마스크 샘플링
+- 분리형(가로 → 세로) 3×3 박스 합으로 전체 숫자 필드를 한 번에 계산
+- N개 보드 일괄 생성 API
+
+표준 라이브러리만 사용 (numpy 불필요). 보드는 기존 코드와 같은
+list-of-lists 형식이며 지뢰는 -1, 나머지는 인접 지뢰 수.
+"""
+
+import random
+
+# ─────────────────────────────────────────────
+#  셀 상태 상수
+# ─────────────────────────────────────────────
+STATE_CLOSED   = 0
+STATE_OPEN     = 1
+STATE_FLAG     = 2
+STATE_QUESTION = 3
+
+# 난이도 프리셋 (rows, cols, mines)
+DIFFICULTIES = {
+    "초급": (9,  9,  10),
+    "중급": (16, 16, 40),
+    "고급": (16, 30, 99),
+}
+
+
+def neighbors(r: int, c: int, rows: int, cols: int):
+    """유효한 인접 셀 (r, c) 목록"""
+    return [
+        (r+dr, c+dc)
+        for dr in range(-1, 2)
+        for dc in range(-1, 2)
+        if not (dr == 0 and dc == 0)
+        and 0 <= r+dr < rows
+        and 0 <= c+dc < cols
+    ]
+
+
+# ─────────────────────────────────────────────
+#  배열 연산
+# ─────────────────────────────────────────────
+def box_sum(grid):
+    """
+    3×3 박스 합 (중심 포함, 범위 밖은 0).
+    가로 3합 → 세로 3합 두 번의 zip 패스로 계산하는 분리형 convolution.
+    """
+    if not grid:
+        return []
+    cols = len(grid[0])
+    horiz = []
+    for row in grid:
+        p = [0, *row, 0]
+        horiz.append([a + b + c for a, b, c in zip(p, p[1:], p[2:])])
+    zero = [0] * cols
+    padded = [zero, *horiz, zero]
+    return [
+        [a + b + c for a, b, c in zip(u, m, d)]
+        for u, m, d in zip(padded, padded[1:], padded[2:])
+    ]
+
+
+def box_sum_bytes(rows_bytes, cols: int):
+    """
+    box_sum 의 bytes 판: 셀당 1바이트 행들 → 3×3 박스 합 행들 (bytes).
+    행을 8비트 칸의 정수 하나로 읽어 가로 합은 시프트 두 번, 세로 합은 위·아래
+    행 정수를 더한다 (칸 값이 28 이하이면 이웃 칸으로 넘치지 않음).
+    """
+    full = (1 << (8 * cols)) - 1
+    horiz = []
+    for b in rows_bytes:
+        x = int.from_bytes(b, "big")
+        horiz.append((x + (x << 8) + (x >> 8)) & full)
+    out = []
+    for i, h in enumerate(horiz):
+        up   = horiz[i - 1] if i else 0
+        down = horiz[i + 1] if i + 1 < len(horiz) else 0
+        out.append((up + h + down).to_bytes(cols, "big"))
+    return out
+
+
+def safe_zone(rows: int, cols: int, safe_r: int, safe_c: int):
+    """첫 클릭 주변 3×3 (보드 안쪽만) 의 1차원 인덱스 정렬 목록"""
+    return [
+        r * cols + c
+        for r in range(max(0, safe_r - 1), min(rows, safe_r + 2))
+        for c in range(max(0, safe_c - 1), min(cols, safe_c + 2))
+    ]
+
+
+# ─────────────────────────────────────────────
+#  지뢰 마스크 / 숫자 필드
+# ─────────────────────────────────────────────
+def sample_mine_mask(rows: int, cols: int, n_mines: int,
+                     safe_r: int, safe_c: int, rng=random):
+    """
+    안전지대를 제외한 위치에서 n_mines 개를 균등 추출한 0/1 마스크.
+    후보 목록을 만들지 않고 range 에서 바로 샘플링한 뒤
+    안전지대 인덱스만큼 밀어서 실제 위치로 변환한다.
+    """
+    excluded = safe_zone(rows, cols, safe_r, safe_c)
+    n_pool   = rows * cols - len(excluded)
+    flat     = bytearray(rows * cols)
+    for i in rng.sample(range(n_pool), max(0, min(n_mines, n_pool))):
+        for e in excluded:
+            if e > i:
+                break
+            i += 1
+        flat[i] = 1
+    return [list(flat[r * cols:(r + 1) * cols]) for r in range(rows)]
+
+
+def numbers_from_mask(mask):
+    """지뢰 마스크 → 보드 (지뢰 -1, 나머지는 인접 지뢰 수)"""
+    return [
+        [-1 if m else s for m, s in zip(mrow, srow)]
+        for mrow, srow in zip(mask, box_sum(mask))
+    ]
+
+
+def generate_board(rows: int, cols: int, n_mines: int,
+                   safe_r: int, safe_c: int, rng=random):
+    """보드 1개 생성 → (board, mask)"""
+    mask = sample_mine_mask(rows, cols, n_mines, safe_r, safe_c, rng)
+    return numbers_from_mask(mask), mask
+
+
+def generate_boards(count: int, rows: int, cols: int, n_mines: int,
+                    safe_r: int, safe_c: int, rng=random):
+    """같은 설정의 보드 count 개 일괄 생성 → [(board, mask), ...]"""
+    return [generate_board(rows, cols, n_mines, safe_r, safe_c, rng)
+            for _ in range(count)]
+
+
+def mine_cells(mask):
+    """마스크 → 지뢰 좌표 집합"""
+    return {(r, c) for r, row in enumerate(mask) for c, m in enumerate(row) if m}
+
+
+def zero_regions(board):
+    """
+    0 셀의 8방향 연결 영역 라벨링 → (labels, 영역 수).
+    labels[r][c] 는 0 셀이면 1 부터 시작하는 영역 번호, 아니면 0.
+    """
+    rows, cols = len(board), len(board[0])
+    labels = [[0] * cols for _ in range(rows)]
+    count  = 0
+    for r in range(rows):
+        brow, lrow = board[r], labels[r]
+        for c in range(cols):
+            if brow[c] != 0 or lrow[c]:
+                continue
+            count += 1
+            lrow[c] = count
+            stack = [(r, c)]
+            while stack:
+                cr, cc = stack.pop()
+                c0, c1 = max(0, cc - 1), min(cols, cc + 2)
+                for nr in range(max(0, cr - 1), min(rows, cr + 2)):
+                    nb, nl = board[nr], labels[nr]
+                    for nc in range(c0, c1):
+                        if nb[nc] == 0 and not nl[nc]:
+                            nl[nc] = count
+                            stack.append((nr, nc))
+    return labels, count
+
+
+def isolated_numbers(board, labels):
+    """0 영역에 닿지 않은 숫자 셀 수 (0 셀 마스크의 3×3 박스 합이 0 인 숫자 셀)"""
+    zero_adj = box_sum([[1 if l else 0 for l in lrow] for lrow in labels])
+    return sum(
+        1
+        for brow, zrow in zip(board, zero_adj)
+        for v, z in zip(brow, zrow)
+        if v > 0 and z == 0
+    )
+
+
+# 셀 값 + 1 바이트 → 이진수 글자 (int(…, 2) 로 행 비트마스크를 바로 만듦)
+_ZERO_DIGITS = bytes(ord("1") if i == 1 else ord("0") for i in range(256))
+_MINE_DIGITS = bytes(ord("1") if i == 0 else ord("0") for i in range(256))
+_inc = (1).__add__
+
+
+def zero_region_counts(board):
+    """
+    (0 영역 수, 고립 숫자 수) — zero_regions + isolated_numbers 와 같은 값을
+    라벨 없이 보드 전체 정수 비트보드로 계산 (batchsim 과 같은 팽창 연산).
+    행 사이에 빈 비트 하나를 둬서 좌우 시프트가 다른 행으로 번지지 않게 하고,
+    0 영역은 가장 낮은 비트에서 시작해 0 마스크 안으로 팽창을 반복해 하나씩 지운다.
+    """
+    rows, cols = len(board), len(board[0])
+    W = cols + 1
+    zero = mine = 0
+    for r, row in enumerate(board):
+        b = bytes(map(_inc, row))
+        zero |= int(b.translate(_ZERO_DIGITS), 2) << (r * W)
+        mine |= int(b.translate(_MINE_DIGITS), 2) << (r * W)
+    valid = ((1 << cols) - 1) * sum(1 << (r * W) for r in range(rows))
+
+    def dilate(x):
+        h = x | (x << 1) | (x >> 1)
+        return (h | (h << W) | (h >> W)) & valid
+
+    openings, rest = 0, zero
+    while rest:
+        openings += 1
+        region = rest & -rest
+        while True:
+            grown = dilate(region) & zero
+            if grown == region:
+                break
+            region = grown
+        rest &= ~region
+    isolated = (valid & ~mine & ~zero & ~dilate(zero)).bit_count()
+    return openings, isolated
+
+
+def three_bv(board):
+    """
+    3BV (최소 클릭 수): 0 영역 수 + 0 영역에 닿지 않은 숫자 셀 수.
+    0 영역은 8방향 연결, 영역을 열면 테두리 숫자도 함께 열린다.
+    """
+    return sum(zero_region_counts(board))
+
+
+# ─────────────────────────────────────────────
+#  셀 열기 (BFS)
+# ─────────────────────────────────────────────
+def open_cells(board, cell_state, r: int, c: int, rows: int, cols: int):
+    """
+    (r, c) 부터 빈 칸 연쇄 열기 (창 없이 cell_state 만 갱신).
+    → 새로 열린 셀 목록
+    """
+    opened = []
+    queue  = [(r, c)]
+    while queue:
+        cr, cc = queue.pop()
+        if cell_state[cr][cc] != STATE_CLOSED:
+            continue
+        cell_state[cr][cc] = STATE_OPEN
+        opened.append((cr, cc))
+        if board[cr][cc] == 0:
+            for nr, nc in neighbors(cr, cc, rows, cols):
+                if cell_state[nr][nc] == STATE_CLOSED:
+                    queue.append((nr, nc))
+    return opened
+
+
+def open_many(board, cell_state, cells, rows: int, cols: int):
+    """
+    여러 셀을 한 번에 열기: 모든 대상에서 한 번의 연쇄 열기를 시작해
+    방문 상태를 공유한다 (chord, 확정 셀 일괄 열기용).
+    지뢰 대상은 열지 않고 행 우선 첫 번째를 hit 로 돌려준다 (나머지는 연다).
+    → (새로 열린 셀 목록, hit 또는 None)
+    """
+    hit, queue = None, []
+    for r, c in sorted(set(cells), reverse=True):
+        if cell_state[r][c] != STATE_CLOSED:
+            continue
+        if board[r][c] == -1:
+            hit = (r, c)        # 역순으로 돌므로 마지막 값이 행 우선 첫 지뢰
+        else:
+            queue.append((r, c))
+    opened = []
+    while queue:
+        cr, cc = queue.pop()
+        if cell_state[cr][cc] != STATE_CLOSED:
+            continue
+        cell_state[cr][cc] = STATE_OPEN
+        opened.append((cr, cc))
+        if board[cr][cc] == 0:
+            for nr, nc in neighbors(cr, cc, rows, cols):
+                if cell_state[nr][nc] == STATE_CLOSED:
+                    queue.append((nr, nc))
+    return opened, hit
@@ -22,9 +22,22 @@ Date   : 2026-02-21
 
 import tkinter as tk
 from tkinter import messagebox
-import random
 import json
+import math
 import os
+import random
+import sys
+import time
+from collections import deque
+
+from mineboard import (
+    STATE_CLOSED, STATE_OPEN, STATE_FLAG, STATE_QUESTION, DIFFICULTIES,
+    generate_board, neighbors,
+)
+from gamestate import GameState
+from history import HistoryStore
+# solver / noguess / lookahead / deduce / metrics / uiprof 는 처음 쓸 때 import
+# (시작 시간 단축, startup 벤치마크 참고)
 
 # ─────────────────────────────────────────────
 #  상수 정의
@@ -59,62 +72,139 @@ NUM_COLORS = {
     8: "#7B7B7B",
 }
 
-# 난이도 프리셋 (rows, cols, mines)
-DIFFICULTIES = {
-    "초급": (9,  9,  10),
-    "중급": (16, 16, 40),
-    "고급": (16, 30, 99),
+NG_SYNC_BUDGET = 1.0   # 노게스 보드가 준비 안 됐을 때 첫 클릭에서 기다리는 최대 초
+# 힌트 히트맵 색 (확률 % → 색): 0% 초록 → 50% 노랑 → 100% 빨강
+HEAT_COLORS = tuple(
+    f"#{230 * p // 50:02X}C800" if p <= 50 else f"#E6{200 * (100 - p) // 50:02X}00"
+    for p in range(101)
+)
+
+# 🎲 자동 플레이 (root.after 로 프레임마다 몇 수씩 진행)
+AUTO_FRAME_MS   = 50      # 일반 모드 프레임 간격 (ms)
+AUTO_SPEEDS     = (1, 3, 10, 30)   # 프레임당 수 선택지
+AUTO_TURBO_SLICE = 0.05   # 터보 모드: 한 프레임에 쓰는 최대 계산 시간 (초)
+AUTO_MAX_MOVES  = 5000    # 무한루프 방지
+AUTO_STRATEGY   = "lookahead"     # 기본 ⭐ 전략 (strategies.STRATEGIES 의 이름)
+AUTO_STRATEGY_LABELS = {          # 메뉴에 보일 전략 (이름 → 표시)
+    "lookahead": "lookahead",
+    "min":       "최저 확률",
+    "corner":    "최저 확률 + 모서리 우선",
+    "info":      "정보 이득",
 }
 
+# 드래그 미리보기: 셀이 바뀔 때만, 최대 화면 주사율만큼 다시 그림
+PREVIEW_FRAME_MS = 16     # ≈ 60 fps
+
 RECORD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "best_records.json")
 
 # ─────────────────────────────────────────────
 #  최고 기록 로드/저장
 # ─────────────────────────────────────────────
-def load_records() -> dict:
+def load_records(history=None) -> dict:
+    """
+    난이도별 최고 기록 (초).
+    예전 best_records.json 과 게임 기록 DB(history) 중 빠른 값을 사용.
+    새 기록은 DB 에만 쌓이며 JSON 파일은 더 이상 쓰지 않는다.
+    """
+    records = {"초급": None, "중급": None, "고급": None}
     if os.path.exists(RECORD_FILE):
         try:
             with open(RECORD_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+                records.update(json.load(f))
         except Exception:
             pass
-    return {"초급": None, "중급": None, "고급": None}
-
-def save_records(records: dict):
-    try:
-        with open(RECORD_FILE, "w", encoding="utf-8") as f:
-            json.dump(records, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        print(f"[기록 저장 실패] {e}")
-
-# ─────────────────────────────────────────────
-#  셀 상태 상수
-# ─────────────────────────────────────────────
-STATE_CLOSED   = 0
-STATE_OPEN     = 1
-STATE_FLAG     = 2
-STATE_QUESTION = 3
+    if history is not None:
+        for diff, (rows, cols, mines) in DIFFICULTIES.items():
+            best = history.best_time(rows, cols, mines)
+            if best is None:
+                continue
+            best = math.ceil(best)   # 타이머 표시와 같은 기준 (올림 초)
+            if records.get(diff) is None or best < records[diff]:
+                records[diff] = best
+    return records
 
 # ─────────────────────────────────────────────
 #  메인 게임 클래스
 # ─────────────────────────────────────────────
 class Minesweeper:
-    def __init__(self, root: tk.Tk):
+    # play --profile 일 때 지연을 재는 핸들러
+    PROFILED_HANDLERS = ("_on_lpress", "_on_lrelease", "_on_rrelease", "_try_chord",
+                         "_show_hints", "_auto_play", "_auto_play_frame", "_draw_board")
+
+    def __init__(self, root: tk.Tk, profile: bool = False):
         self.root = root
         self.root.title("지뢰찾기")
         self.root.resizable(False, False)
         self.root.configure(bg=BG_GRAY)
 
-        self.records = load_records()
+        # 기록 DB / 최고 기록은 처음 쓸 때 연결·로드 (history, records 프로퍼티)
+        self._history = None
+        self._records = None
+        self._sprites = {}    # 셀 스프라이트 PhotoImage 캐시 (_sprite)
+        self._heat    = None  # 히트맵 이미지와 칸별 마지막 색 (_draw_heatmap)
 
         # 난이도 상태변수 (메뉴 라디오버튼 공유)
         self.diff_var  = tk.StringVar(value="초급")
         self.difficulty = "초급"
         self.rows, self.cols, self.mine_count = DIFFICULTIES["초급"]
 
+        # 노게스 모드 (메뉴 체크버튼) + 백그라운드 보드 풀
+        self.no_guess_var = tk.BooleanVar(value=False)
+        self._ng_pool     = None
+        self._ng_clicks   = deque(maxlen=3)   # 최근 첫 클릭 위치 (미리 생성 대상)
+
+        # 힌트 표시 방식 (메뉴 체크버튼): 셀마다 글자 / 색 히트맵 이미지 한 장
+        self.heatmap_var = tk.BooleanVar(value=False)
+
+        # 🎲 자동 플레이 설정 (메뉴) + 예약된 after 작업
+        self.auto_speed_var = tk.IntVar(value=AUTO_SPEEDS[0])
+        self.turbo_var      = tk.BooleanVar(value=False)
+        self.strategy_var   = tk.StringVar(value=AUTO_STRATEGY)   # ⭐ 전략 (strategies.py)
+        self._guess         = None    # (전략 이름, 추측 함수), 게임마다 새로
+        self._auto_job      = None
+        self._pointer_job   = None    # 드래그 미리보기 예약 (포인터 파이프라인)
+
+        # UI 지연 프로파일러 (선택): 핸들러 감싸기는 바인딩 전에 해야 함
+        self.profiler = None
+        if profile:
+            from uiprof import UIProfiler
+            self.profiler = UIProfiler(root)
+            self.profiler.instrument(
+                self, self.PROFILED_HANDLERS,
+                solver_calls=((self, "_definite_cells"), (self, "_calc_probabilities"),
+                              (self, "_choose_star")),
+            )
+            self.root.bind("<F9>", lambda e: self.profiler.dump())
+
         self._build_menu()
+        self._build_ui()
         self._init_game()
 
+    # ──────────────────────────────────────────
+    #  지연 초기화
+    # ──────────────────────────────────────────
+    @property
+    def history(self):
+        """게임 기록 DB (처음 쓸 때 연결)"""
+        if self._history is None:
+            self._history = HistoryStore()
+        return self._history
+
+    @property
+    def records(self) -> dict:
+        """난이도별 최고 기록 (처음 쓸 때 로드)"""
+        if self._records is None:
+            self._records = load_records(self.history)
+        return self._records
+
+    @property
+    def open_count(self) -> int:
+        return self.state.open_count
+
+    @property
+    def flags_count(self) -> int:
+        return self.state.flags_count
+
     # ──────────────────────────────────────────
     #  메뉴 바
     # ──────────────────────────────────────────
@@ -137,40 +227,79 @@ class Minesweeper:
 
         game_menu.add_command(label="사용자 정의...", command=self._custom_difficulty)
         game_menu.add_separator()
+        game_menu.add_checkbutton(
+            label="노게스 모드 (추측 불필요 보드)",
+            variable=self.no_guess_var,
+            command=self._toggle_no_guess,
+        )
+        game_menu.add_checkbutton(
+            label="힌트 히트맵 (큰 보드용)",
+            variable=self.heatmap_var,
+            command=self._update_hints_if_active,
+        )
+        game_menu.add_separator()
+        game_menu.add_command(label="되돌리기 (Ctrl+Z)", command=self._undo)
+        game_menu.add_separator()
         game_menu.add_command(label="최고 기록 보기", command=self._show_records)
         game_menu.add_separator()
         game_menu.add_command(label="종료", command=self.root.quit)
 
         menubar.add_cascade(label="게임", menu=game_menu)
+
+        auto_menu = tk.Menu(menubar, tearoff=0, font=MFONT)
+        for n in AUTO_SPEEDS:
+            auto_menu.add_radiobutton(
+                label=f"프레임당 {n}수", variable=self.auto_speed_var, value=n,
+            )
+        auto_menu.add_separator()
+        auto_menu.add_checkbutton(
+            label="터보 (중간 그리기 생략)", variable=self.turbo_var,
+        )
+        auto_menu.add_separator()
+        for name, label in AUTO_STRATEGY_LABELS.items():
+            auto_menu.add_radiobutton(
+                label=f"⭐ {label}", variable=self.strategy_var, value=name,
+            )
+        menubar.add_cascade(label="자동 플레이", menu=auto_menu)
         self.root.configure(menu=menubar)
         self.root.bind("<F2>", lambda e: self._new_game())
+        self.root.bind("<Control-z>", lambda e: self._undo())
 
     # ──────────────────────────────────────────
     #  게임 데이터 초기화
     # ──────────────────────────────────────────
     def _init_game(self):
+        if self._auto_job is not None:
+            self.root.after_cancel(self._auto_job)
+            self._auto_job = None
+        self._defer_draw = False  # 터보 자동 플레이 중에는 셀 그리기 보류
         self.board       = [[0]*self.cols for _ in range(self.rows)]
-        self.cell_state  = [[STATE_CLOSED]*self.cols for _ in range(self.rows)]
+        # 셀 상태 · 열린 수 · 깃발 수는 저널이 있는 GameState 가 들고 있음 (되돌리기)
+        self.state       = GameState(self.board, self.rows, self.cols, self.mine_count)
+        self.cell_state  = self.state.cell_state
+        self._undo_marks = []     # 사용자 동작 직전의 state.snapshot()
         self.first_click = True
         self.game_over   = False
         self.game_won    = False
-        self.flags_count = 0
-        self.open_count  = 0
         self.elapsed     = 0
         self._timer_id   = None
         self._press_pos  = None  # 현재 눌린 셀 (r, c)
         self._hint_mode  = False  # 힌트 오버레이 표시 여부
+        self._start_time = None   # 첫 클릭 시각 (perf_counter, 기록용 정밀 시간)
+        self.clicks      = 0      # 열기/깃발/chord 클릭 수
+        self.hint_uses   = 0      # 💡 켜기 + 자동 버튼 사용 횟수
+        self.board_seed  = None   # 보드 생성 seed (노게스 보드는 None)
+        self.board_info  = None   # 보드 난이도 지표 (metrics.board_metrics)
+        self._deducer    = None   # 국소 패턴 추론 (게임마다 새로, 처음 쓸 때 생성)
+        self._guess      = None   # ⭐ 전략 추측 함수 (_choose_star)
 
-        self._build_ui()
+        self._reset_ui()
+        self._prefetch_no_guess()
 
     # ──────────────────────────────────────────
-    #  UI 구성
+    #  UI 구성 (한 번만) / 새 게임마다 초기화
     # ──────────────────────────────────────────
     def _build_ui(self):
-        for w in self.root.winfo_children():
-            if not isinstance(w, tk.Menu):
-                w.destroy()
-
         # 외곽 프레임
         outer = tk.Frame(self.root, bg=BG_GRAY, relief="raised", bd=3)
         outer.pack(padx=4, pady=4)
@@ -262,6 +391,9 @@ class Minesweeper:
             relief="sunken", bd=3
         )
         self.canvas.pack(padx=INNER_PAD, pady=(0, INNER_PAD))
+        self._canvas_size = (self.cols, self.rows)
+        if self.profiler is not None:
+            self.profiler.instrument_canvas(self.canvas)
 
         self.canvas.bind("<Button-1>",         self._on_lpress)
         self.canvas.bind("<ButtonRelease-1>",  self._on_lrelease)
@@ -270,13 +402,36 @@ class Minesweeper:
         self.canvas.bind("<B1-Motion>",        self._on_ldrag)
         self.canvas.bind("<B3-Motion>",        self._on_rdrag)
 
+    def _reset_ui(self):
+        """
+        새 게임: 위젯 트리와 이벤트 바인딩은 그대로 두고 표시 상태만 되돌린다.
+        크기가 바뀌었을 때만 캔버스 크기를 바꾸고, 셀은 _draw_board 가
+        보드 이미지 한 장으로 다시 깐다.
+        """
+        self.mine_lbl.config(text=self._lcd(self.mine_count))
+        self.timer_lbl.config(text=self._lcd(0))
+        self.face_btn.config(text="\U0001f642")
+        self.hint_btn.config(relief="raised", bg=BG_GRAY)
+        self.auto_play_btn.config(text="🎲자동", relief="raised")
+        for btn in (self.auto_safe_btn, self.auto_flag_btn, self.auto_play_btn):
+            btn.pack_forget()
+
+        if self._canvas_size != (self.cols, self.rows):
+            self.canvas.config(width=self.cols * CELL_SIZE, height=self.rows * CELL_SIZE)
+            self._canvas_size = (self.cols, self.rows)
         self._draw_board()
-        self.root.update_idletasks()
 
         # 마우스 버튼 상태 추적 (chord click용)
         self._left_down  = False
         self._right_down = False
 
+        # 포인터 이벤트 파이프라인: 마지막 motion 의 셀, 예약된 그리기, 마지막 그리기 시각
+        if self._pointer_job is not None:
+            self.root.after_cancel(self._pointer_job)
+        self._pointer_cell = None
+        self._pointer_job  = None
+        self._last_preview = 0.0
+
     # ──────────────────────────────────────────
     #  그리기 유틸
     # ──────────────────────────────────────────
@@ -300,11 +455,59 @@ class Minesweeper:
 
     def _draw_board(self):
         self.canvas.delete("all")
+        if all(st == STATE_CLOSED for row in self.cell_state for st in row):
+            # 빈 보드: 닫힌 셀 스프라이트를 바둑판식으로 채운 이미지 한 장
+            self.canvas.create_image(0, 0, image=self._sprite("board"),
+                                     anchor="nw", tags="board_bg")
+            return
         for r in range(self.rows):
             for c in range(self.cols):
                 self._draw_cell(r, c)
 
+    @staticmethod
+    def _raised_pixels() -> str:
+        """
+        닫힌 셀 픽셀 (PhotoImage.put 형식): 위·왼쪽 LIGHT 띠, 아래·오른쪽 SHADOW 띠
+        (코너는 SHADOW 가 덮음). 예전 사각형 그리기와 같게 오른쪽·아래 1px 은
+        캔버스 배경색으로 남긴다.
+        """
+        bw, last = max(3, CELL_SIZE // 14), CELL_SIZE - 1
+        rows = []
+        for y in range(CELL_SIZE):
+            row = []
+            for x in range(CELL_SIZE):
+                if x == last or y == last:
+                    row.append(BG_GRAY)
+                elif x >= CELL_SIZE - bw or y >= CELL_SIZE - bw:
+                    row.append(SHADOW)
+                elif x < bw - 1 or y < bw - 1:
+                    row.append(LIGHT)
+                else:
+                    row.append(CELL_CLOSED)
+            rows.append("{" + " ".join(row) + "}")
+        return " ".join(rows)
+
+    def _sprite(self, name: str):
+        """
+        캐시된 PhotoImage: 'raised' (닫힌 셀 1칸),
+        'board' (현재 크기 보드 전체를 'raised' 로 채운 것)
+        """
+        key = (name, self.rows, self.cols) if name == "board" else name
+        img = self._sprites.get(key)
+        if img is None:
+            if name == "raised":
+                img = tk.PhotoImage(master=self.root, width=CELL_SIZE, height=CELL_SIZE)
+                img.put(self._raised_pixels())
+            else:
+                w, h = self.cols * CELL_SIZE, self.rows * CELL_SIZE
+                img = tk.PhotoImage(master=self.root, width=w, height=h)
+                img.put(self._raised_pixels(), to=(0, 0, w, h))   # 바둑판식 반복
+            self._sprites[key] = img
+        return img
+
     def _draw_cell(self, r: int, c: int):
+        if self._defer_draw:
+            return
         x0, y0 = self._xy(r, c)
         x1, y1 = x0 + CELL_SIZE, y0 + CELL_SIZE
         st  = self.cell_state[r][c]
@@ -341,33 +544,9 @@ class Minesweeper:
             )
 
     def _draw_raised(self, x0, y0, x1, y1, tag):
-        """3D 돌출 셀 — 내부 rect로 테두리 그려 인접 셀 번짐 완전 방지"""
-        bw = max(3, CELL_SIZE // 14)   # 64px → 4px
-        # 배경 전체 채우기
-        self.canvas.create_rectangle(
-            x0, y0, x1-1, y1-1,
-            fill=CELL_CLOSED, outline="", tags=tag
-        )
-        # 상단 LIGHT (horizontal strip)
-        self.canvas.create_rectangle(
-            x0, y0, x1-1, y0+bw-1,
-            fill=LIGHT, outline="", tags=tag
-        )
-        # 좌측 LIGHT (vertical strip)
-        self.canvas.create_rectangle(
-            x0, y0, x0+bw-1, y1-1,
-            fill=LIGHT, outline="", tags=tag
-        )
-        # 하단 SHADOW (horizontal strip) — 나중에 그려 코너를 덮음
-        self.canvas.create_rectangle(
-            x0, y1-bw, x1-1, y1-1,
-            fill=SHADOW, outline="", tags=tag
-        )
-        # 우측 SHADOW (vertical strip)
-        self.canvas.create_rectangle(
-            x1-bw, y0, x1-1, y1-1,
-            fill=SHADOW, outline="", tags=tag
-        )
+        """3D 돌출 셀 — 캐시된 스프라이트 한 장"""
+        self.canvas.create_image(x0, y0, image=self._sprite("raised"),
+                                 anchor="nw", tags=tag)
 
     def _draw_pressed(self, r: int, c: int):
         """눌린 효과 — 4변 어두운 띠를 명시적으로 그려 인접 셀 구분을 확실하게"""
@@ -476,88 +655,127 @@ class Minesweeper:
     #  지뢰 배치
     # ──────────────────────────────────────────
     def _place_mines(self, safe_r: int, safe_c: int):
-        """첫 클릭 주변 3×3 제외하고 지뢰 배치"""
-        safe = {
-            (safe_r+dr, safe_c+dc)
-            for dr in range(-1, 2)
-            for dc in range(-1, 2)
-            if 0 <= safe_r+dr < self.rows and 0 <= safe_c+dc < self.cols
-        }
-        candidates = [
-            (r, c)
-            for r in range(self.rows)
-            for c in range(self.cols)
-            if (r, c) not in safe
-        ]
-        random.shuffle(candidates)
-        for r, c in candidates[:self.mine_count]:
-            self.board[r][c] = -1
+        """첫 클릭 주변 3×3 제외하고 지뢰 배치 (마스크 샘플링 + 박스 합)"""
+        from metrics import board_metrics
+        if self.no_guess_var.get():
+            board = self._no_guess_board(safe_r, safe_c)
+            if board is not None:
+                self.board = board
+                self.board_info = board_metrics(board)
+                self.board_info["forced_guesses"] = 0
+                return
+        self.board_seed = random.getrandbits(32)
+        self.board, mask = generate_board(
+            self.rows, self.cols, self.mine_count, safe_r, safe_c,
+            random.Random(self.board_seed),
+        )
+        # 강제 추측 횟수는 풀이가 필요해 첫 클릭을 늦추므로 여기선 생략
+        self.board_info = board_metrics(self.board, mask)
 
-        # 인접 수 계산
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.board[r][c] == -1:
-                    continue
-                cnt = sum(
-                    1
-                    for dr in range(-1, 2)
-                    for dc in range(-1, 2)
-                    if 0 <= r+dr < self.rows and 0 <= c+dc < self.cols
-                    and self.board[r+dr][c+dc] == -1
-                )
-                self.board[r][c] = cnt
+    # ──────────────────────────────────────────
+    #  노게스 모드
+    # ──────────────────────────────────────────
+    def _toggle_no_guess(self):
+        """메뉴 체크: 켜면 풀 생성 + 미리 생성 시작, 끄면 풀 종료"""
+        if self.no_guess_var.get():
+            self._prefetch_no_guess()
+        else:
+            self._shutdown_no_guess()
+
+    def _prefetch_no_guess(self):
+        """현재 크기의 중앙·모서리·최근 첫 클릭 위치 보드를 미리 생성"""
+        if not self.no_guess_var.get():
+            return
+        if self._ng_pool is None:
+            from noguess import NoGuessPool
+            self._ng_pool = NoGuessPool()
+        clicks = {(self.rows // 2, self.cols // 2), (0, 0), *self._ng_clicks}
+        clicks = {(r, c) for r, c in clicks if r < self.rows and c < self.cols}
+        self._ng_pool.prefetch(self.rows, self.cols, self.mine_count, clicks)
+
+    def _no_guess_board(self, safe_r: int, safe_c: int):
+        """
+        풀에 준비된 보드를 꺼내고, 없으면 NG_SYNC_BUDGET 초 동안 직접 생성.
+        그래도 실패하면 None (일반 무작위 배치로 대체).
+        """
+        self._ng_clicks.append((safe_r, safe_c))
+        board = None
+        if self._ng_pool is not None:
+            board = self._ng_pool.take(self.rows, self.cols, self.mine_count,
+                                       safe_r, safe_c)
+        if board is None:
+            from noguess import generate_no_guess_board
+            board = generate_no_guess_board(
+                self.rows, self.cols, self.mine_count, safe_r, safe_c,
+                deadline=time.perf_counter() + NG_SYNC_BUDGET,
+            )
+        self._prefetch_no_guess()
+        return board
+
+    def _shutdown_no_guess(self):
+        if self._ng_pool is not None:
+            self._ng_pool.shutdown()
+            self._ng_pool = None
 
     # ──────────────────────────────────────────
     #  셀 열기 (BFS)
     # ──────────────────────────────────────────
     def _open_cell(self, r: int, c: int):
-        if self.cell_state[r][c] != STATE_CLOSED:
-            return
+        self._open_cells([(r, c)])
 
-        queue   = [(r, c)]
-        visited = set()
+    def _open_cells(self, cells):
+        """
+        여러 셀을 한 번의 연쇄 열기로 열고 새로 열린 셀만 그린다 (GameState.open_many).
+        지뢰 대상은 열지 않는다 → (새로 열린 셀 목록, 행 우선 첫 지뢰 또는 None)
+        """
+        opened, hit = self.state.open_many(cells)
+        for r, c in opened:
+            self._draw_cell(r, c)
+        if opened and self._deducer is not None:
+            self._deducer.notify(opened, self.cell_state, self.rows, self.cols)
+
+        # 힌트 레이어를 최상위로 올림 (새로 그려진 셀들이 힌트 텍스트를 가리지 않도록)
+        if opened and self._hint_mode:
+            self.canvas.tag_raise("hint")
+        return opened, hit
 
-        while queue:
-            cr, cc = queue.pop(0)
-            if (cr, cc) in visited:
-                continue
-            visited.add((cr, cc))
-            if self.cell_state[cr][cc] != STATE_CLOSED:
-                continue
+    # ──────────────────────────────────────────
+    #  되돌리기
+    # ──────────────────────────────────────────
+    def _checkpoint(self):
+        """사용자 동작 직전의 되돌리기 지점 (첫 클릭 전이거나 바뀐 게 없으면 생략)"""
+        if self.first_click:
+            return
+        mark = self.state.snapshot()
+        if not self._undo_marks or self._undo_marks[-1] != mark:
+            self._undo_marks.append(mark)
 
-            self.cell_state[cr][cc] = STATE_OPEN
-            self.open_count += 1
-            self._draw_cell(cr, cc)
-
-            if self.board[cr][cc] == 0:
-                for dr in range(-1, 2):
-                    for dc in range(-1, 2):
-                        if dr == 0 and dc == 0:
-                            continue
-                        nr, nc = cr+dr, cc+dc
-                        if (0 <= nr < self.rows and 0 <= nc < self.cols
-                                and (nr, nc) not in visited
-                                and self.cell_state[nr][nc] == STATE_CLOSED):
-                            queue.append((nr, nc))
-
-        # BFS 완료 후 힌트 레이어를 최상위로 올림
-        # (새로 그려진 셀들이 힌트 텍스트를 가리지 않도록)
-        if self._hint_mode:
-            self.canvas.tag_raise("hint")
+    def _undo(self):
+        """
+        Ctrl+Z: 마지막 동작 (클릭 · chord · 깃발 · 자동 버튼) 되돌리기.
+        진행 중인 판에서만, 도움 사용 (hint_uses) 으로 기록한다.
+        """
+        if self.game_over or self.game_won or self._auto_job is not None:
+            return
+        while self._undo_marks:
+            mark = self._undo_marks.pop()
+            if mark < self.state.snapshot():
+                break
+        else:
+            return
+        self.hint_uses += 1
+        self._deducer = None        # 되돌린 정보로 찾은 확정 셀을 버림
+        for r, c in self.state.rollback(mark):
+            self._draw_cell(r, c)
+        self.mine_lbl.config(text=self._lcd(self.mine_count - self.flags_count))
+        self._update_hints_if_active()
 
     # ──────────────────────────────────────────
     #  Chord Click 헬퍼
     # ──────────────────────────────────────────
     def _neighbors(self, r: int, c: int):
         """유효한 인접 셀 (r, c) 목록"""
-        return [
-            (r+dr, c+dc)
-            for dr in range(-1, 2)
-            for dc in range(-1, 2)
-            if not (dr == 0 and dc == 0)
-            and 0 <= r+dr < self.rows
-            and 0 <= c+dc < self.cols
-        ]
+        return neighbors(r, c, self.rows, self.cols)
 
     def _show_chord_preview(self, r: int, c: int):
         """chord 대상 셀들 눌린 미리보기 표시"""
@@ -600,15 +818,9 @@ class Minesweeper:
             self._update_hints_if_active()
             return
 
-        # 조건 충족 → 닫힌 셀 모두 열기
-        hit = None
-        for nr, nc in neighbors:
-            if self.cell_state[nr][nc] == STATE_CLOSED:
-                if self.board[nr][nc] == -1:
-                    hit = (nr, nc)
-                else:
-                    self._open_cell(nr, nc)
-
+        # 조건 충족 → 닫힌 셀 모두 열기 (지뢰가 있으면 나머지를 연 뒤 게임 오버)
+        self._checkpoint()
+        _, hit = self._open_cells(neighbors)
         if hit:
             self._do_game_over(*hit)
         else:
@@ -620,13 +832,14 @@ class Minesweeper:
     #  마우스 이벤트
     # ──────────────────────────────────────────
     def _on_lpress(self, event):
-        if self.game_over or self.game_won:
+        if self.game_over or self.game_won or self._auto_job is not None:
             return
+        self._flush_pointer()
         self._left_down = True
         r, c = self._rc(event.x, event.y)
         if r is None:
             return
-        self._press_pos = (r, c)
+        self._press_pos = self._pointer_cell = (r, c)
         self.face_btn.config(text="😮")
 
         if self._right_down:
@@ -636,36 +849,19 @@ class Minesweeper:
             self._draw_pressed(r, c)
 
     def _on_ldrag(self, event):
-        if self.game_over or self.game_won:
-            return
-        # 이전 셀 복원
-        if self._press_pos:
-            pr, pc = self._press_pos
-            if self._right_down:
-                self._hide_chord_preview(pr, pc)
-            else:
-                self._draw_cell(pr, pc)
-
-        r, c = self._rc(event.x, event.y)
-        if r is None:
-            self._press_pos = None
-            return
-        self._press_pos = (r, c)
-
-        if self._right_down:
-            self._show_chord_preview(r, c)
-        elif self.cell_state[r][c] == STATE_CLOSED:
-            self._draw_pressed(r, c)
+        self._on_pointer_move(event)
 
     def _on_lrelease(self, event):
+        self._flush_pointer()
         self._left_down = False
         self.face_btn.config(text="🙂")
-        if self.game_over or self.game_won:
+        if self.game_over or self.game_won or self._auto_job is not None:
             return
 
         r, c = self._rc(event.x, event.y)
         if r is None:
             return
+        self.clicks += 1
 
         if self._right_down:
             # chord 실행
@@ -674,11 +870,13 @@ class Minesweeper:
 
         if self.cell_state[r][c] != STATE_CLOSED:
             return
+        self._checkpoint()
 
         # 첫 클릭 → 지뢰 배치 + 타이머 시작
         if self.first_click:
             self.first_click = False
             self._place_mines(r, c)
+            self.state.board = self.board
             self._start_timer()
 
         if self.board[r][c] == -1:
@@ -689,13 +887,14 @@ class Minesweeper:
             self._update_hints_if_active()
 
     def _on_rpress(self, event):
-        if self.game_over or self.game_won:
+        if self.game_over or self.game_won or self._auto_job is not None:
             return
+        self._flush_pointer()
         self._right_down = True
         r, c = self._rc(event.x, event.y)
         if r is None:
             return
-        self._press_pos = (r, c)
+        self._press_pos = self._pointer_cell = (r, c)
 
         if self._left_down:
             # 양쪽 동시: chord 미리보기
@@ -704,28 +903,20 @@ class Minesweeper:
         # 우클릭만 단독: press 이벤트에서는 아무것도 안 함 (release에서 토글)
 
     def _on_rdrag(self, event):
-        if self.game_over or self.game_won:
-            return
         if not self._left_down:
             return  # 우클릭 단독 드래그는 무시
-        # 이전 셀 복원
-        if self._press_pos:
-            self._hide_chord_preview(*self._press_pos)
-        r, c = self._rc(event.x, event.y)
-        if r is None:
-            self._press_pos = None
-            return
-        self._press_pos = (r, c)
-        self._show_chord_preview(r, c)
+        self._on_pointer_move(event)
 
     def _on_rrelease(self, event):
+        self._flush_pointer()
         self._right_down = False
-        if self.game_over or self.game_won:
+        if self.game_over or self.game_won or self._auto_job is not None:
             return
 
         r, c = self._rc(event.x, event.y)
         if r is None:
             return
+        self.clicks += 1
 
         if self._left_down:
             # chord 실행
@@ -733,28 +924,67 @@ class Minesweeper:
             self._try_chord(r, c)
             return
 
-        # 우클릭 단독: 깃발 토글
-        st = self.cell_state[r][c]
-        if st == STATE_OPEN:
+        # 우클릭 단독: 깃발 → 물음표 → 닫힘 순환
+        self._checkpoint()
+        if self.state.cycle_mark(r, c) is None:
             return
-        if st == STATE_CLOSED:
-            self.cell_state[r][c] = STATE_FLAG
-            self.flags_count += 1
-        elif st == STATE_FLAG:
-            self.cell_state[r][c] = STATE_QUESTION
-            self.flags_count -= 1
-        elif st == STATE_QUESTION:
-            self.cell_state[r][c] = STATE_CLOSED
 
         self._draw_cell(r, c)
         self.mine_lbl.config(text=self._lcd(self.mine_count - self.flags_count))
         self._update_hints_if_active()
 
+    # ──────────────────────────────────────────
+    #  포인터 이벤트 파이프라인 (드래그 미리보기)
+    # ──────────────────────────────────────────
+    def _on_pointer_move(self, event):
+        """
+        원시 motion → 셀 단위 목표. 같은 셀 안의 움직임은 버리고,
+        셀이 바뀌면 그리기를 프레임(PREVIEW_FRAME_MS)당 한 번으로 묶는다.
+        """
+        if self.game_over or self.game_won:
+            return
+        r, c = self._rc(event.x, event.y)
+        cell = None if r is None else (r, c)
+        if cell == self._pointer_cell:
+            return
+        self._pointer_cell = cell
+        if self._pointer_job is not None:
+            return                      # 이미 예약된 그리기가 마지막 셀을 반영
+        wait = self._last_preview + PREVIEW_FRAME_MS / 1000 - time.perf_counter()
+        if wait <= 0:
+            self._flush_pointer()
+        else:
+            self._pointer_job = self.root.after(max(1, round(wait * 1000)),
+                                                self._flush_pointer)
+
+    def _flush_pointer(self):
+        """보류된 셀 이동을 반영: 이전 셀 leave(복원) → 새 셀 enter(눌림/chord 미리보기)"""
+        if self._pointer_job is not None:
+            self.root.after_cancel(self._pointer_job)
+            self._pointer_job = None
+        cell = self._pointer_cell
+        if cell == self._press_pos or self.game_over or self.game_won:
+            return
+        chord = self._left_down and self._right_down
+        if self._press_pos:
+            if chord:
+                self._hide_chord_preview(*self._press_pos)
+            else:
+                self._draw_cell(*self._press_pos)
+        self._press_pos = cell
+        if cell is not None:
+            if chord:
+                self._show_chord_preview(*cell)
+            elif self.cell_state[cell[0]][cell[1]] == STATE_CLOSED:
+                self._draw_pressed(*cell)
+        self._last_preview = time.perf_counter()
+
     # ──────────────────────────────────────────
     #  타이머
     # ──────────────────────────────────────────
     def _start_timer(self):
         self.elapsed = 0
+        self._start_time = time.perf_counter()
         self._tick()
 
     def _tick(self):
@@ -779,6 +1009,9 @@ class Minesweeper:
     def _do_win(self):
         self.game_won = True
         self._stop_timer()
+        # 최고 기록은 이 판을 기록 큐에 넣기 전에 읽는다 (기록 스레드와 경쟁 방지)
+        records = self.records
+        self._record_history(won=True)
         self.face_btn.config(text="😎")
 
         # 힌트 오버레이 즉시 제거
@@ -792,17 +1025,16 @@ class Minesweeper:
         for r in range(self.rows):
             for c in range(self.cols):
                 if self.board[r][c] == -1 and self.cell_state[r][c] != STATE_FLAG:
-                    self.cell_state[r][c] = STATE_FLAG
+                    self.state.set(r, c, STATE_FLAG)
                     self._draw_cell(r, c)
         self.mine_lbl.config(text=self._lcd(0))
 
         # 최고 기록 처리
         record_msg = ""
-        if self.difficulty in self.records:
-            prev = self.records[self.difficulty]
+        if self.difficulty in records:
+            prev = records[self.difficulty]
             if prev is None or self.elapsed < prev:
-                self.records[self.difficulty] = self.elapsed
-                save_records(self.records)
+                records[self.difficulty] = self.elapsed
                 record_msg = f"\n🏆 최고 기록 갱신!  {self.elapsed}초"
             else:
                 record_msg = f"\n현재: {self.elapsed}초  |  최고: {prev}초"
@@ -818,6 +1050,7 @@ class Minesweeper:
     def _do_game_over(self, hit_r: int, hit_c: int):
         self.game_over = True
         self._stop_timer()
+        self._record_history(won=False)
         self.face_btn.config(text="😵")
 
         # 힌트 오버레이 즉시 제거
@@ -836,13 +1069,13 @@ class Minesweeper:
 
                 if r == hit_r and c == hit_c:
                     # 밟은 지뢰: 빨간 배경 + 지뢰
-                    self.cell_state[r][c] = STATE_OPEN
+                    self.state.set(r, c, STATE_OPEN)
                     self.canvas.delete(tag)
                     self._draw_mine_hit(x0, y0, tag)
 
                 elif val == -1 and st not in (STATE_FLAG, STATE_OPEN):
                     # 미발견 지뢰: 공개
-                    self.cell_state[r][c] = STATE_OPEN
+                    self.state.set(r, c, STATE_OPEN)
                     self.canvas.delete(tag)
                     self.canvas.create_rectangle(
                         x0, y0, x0+CELL_SIZE, y0+CELL_SIZE,
@@ -852,7 +1085,7 @@ class Minesweeper:
 
                 elif val != -1 and st == STATE_FLAG:
                     # 틀린 깃발: 지뢰 + 빨간 X
-                    self.cell_state[r][c] = STATE_OPEN
+                    self.state.set(r, c, STATE_OPEN)
                     self.canvas.delete(tag)
                     self.canvas.create_rectangle(
                         x0, y0, x0+CELL_SIZE, y0+CELL_SIZE,
@@ -860,6 +1093,17 @@ class Minesweeper:
                     )
                     self._draw_mine_wrong(x0, y0, tag)
 
+    def _record_history(self, won: bool):
+        """끝난 게임을 기록 DB 에 비동기로 추가 (사용자 정의 크기 포함)"""
+        if self._start_time is None:
+            return
+        self.history.record(
+            self.rows, self.cols, self.mine_count, won,
+            time.perf_counter() - self._start_time,
+            clicks=self.clicks, bbbv=self.board_info["bbbv"],
+            hints=self.hint_uses, seed=self.board_seed,
+        )
+
     # ──────────────────────────────────────────
     #  힌트 (지뢰 확률 표시)
     # ──────────────────────────────────────────
@@ -870,12 +1114,16 @@ class Minesweeper:
             return
         self._hint_mode = not self._hint_mode
         if self._hint_mode:
+            self.hint_uses += 1
             self.hint_btn.config(relief="sunken", bg="#E0E0B0")
             self.auto_safe_btn.pack(side="right", pady=8, padx=(0, 2))
             self.auto_flag_btn.pack(side="right", pady=8, padx=(0, 2))
             self.auto_play_btn.pack(side="right", pady=8, padx=(0, 2))
             self._show_hints()
         else:
+            # 정지 버튼을 숨기기 전에 진행 중인 자동 플레이부터 멈춤
+            if self._auto_job is not None:
+                self._stop_auto_play()
             self.hint_btn.config(relief="raised", bg=BG_GRAY)
             self.auto_safe_btn.pack_forget()
             self.auto_flag_btn.pack_forget()
@@ -886,15 +1134,14 @@ class Minesweeper:
         """✔ 0% 확률 셀을 한 번만 모두 열기 (1단계)"""
         if self.game_over or self.game_won or self.first_click:
             return
+        self.hint_uses += 1
+        self._checkpoint()
         probs = self._calc_probabilities()
-        progress = False
-        for (r, c), p in probs.items():
-            if round(p * 100) == 0 and self.cell_state[r][c] == STATE_CLOSED:
-                self._open_cell(r, c)
-                progress = True
-                if self.game_over:
-                    break
-        if progress:
+        opened, hit = self._open_cells([k for k, p in probs.items() if round(p * 100) == 0])
+        if hit:
+            self._do_game_over(*hit)
+            return
+        if opened:
             self._check_win()
         self._update_hints_if_active()
 
@@ -902,12 +1149,13 @@ class Minesweeper:
         """🚩 100% 확률 셀을 한 번만 모두 깃발 (1단계)"""
         if self.game_over or self.game_won or self.first_click:
             return
+        self.hint_uses += 1
+        self._checkpoint()
         probs = self._calc_probabilities()
         progress = False
         for (r, c), p in probs.items():
             if round(p * 100) == 100 and self.cell_state[r][c] == STATE_CLOSED:
-                self.cell_state[r][c] = STATE_FLAG
-                self.flags_count += 1
+                self.state.set(r, c, STATE_FLAG)
                 self._draw_cell(r, c)
                 progress = True
         if progress:
@@ -915,418 +1163,163 @@ class Minesweeper:
             self._check_win()
         self._update_hints_if_active()
 
+    def _definite_cells(self):
+        """
+        바로 둘 수 있는 (STATE_CLOSED) 확정 (안전, 지뢰) 셀 목록.
+        국소 패턴 추론으로 먼저 찾고, 없을 때만 전체 확률 계산 (0% / 100%).
+        """
+        if self._deducer is None:
+            from deduce import LocalDeducer
+            self._deducer = LocalDeducer()
+        safe, mine = self._deducer.deduce(self.board, self.cell_state,
+                                          self.rows, self.cols)
+        if not safe and not mine:
+            cs    = self.cell_state
+            probs = self._calc_probabilities()
+            safe = [k for k, p in probs.items()
+                    if round(p * 100) == 0 and cs[k[0]][k[1]] == STATE_CLOSED]
+            mine = [k for k, p in probs.items()
+                    if round(p * 100) == 100 and cs[k[0]][k[1]] == STATE_CLOSED]
+        return sorted(safe), sorted(mine)
+
+    def _auto_solve_step(self) -> bool:
+        """100%→깃발, 0%→열기를 한 번 수행. 진전이 있으면 True"""
+        safe, mine = self._definite_cells()
+        progress = False
+
+        # 100% 깃발
+        for r, c in mine:
+            if self.cell_state[r][c] == STATE_CLOSED:
+                self.state.set(r, c, STATE_FLAG)
+                self._draw_cell(r, c)
+                progress = True
+        if progress:
+            self.mine_lbl.config(text=self._lcd(self.mine_count - self.flags_count))
+
+        # 0% 열기 (잘못 꽂힌 깃발 때문에 지뢰가 나오면 chord 처럼 게임 오버)
+        opened, hit = self._open_cells(safe)
+        if hit:
+            self._flush_deferred_draw()
+            self._do_game_over(*hit)
+            return False
+        progress = progress or bool(opened)
+
+        if progress:
+            self._check_win()
+        return progress
+
     def _auto_solve_loop(self):
         """0%→열기, 100%→깃발을 더 이상 진전 없을 때까지 반복"""
         for _ in range(200):  # 무한루프 방지
             if self.game_over or self.game_won:
                 return
-            probs = self._calc_probabilities()
-            progress = False
-
-            # 100% 깃발
-            for (r, c), p in probs.items():
-                if round(p * 100) == 100 and self.cell_state[r][c] == STATE_CLOSED:
-                    self.cell_state[r][c] = STATE_FLAG
-                    self.flags_count += 1
-                    self._draw_cell(r, c)
-                    progress = True
-            if progress:
-                self.mine_lbl.config(text=self._lcd(self.mine_count - self.flags_count))
-
-            # 0% 열기
-            for (r, c), p in probs.items():
-                if round(p * 100) == 0 and self.cell_state[r][c] == STATE_CLOSED:
-                    self._open_cell(r, c)
-                    progress = True
-                    if self.game_over:
-                        return
-
-            if progress:
-                self._check_win()
-            else:
+            if not self._auto_solve_step():
                 break  # 더 이상 진전 없음
 
     def _auto_play(self):
-        """🎲 전자동: 안전→깃발→반복→교착 시 ⭐클릭까지 자동 수행"""
+        """
+        🎲 버튼: 자동 플레이 시작 / 정지.
+        root.after 로 프레임마다 '프레임당 수' 만큼 진행하므로 창이 멈추지 않음.
+        터보 모드는 셀 그리기를 보류하고 끝날 때 보드를 한 번만 다시 그림.
+        """
+        if self._auto_job is not None:
+            self._stop_auto_play()
+            return
         if self.game_over or self.game_won or self.first_click:
             return
-        for _ in range(500):  # 무한루프 방지
-            if self.game_over or self.game_won:
-                break
-            # 먼저 확정적 수를 모두 둠
-            self._auto_solve_loop()
-            if self.game_over or self.game_won:
-                break
-
-            # 교착 상태: 최저 확률 셀 자동 클릭 (⭐)
-            probs = self._calc_probabilities()
-            closed = {(r,c): p for (r,c), p in probs.items()
-                      if self.cell_state[r][c] == STATE_CLOSED}
-            if not closed:
-                break
-            best = min(closed, key=lambda k: closed[k])
-            r, c = best
-            self._open_cell(r, c)
-            if self.game_over:
-                break
-            self._check_win()
-        self._update_hints_if_active()
-
-    def _calc_probabilities(self) -> dict:
+        self.hint_uses += 1
+        self._checkpoint()
+        self._auto_moves = 0
+        self._defer_draw = self.turbo_var.get()
+        self.auto_play_btn.config(text="⏹정지", relief="sunken")
+        self._auto_job = self.root.after(0, self._auto_play_frame)
+
+    def _auto_play_move(self) -> bool:
         """
-        완전 열거 (조합 탐색) + 독립 그룹 분리 방식.
-
-        [알고리즘]
-        1. 제약 수집
-        2. 제약 전파(Propagation): 확정 안전/지뢰 셀 선행 확정
-        3. Union-Find 로 독립 그룹 분리
-        4. 백트래킹 열거 (노드 한도 초과 시 로컬 추정 폴백)
-        5. 그룹 간 Convolution + C(nf,k) 가중치
-        6. 셀별 정확 확률 계산
+        한 수: 확정 수(깃발/열기) 한 번, 없으면 ⭐ 셀 한 번 클릭.
+        계속 둘 수 있으면 True
         """
-        from math import comb
-
-        MAX_GROUP_SIZE = 100      # 이 이상인 그룹 → MC 샘플링 폴백
-        MAX_BT_NODES   = 2_000_000 # 백트래킹 노드 한도 (속도 보호)
-
-        def safe_comb(n, k):
-            return comb(n, k) if 0 <= k <= n else 0
+        if self._auto_solve_step():
+            return not (self.game_over or self.game_won)
+        if self.game_over or self.game_won:
+            return False
 
-        # ── 1. 제약 수집 ──────────────────────────────────
-        raw = []
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.cell_state[r][c] != STATE_OPEN:
-                    continue
-                val = self.board[r][c]
-                if val <= 0:
-                    continue
-                nbrs  = self._neighbors(r, c)
-                flags = sum(1 for nr, nc in nbrs if self.cell_state[nr][nc] == STATE_FLAG)
-                cl = frozenset(
-                    (nr, nc) for nr, nc in nbrs
-                    if self.cell_state[nr][nc] == STATE_CLOSED
-                )
-                if not cl:
-                    continue
-                raw.append((val - flags, cl))
-        cst_set = list(set(raw))
-
-        total_closed    = sum(1 for r in range(self.rows) for c in range(self.cols)
-                              if self.cell_state[r][c] == STATE_CLOSED)
-        total_remaining = self.mine_count - self.flags_count
-        global_prob     = total_remaining / max(1, total_closed)
-
-        # 제약이 없으면 글로벌 확률
-        if not cst_set:
-            return {(r, c): global_prob
-                    for r in range(self.rows) for c in range(self.cols)
-                    if self.cell_state[r][c] == STATE_CLOSED}
-
-        # ── 2. 제약 전파 + Gaussian Elimination ────────────
-        defi_safe = set()
-        defi_mine = set()
-        changed = True
-        while changed:
-            changed = False
-
-            # (a) 기본 전파: rem=0 → safe, rem=len → mine
-            new_cst = []
-            for rem, cl in cst_set:
-                cl2  = frozenset(c for c in cl if c not in defi_safe and c not in defi_mine)
-                rem2 = rem - sum(1 for c in cl if c in defi_mine)
-                if rem2 < 0 or rem2 > len(cl2):
-                    continue
-                if rem2 == 0 and cl2:
-                    defi_safe.update(cl2);  changed = True
-                elif cl2 and rem2 == len(cl2):
-                    defi_mine.update(cl2);  changed = True
-                elif cl2:
-                    new_cst.append((rem2, cl2))
-            cst_set = new_cst
-
-            # (b) Gaussian elimination: 정수 행렬 행 축소
-            if not cst_set:
+        # 교착 상태: 선택된 ⭐ 전략으로 고른 셀 자동 클릭
+        best = self._choose_star(self._calc_probabilities())
+        if best is None:
+            return False
+        r, c = best
+        if self.board[r][c] == -1:
+            self._flush_deferred_draw()
+            self._do_game_over(r, c)
+            return False
+        self._open_cell(r, c)
+        self._check_win()
+        return not self.game_won
+
+    def _choose_star(self, probs):
+        """메뉴에서 고른 ⭐ 전략의 추측 셀 (전략이 바뀌었거나 새 게임이면 새로 생성)"""
+        name = self.strategy_var.get()
+        if self._guess is None or self._guess[0] != name:
+            from strategies import make_strategy
+            self._guess = (name, make_strategy(name))
+        return self._guess[1](self.board, self.cell_state, self.rows, self.cols,
+                              self.mine_count, self.flags_count, probs)
+
+    def _auto_play_frame(self):
+        """after 콜백: 한 프레임 분량 진행 후 다음 프레임 예약"""
+        self._auto_job = None
+        turbo   = self._defer_draw
+        t_end   = time.perf_counter() + AUTO_TURBO_SLICE
+        steps   = self.auto_speed_var.get()
+        running = True
+        for i in range(AUTO_MAX_MOVES):
+            running = self._auto_play_move()
+            self._auto_moves += 1
+            if not running or self._auto_moves >= AUTO_MAX_MOVES:
+                running = False
+                break
+            if (time.perf_counter() >= t_end) if turbo else (i + 1 >= steps):
                 break
 
-            # 변수(셀) 인덱싱
-            all_cells_g = set()
-            for _, cl in cst_set:
-                all_cells_g.update(cl)
-            cell_list = sorted(all_cells_g)
-            cell_idx  = {c: i for i, c in enumerate(cell_list)}
-            n_vars    = len(cell_list)
-            n_rows    = len(cst_set)
-
-            # 행렬 구축: [계수들 | 나머지값]
-            matrix = []
-            for rem, cl in cst_set:
-                row = [0] * (n_vars + 1)
-                for c in cl:
-                    row[cell_idx[c]] = 1
-                row[n_vars] = rem
-                matrix.append(row)
-
-            # 정수 가우스 소거 (피벗 열 순서대로)
-            pivot_row_idx = 0
-            for col in range(n_vars):
-                if pivot_row_idx >= n_rows:
-                    break
-                # 피벗 행 찾기
-                pr = None
-                for r in range(pivot_row_idx, n_rows):
-                    if matrix[r][col] != 0:
-                        pr = r
-                        break
-                if pr is None:
-                    continue
-                matrix[pivot_row_idx], matrix[pr] = matrix[pr], matrix[pivot_row_idx]
-                pv = matrix[pivot_row_idx][col]  # 피벗 값
-
-                # 다른 행에서 이 열 소거
-                for r in range(n_rows):
-                    if r == pivot_row_idx or matrix[r][col] == 0:
-                        continue
-                    factor = matrix[r][col]
-                    for j in range(n_vars + 1):
-                        matrix[r][j] = matrix[r][j] * pv - factor * matrix[pivot_row_idx][j]
-                    # GCD 정규화 (계수 폭발 방지)
-                    from math import gcd
-                    row_gcd = 0
-                    for j in range(n_vars + 1):
-                        row_gcd = gcd(row_gcd, abs(matrix[r][j]))
-                    if row_gcd > 1:
-                        for j in range(n_vars + 1):
-                            matrix[r][j] //= row_gcd
-                pivot_row_idx += 1
-
-            # 축소된 행렬에서 확정 셀 도출
-            for row in matrix:
-                coeffs = row[:n_vars]
-                rem_val = row[n_vars]
-                pos_cells = [cell_list[i] for i in range(n_vars) if coeffs[i] > 0]
-                neg_cells = [cell_list[i] for i in range(n_vars) if coeffs[i] < 0]
-                pos_sum   = sum(coeffs[i] for i in range(n_vars) if coeffs[i] > 0)
-                neg_sum   = sum(-coeffs[i] for i in range(n_vars) if coeffs[i] < 0)
-
-                if not pos_cells and not neg_cells:
-                    continue
-
-                # sum(pos*x) - sum(neg*x) = rem_val
-                # 최솟값: 0 - neg_sum = -neg_sum
-                # 최댓값: pos_sum - 0 = pos_sum
-
-                if len(pos_cells) + len(neg_cells) == 0:
-                    continue
-
-                # 모든 계수가 +1인 경우 (서브셋 추론 포함)
-                if not neg_cells and all(coeffs[cell_idx[c]] == 1 for c in pos_cells):
-                    if rem_val == 0:
-                        defi_safe.update(pos_cells); changed = True
-                    elif rem_val == len(pos_cells):
-                        defi_mine.update(pos_cells); changed = True
-
-                # 단일 변수: coeff * x = rem → x = rem / coeff
-                non_zero = [(i, coeffs[i]) for i in range(n_vars) if coeffs[i] != 0]
-                if len(non_zero) == 1:
-                    i, c = non_zero[0]
-                    if c != 0 and rem_val % c == 0:
-                        v = rem_val // c
-                        if v == 0:
-                            defi_safe.add(cell_list[i]); changed = True
-                        elif v == 1:
-                            defi_mine.add(cell_list[i]); changed = True
-
-                # ±1 혼합: 극단값 체크
-                # pos_cells 전부 1 + neg_cells 전부 0 → rem = pos_sum
-                # pos_cells 전부 0 + neg_cells 전부 1 → rem = -neg_sum
-                if pos_cells and neg_cells:
-                    if rem_val == pos_sum:
-                        # pos 전부 mine, neg 전부 safe
-                        defi_mine.update(pos_cells); changed = True
-                        defi_safe.update(neg_cells); changed = True
-                    elif rem_val == -neg_sum:
-                        # pos 전부 safe, neg 전부 mine
-                        defi_safe.update(pos_cells); changed = True
-                        defi_mine.update(neg_cells); changed = True
-
-        # ── 3. 확정 셀 제외 후 frontier 재구성 ──────────
-        frontier = set()
-        for _, cl in cst_set:
-            frontier.update(cl)
-
-        # ── 4. Union-Find 그룹 분리 ──────────────────────
-        parent = {cell: cell for cell in frontier}
-        def find(x):
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]
-                x = parent[x]
-            return x
-        def union(x, y):
-            px, py = find(x), find(y)
-            if px != py:
-                parent[px] = py
-
-        for _, cl in cst_set:
-            it = iter(cl); f = next(it)
-            for cell in it:
-                union(f, cell)
-
-        groups = {}
-        for cell in frontier:
-            groups.setdefault(find(cell), []).append(cell)
-        group_cst = {root: [] for root in groups}
-        for rem, cl in cst_set:
-            group_cst[find(next(iter(cl)))].append((rem, cl))
-
-        # ── 5. 그룹 백트래킹 열거 ─────────────────────────
-        def enumerate_group(cells, cst, randomize=False):
-            n       = len(cells)
-            cst_cnt = {cell: 0 for cell in cells}
-            for _, cl in cst:
-                for c in cl:
-                    cst_cnt[c] += 1
-            cells = sorted(cells, key=lambda c: -cst_cnt[c])
-
-            idx_map = {cell: i for i, cell in enumerate(cells)}
-            cell_cst_idx = [[] for _ in range(n)]
-            cst_list     = []
-            for ci, (rem, cl) in enumerate(cst):
-                cst_list.append((rem, cl))
-                for c in cl:
-                    cell_cst_idx[idx_map[c]].append(ci)
-
-            assignment = [0] * n
-            results    = []
-            nodes      = [0]
-            aborted    = [False]
-
-            def bt(pos, mines):
-                if aborted[0]:
-                    return
-                nodes[0] += 1
-                if nodes[0] > MAX_BT_NODES:
-                    aborted[0] = True
-                    return
-                if pos == n:
-                    results.append((tuple(assignment), mines))
-                    return
-                vals = (0, 1)
-                if randomize:
-                    import random as _rng
-                    vals = (0, 1) if _rng.random() < 0.5 else (1, 0)
-                for val in vals:
-                    ok = True
-                    for ci in cell_cst_idx[pos]:
-                        rem, cl = cst_list[ci]
-                        m = u = 0
-                        for c in cl:
-                            j = idx_map[c]
-                            if   j < pos:  m += assignment[j]
-                            elif j == pos: m += val
-                            else:          u += 1
-                        if m > rem or (rem - m) > u:
-                            ok = False; break
-                    if ok:
-                        assignment[pos] = val
-                        bt(pos + 1, mines + val)
-                        assignment[pos] = 0
-
-            bt(0, 0)
-            if not results:
-                return None
-            return (results, cells)  # (배치목록, 정렬된셀)
-
-        # ── 6. 그룹별 계산 ───────────────────────────────
-        group_data     = {}
-        fallback_cells = set()
-
-        for root, cells in groups.items():
-            if len(cells) > MAX_GROUP_SIZE:
-                # 대그룹: 부분 열거 (randomize로 편향 감소)
-                result = enumerate_group(cells, group_cst[root], randomize=True)
-                if result is not None:
-                    group_data[root] = (result[1], result[0])
-                else:
-                    fallback_cells.update(cells)
-                continue
-            result = enumerate_group(cells, group_cst[root])
-            if result is None:
-                fallback_cells.update(cells)
-                continue
-            sorted_cells, configs = result[1], result[0]
-            group_data[root] = (sorted_cells, configs)
-
-        # ── 7. Convolution + C(nf,k) 가중치 ─────────────
-        def convolve(d1, d2):
-            out = {}
-            for m1, c1 in d1.items():
-                for m2, c2 in d2.items():
-                    k = m1 + m2
-                    out[k] = out.get(k, 0) + c1 * c2
-            return out
-
-        total_dist  = {0: 1}
-        group_dists = {}
-        for root, (_, configs) in group_data.items():
-            d = {}
-            for _, mc in configs:
-                d[mc] = d.get(mc, 0) + 1
-            group_dists[root] = d
-            total_dist = convolve(total_dist, d)
-
-        adj_nf = max(0, (total_closed - len(frontier) - len(defi_safe) - len(defi_mine))
-                     + len(fallback_cells))
-
-        total_weight = sum(
-            cnt * safe_comb(adj_nf, total_remaining - len(defi_mine) - m)
-            for m, cnt in total_dist.items()
-        )
+        if running:
+            if not turbo:
+                self._update_hints_if_active()
+            self._auto_job = self.root.after(1 if turbo else AUTO_FRAME_MS,
+                                             self._auto_play_frame)
+        else:
+            self._finish_auto_play()
 
-        probs = {}
-        for cell in defi_safe:
-            probs[cell] = 0.0
-        for cell in defi_mine:
-            probs[cell] = 1.0
-
-        if total_weight > 0:
-            for j_root, (j_cells, j_configs) in group_data.items():
-                j_map = {cell: i for i, cell in enumerate(j_cells)}
-                other_dist = {0: 1}
-                for k_root, k_dist in group_dists.items():
-                    if k_root != j_root:
-                        other_dist = convolve(other_dist, k_dist)
-
-                rem_base = total_remaining - len(defi_mine)
-                for cell in j_cells:
-                    ci = j_map[cell]
-                    mine_w = sum(
-                        c_o * safe_comb(adj_nf, rem_base - m_j - m_o)
-                        for asgn, m_j in j_configs if asgn[ci] == 1
-                        for m_o, c_o in other_dist.items()
-                    )
-                    probs[cell] = mine_w / total_weight
+    def _stop_auto_play(self):
+        if self._auto_job is not None:
+            self.root.after_cancel(self._auto_job)
+            self._auto_job = None
+        self._finish_auto_play()
 
-            # 비-frontier / fallback 셀 확률
-            rem_base = total_remaining - len(defi_mine)
-            nf_w = sum(cnt * safe_comb(adj_nf - 1, rem_base - m - 1)
-                       for m, cnt in total_dist.items()) if adj_nf > 0 else 0
-            nf_prob = nf_w / total_weight if adj_nf > 0 else 0.0
-        else:
-            nf_prob = global_prob
+    def _finish_auto_play(self):
+        self._flush_deferred_draw()
+        self.auto_play_btn.config(text="🎲자동", relief="raised")
+        self._update_hints_if_active()
 
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.cell_state[r][c] != STATE_CLOSED:
-                    continue
-                cell = (r, c)
-                if cell not in probs:
-                    probs[cell] = nf_prob
+    def _flush_deferred_draw(self):
+        """터보 모드에서 보류한 그리기를 보드 전체 한 번으로 반영"""
+        if self._defer_draw:
+            self._defer_draw = False
+            self._draw_board()
 
-        return probs
+    def _calc_probabilities(self) -> dict:
+        """닫힌 셀별 지뢰 확률 (solver.calc_probabilities 참고)"""
+        from solver import calc_probabilities
+        return calc_probabilities(
+            self.board, self.cell_state, self.rows, self.cols,
+            self.mine_count, self.flags_count,
+        )
 
     def _show_hints(self):
-        """힌트 오버레이를 캔버스에 그림 (태그 'hint')"""
+        """
+        힌트 오버레이를 캔버스에 그림 (태그 'hint').
+        히트맵 모드면 확률은 색 이미지 한 장으로, 글자는 0% / 100% / ⭐ 셀만.
+        """
         self.canvas.delete("hint")
         if self.first_click or self.game_over or self.game_won:
             return
@@ -1335,21 +1328,27 @@ class Minesweeper:
         fs       = max(9, CELL_SIZE // 5)       # 폰트 크기
         fs_small = max(7, CELL_SIZE // 7)       # 작은 폰트 (글로벌 확률용)
 
-        # 0% 셀이 없을 경우, 최저 확률 셀을 '추천 클릭' 셀로 표시
+        # 0% 셀이 없을 경우, 🎲 자동 플레이와 같은 ⭐ 전략으로 고른 셀을 '추천 클릭' 셀로 표시
         has_safe = any(round(p * 100) == 0 for p in probs.values())
         best_cell = None
         if not has_safe and probs:
             min_p = min(probs.values())
             if round(min_p * 100) < 100:  # 전부 100%가 아닐 때만
-                best_cell = min(probs, key=lambda k: probs[k])
+                best_cell = self._choose_star(probs)
+
+        heatmap = self.heatmap_var.get()
+        if heatmap:
+            self._draw_heatmap(probs)
 
         for (r, c), p in probs.items():
+            pct = round(p * 100)
+            if heatmap and 0 < pct < 100 and (r, c) != best_cell:
+                continue
+
             x0, y0 = self._xy(r, c)
             cx = x0 + CELL_SIZE // 2
             cy = y0 + CELL_SIZE // 2
 
-            pct = round(p * 100)
-
             if (r, c) == best_cell:
                 # ⭐ 추천 셀 — 가장 낮은 확률
                 text  = f"⭐{pct}%"
@@ -1384,6 +1383,49 @@ class Minesweeper:
                 cx, cy, text=text, font=font, fill=color, tags="hint"
             )
 
+    def _draw_heatmap(self, probs):
+        """
+        확률 히트맵: 셀 하나 = 1px 인 작은 이미지에 바뀐 칸만 행 단위로 put 하고,
+        바뀐 구간만 CELL_SIZE 배 확대 복사해 보드 크기 이미지 한 장을 갱신한다.
+        닫힌 셀이 아닌 칸은 투명 (아래 셀이 그대로 보임).
+        """
+        rows, cols, cs = self.rows, self.cols, self.cell_state
+        heat = self._heat
+        if heat is None or heat["size"] != (rows, cols):
+            small = tk.PhotoImage(master=self.root, width=cols, height=rows)
+            big   = tk.PhotoImage(master=self.root,
+                                  width=cols * CELL_SIZE, height=rows * CELL_SIZE)
+            heat  = self._heat = {"size": (rows, cols), "small": small, "big": big,
+                                  "grid": [[None] * cols for _ in range(rows)]}
+        small, big, grid = heat["small"], heat["big"], heat["grid"]
+
+        for r in range(rows):
+            srow = cs[r]
+            new  = [HEAT_COLORS[round(probs[(r, c)] * 100)]
+                    if srow[c] == STATE_CLOSED and (r, c) in probs else None
+                    for c in range(cols)]
+            old = grid[r]
+            if new == old:
+                continue
+            # 더러운 구간 [a, b]
+            a = next(c for c in range(cols) if new[c] != old[c])
+            b = next(c for c in range(cols - 1, -1, -1) if new[c] != old[c])
+            span = new[a:b + 1]
+            if None in span:
+                # 투명 칸은 put 으로 못 만드니 구간 전체를 put 한 뒤 하나씩 투명 처리
+                small.put("{" + " ".join(col or "#000000" for col in span) + "}", to=(a, r))
+                for c in range(a, b + 1):
+                    if new[c] is None:
+                        small.transparency_set(c, r, True)
+            else:
+                small.put("{" + " ".join(span) + "}", to=(a, r))
+            big.tk.call(big, "copy", small, "-from", a, r, b + 1, r + 1,
+                        "-to", a * CELL_SIZE, r * CELL_SIZE,
+                        "-zoom", CELL_SIZE, CELL_SIZE, "-compositingrule", "set")
+            grid[r] = new
+
+        self.canvas.create_image(0, 0, image=big, anchor="nw", tags=("hint", "heat"))
+
     def _update_hints_if_active(self):
         """힌트 모드가 켜져 있으면 자동 갱신"""
         if self._hint_mode and not self.first_click:
@@ -1425,6 +1467,10 @@ class Minesweeper:
             val = self.records.get(diff)
             record_str = f"{val}초" if val is not None else "기록 없음"
             lines.append(f"  {diff}  :  {record_str}")
+            st = self.history.stats(*DIFFICULTIES[diff])
+            if st:
+                lines.append(f"          {st['wins']}/{st['games']}승 · "
+                             f"연승 {st['cur_streak']} (최고 {st['best_streak']})")
         lines.append("─" * 22)
         messagebox.showinfo("최고 기록", "\n".join(lines))
 
@@ -1497,6 +1543,14 @@ class CustomDialog:
 #  진입점
 # ─────────────────────────────────────────────
 def main():
+    # 인자가 있으면 명령줄 모드 (python minesweeper.py bench ... / play --profile)
+    if len(sys.argv) > 1:
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    run_gui()
+
+
+def run_gui(profile: bool = False, startup_probe: bool = False):
     root = tk.Tk()
 
     # DPI 인식 (Windows)
@@ -1506,8 +1560,30 @@ def main():
     except Exception:
         pass
 
-    Minesweeper(root)
+    game = Minesweeper(root, profile=profile)
+    if startup_probe:
+        _probe_startup(root)
     root.mainloop()
+    game._shutdown_no_guess()
+    if game._history is not None:
+        game.history.close()
+    if game.profiler is not None:
+        game.profiler.dump()
+
+
+def _probe_startup(root):
+    """
+    startup 벤치마크용 (cli.py startup): 첫 프레임이 그려진 시각과
+    이벤트 루프가 입력을 받기 시작한 시각(epoch 초)을 JSON 한 줄로 출력하고 종료
+    """
+    root.update()                    # 창 매핑 + 첫 그리기
+    first_frame = time.time()
+
+    def ready():
+        print(json.dumps({"first_frame": first_frame, "interactive": time.time()}),
+              flush=True)
+        root.destroy()
+    root.after_idle(ready)           # mainloop 진입 후 첫 idle
 
 
 if __name__ == "__main__":
@@ -0,0 +1,228 @@
+"""
+노게스(No-Guess) 보드 생성
+==========================
+- 무작위 보드를 만든 뒤 결정적 풀이(제약 전파 + Gaussian Elimination
+  + 전역 지뢰 수)만으로 첫 클릭부터 끝까지 풀리는지 검증
+- 막히면 막힌 경계의 지뢰 하나를 아무 정보도 없는 안쪽 칸으로 옮겨
+  다시 검증 (수리), 수리 한도를 넘으면 폐기 후 새로 생성
+- NoGuessPool: 백그라운드 프로세스 풀이 (크기, 지뢰 수, 첫 클릭 위치)
+  별로 완성된 보드를 몇 개씩 미리 쌓아 두어 첫 클릭이 바로 끝나도록 함
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from mineboard import (
+    STATE_CLOSED, STATE_OPEN, STATE_FLAG,
+    sample_mine_mask, numbers_from_mask, safe_zone, neighbors, open_cells,
+)
+from solver import collect_constraints, propagate
+
+MAX_REPAIRS = 60     # 보드 하나당 지뢰 이동 수리 한도
+POOL_JOB_BUDGET = 30.0   # 백그라운드 작업 하나의 최대 생성 시간 (초)
+
+
+# ─────────────────────────────────────────────
+#  결정적 풀이 검증
+# ─────────────────────────────────────────────
+def solve_without_guessing(board, rows, cols, n_mines, safe_r, safe_c):
+    """
+    추측 없이 풀리는지 검증 → (성공 여부, 마지막 cell_state)
+    실패 시 cell_state 는 더 이상 확정 셀이 없는 막힌 상태.
+    """
+    cs = [[STATE_CLOSED] * cols for _ in range(rows)]
+    open_cells(board, cs, safe_r, safe_c, rows, cols)
+    ok, _ = solve_from(board, cs, rows, cols, n_mines)
+    return ok, cs
+
+
+def solve_from(board, cs, rows, cols, n_mines, flags=0):
+    """
+    현재 cell_state 에서 확정 셀이 없을 때까지 결정적으로 진행 (cs 를 직접 갱신)
+    → (클리어 여부, 깃발 수)
+    """
+    while True:
+        cst, total_closed = collect_constraints(board, cs, rows, cols)
+        remaining = n_mines - flags
+        if total_closed == remaining:
+            return True, flags       # 남은 닫힌 셀이 전부 지뢰 → 클리어
+
+        if remaining == 0:
+            defi_safe = {(r, c) for r in range(rows) for c in range(cols)
+                         if cs[r][c] == STATE_CLOSED}
+            defi_mine = set()
+        elif cst:
+            defi_safe, defi_mine, _ = propagate(cst)
+        else:
+            return False, flags
+        if not defi_safe and not defi_mine:
+            return False, flags
+
+        for r, c in defi_mine:
+            if cs[r][c] == STATE_CLOSED:
+                cs[r][c] = STATE_FLAG
+                flags += 1
+        for r, c in defi_safe:
+            if board[r][c] == -1:
+                return False, flags  # 전파 결과 모순 (정상이라면 발생하지 않음)
+            open_cells(board, cs, r, c, rows, cols)
+
+
+def _repair(mask, cs, rows, cols, safe, rng):
+    """
+    막힌 경계(열린 셀에 닿은 닫힌 셀)의 지뢰 하나를
+    열린 셀과 닿지 않은 안쪽 빈 칸으로 옮김. 옮길 곳이 없으면 False.
+    """
+    frontier_mines, interior = [], []
+    for r in range(rows):
+        for c in range(cols):
+            if cs[r][c] == STATE_OPEN or r * cols + c in safe:
+                continue
+            touches_open = any(cs[nr][nc] == STATE_OPEN
+                               for nr, nc in neighbors(r, c, rows, cols))
+            if touches_open:
+                if mask[r][c]:
+                    frontier_mines.append((r, c))
+            elif not mask[r][c]:
+                interior.append((r, c))
+    if not frontier_mines or not interior:
+        return False
+    fr, fc = rng.choice(frontier_mines)
+    ir, ic = rng.choice(interior)
+    mask[fr][fc], mask[ir][ic] = 0, 1
+    return True
+
+
+def generate_no_guess_board(rows: int, cols: int, n_mines: int,
+                            safe_r: int, safe_c: int,
+                            rng=random, deadline=None):
+    """
+    첫 클릭 (safe_r, safe_c) 에서 추측 없이 풀리는 보드 생성.
+    deadline (time.perf_counter 기준) 을 넘기면 None.
+    """
+    safe = set(safe_zone(rows, cols, safe_r, safe_c))
+    while deadline is None or time.perf_counter() < deadline:
+        mask = sample_mine_mask(rows, cols, n_mines, safe_r, safe_c, rng)
+        for _ in range(MAX_REPAIRS):
+            board = numbers_from_mask(mask)
+            ok, cs = solve_without_guessing(board, rows, cols, n_mines, safe_r, safe_c)
+            if ok:
+                return board
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
+            if not _repair(mask, cs, rows, cols, safe, rng):
+                break                # 수리 불가 → 폐기 후 재생성
+    return None
+
+
+# ─────────────────────────────────────────────
+#  백그라운드 보드 풀
+# ─────────────────────────────────────────────
+def _pool_job(rows, cols, n_mines, safe_r, safe_c, seed, budget=POOL_JOB_BUDGET):
+    """
+    워커 프로세스에서 실행: 성공하거나 budget 초가 지날 때까지 생성 (실패 시 None).
+    너무 빽빽하거나 노게스 보드가 없는 설정에서도 작업이 끝나도록 시간을 자른다.
+    """
+    return generate_no_guess_board(rows, cols, n_mines, safe_r, safe_c,
+                                   rng=random.Random(seed),
+                                   deadline=time.perf_counter() + budget)
+
+
+def _canonical(rows, cols, r, c):
+    """좌우/상하 대칭을 접은 대표 클릭 위치 + 뒤집기 여부"""
+    flip_r = r > rows - 1 - r
+    flip_c = c > cols - 1 - c
+    return ((rows - 1 - r) if flip_r else r,
+            (cols - 1 - c) if flip_c else c,
+            flip_r, flip_c)
+
+
+def _flip(board, flip_r, flip_c):
+    if flip_c:
+        board = [row[::-1] for row in board]
+    if flip_r:
+        board = board[::-1]
+    return board
+
+
+class NoGuessPool:
+    """
+    (rows, cols, mines, 대표 클릭 위치) 별로 노게스 보드를 depth 개씩 보관.
+    보드는 좌우/상하 대칭으로 뒤집어도 노게스이므로
+    대칭인 네 클릭 위치가 버퍼 하나를 공유한다.
+    """
+
+    def __init__(self, workers: int = 1, depth: int = 2):
+        self.workers   = workers
+        self.depth     = depth
+        self._executor = None
+        self._buffers  = {}     # key → deque[board]
+        self._inflight = {}     # key → 생성 중인 작업 수
+        self._lock     = threading.Lock()
+        self._rng      = random.Random()
+
+    def _key(self, rows, cols, n_mines, r, c):
+        cr, cc, flip_r, flip_c = _canonical(rows, cols, r, c)
+        return (rows, cols, n_mines, cr, cc), flip_r, flip_c
+
+    def prefetch(self, rows: int, cols: int, n_mines: int, clicks):
+        """clicks 의 각 위치에 대해 버퍼가 depth 개가 되도록 작업 예약"""
+        for r, c in clicks:
+            key, _, _ = self._key(rows, cols, n_mines, r, c)
+            self._fill(key)
+
+    def take(self, rows: int, cols: int, n_mines: int, r: int, c: int):
+        """버퍼에서 보드 하나 꺼냄 (없으면 None). 꺼낸 만큼 다시 채움."""
+        key, flip_r, flip_c = self._key(rows, cols, n_mines, r, c)
+        with self._lock:
+            buf   = self._buffers.get(key)
+            board = buf.popleft() if buf else None
+        self._fill(key)
+        return _flip(board, flip_r, flip_c) if board is not None else None
+
+    def ready(self, rows: int, cols: int, n_mines: int, r: int, c: int) -> int:
+        key, _, _ = self._key(rows, cols, n_mines, r, c)
+        with self._lock:
+            return len(self._buffers.get(key, ()))
+
+    def _fill(self, key):
+        with self._lock:
+            have = len(self._buffers.get(key, ())) + self._inflight.get(key, 0)
+            need = self.depth - have
+            if need <= 0:
+                return
+            self._inflight[key] = self._inflight.get(key, 0) + need
+            seeds = [self._rng.getrandbits(64) for _ in range(need)]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        for seed in seeds:
+            fut = self._executor.submit(_pool_job, *key, seed)
+            fut.add_done_callback(lambda f, k=key: self._on_done(k, f))
+
+    def _on_done(self, key, fut):
+        with self._lock:
+            self._inflight[key] -= 1
+            if fut.cancelled() or fut.exception() is not None:
+                return
+            board = fut.result()
+            if board is not None:
+                self._buffers.setdefault(key, deque()).append(board)
+
+    def shutdown(self):
+        """
+        대기 작업 취소 + 실행 중인 워커 프로세스 강제 종료.
+        cancel_futures 는 이미 도는 생성 작업을 멈추지 못하므로, 기다리지 않고
+        프로세스를 끝내 게임 창 종료가 생성 작업에 묶이지 않게 한다.
+        """
+        if self._executor is not None:
+            procs = list((getattr(self._executor, "_processes", None) or {}).values())
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            for proc in procs:
+                if proc.is_alive():
+                    proc.terminate()
+            for proc in procs:
+                proc.join(1.0)
+            self._executor = None
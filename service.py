@@ -0,0 +1,295 @@
+"""
+로컬 solver 서비스
+==================
+python minesweeper.py serve --port 8765 -j 4          # 서버
+python minesweeper.py serve-bench --positions 2000    # 처리량 측정 (서버를 직접 띄움)
+
+게임 창 없이 같은 확률 엔진을 다른 도구 (봇, 분석 노트북, 웹 프런트엔드) 에서
+쓰기 위한 localhost HTTP 서비스. 표준 라이브러리만 쓴다.
+
+- 국면 인코딩: 행을 '/' 로 이은 문자열, 셀마다 한 글자
+    '0'~'8' 열린 숫자 · '.' 닫힘 · 'F' 깃발 · '?' 물음표
+  예) {"board": "..1/.21/F10", "mines": 2}
+- POST /solve   {"positions": [국면, ...]} → {"results": [결과, ...]} (같은 순서)
+  결과: probs (행 우선, 닫힌 셀만 값 · 나머지 null), safe / mines (확정 셀 [r, c]),
+        stats (solver 통계 + time_ms, cached, feasible). 모순 국면 (feasible 거짓)
+        은 probs 가 모두 null 이고 safe / mines 가 비어 있다.
+        인코딩이 틀리거나 MAX_CELLS 를 넘거나 지뢰 수가 깃발 수 ~ 깃발 수 + 닫힌
+        셀 수 밖인 국면, 풀이 중 예외가 난 국면은 그 자리에 {"error": 메시지},
+        요청 형식이 틀리면 400, 작업자 풀 자체가 죽으면 500
+- GET /health  → 작업자 수, 결과 캐시 크기 · 적중 수
+- 한 요청의 국면들은 작업자 프로세스 풀에 나눠 푼다. 작업자는 서버 수명 동안
+  유지되므로 solver 의 성분 캐시가 요청 사이에 이어지고, 같은 국면의 결과는
+  서버 쪽 LRU 캐시에서 바로 돌려준다.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG, STATE_QUESTION
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+RESULT_CACHE_SIZE = 10_000    # 서버 결과 캐시 항목 수 (LRU)
+MAX_BATCH = 1_000             # 요청 하나의 최대 국면 수
+MAX_CELLS = 10_000            # 국면 하나의 최대 셀 수 (rows × cols)
+
+_STATE_CHARS = {".": STATE_CLOSED, "F": STATE_FLAG, "?": STATE_QUESTION}
+_CHAR_OF = {STATE_CLOSED: ".", STATE_FLAG: "F", STATE_QUESTION: "?"}
+
+
+# ─────────────────────────────────────────────
+#  국면 인코딩
+# ─────────────────────────────────────────────
+def encode_position(board, cell_state) -> str:
+    """(board, cell_state) → 국면 문자열 (닫힌 셀의 정답은 담지 않음)"""
+    return "/".join(
+        "".join(str(v) if s == STATE_OPEN else _CHAR_OF.get(s, ".")
+                for v, s in zip(vrow, srow))
+        for vrow, srow in zip(board, cell_state)
+    )
+
+
+def decode_position(text: str):
+    """국면 문자열 → (board, cell_state, rows, cols). 형식이 틀리면 ValueError"""
+    lines = text.split("/")
+    rows, cols = len(lines), len(lines[0])
+    if not cols or any(len(line) != cols for line in lines):
+        raise ValueError("모든 행의 길이가 같아야 합니다")
+    if rows * cols > MAX_CELLS:
+        raise ValueError(f"보드가 너무 큽니다 ({rows}×{cols}, 최대 {MAX_CELLS}셀)")
+    board = [[0] * cols for _ in range(rows)]
+    cs    = [[STATE_CLOSED] * cols for _ in range(rows)]
+    for r, line in enumerate(lines):
+        for c, ch in enumerate(line):
+            if ch in _STATE_CHARS:
+                cs[r][c] = _STATE_CHARS[ch]
+            elif "0" <= ch <= "8":
+                board[r][c], cs[r][c] = int(ch), STATE_OPEN
+            else:
+                raise ValueError(f"알 수 없는 셀 문자 {ch!r} ({r}, {c})")
+    return board, cs, rows, cols
+
+
+def solve_encoded(text: str, mines: int) -> dict:
+    """국면 하나 풀기 (작업자 프로세스에서 실행). 지뢰 수가 불가능하면 ValueError"""
+    from solver import solve_position
+    board, cs, rows, cols = decode_position(text)
+    flags  = sum(row.count(STATE_FLAG) for row in cs)
+    closed = sum(row.count(STATE_CLOSED) for row in cs)
+    if not flags <= mines <= flags + closed:
+        raise ValueError(f"지뢰 수 {mines} 는 깃발 {flags}개 ~ 깃발 + 닫힌 셀 "
+                         f"{flags + closed}개 사이여야 합니다")
+    stats = {}
+    t0 = time.perf_counter()
+    probs, weight = solve_position(board, cs, rows, cols, mines, flags, stats)
+    stats["time_ms"] = round((time.perf_counter() - t0) * 1e3, 3)
+    stats["feasible"] = weight > 0
+    if not weight:              # 모순 국면: 확률이 의미 없으므로 돌려주지 않음
+        probs = {}
+    flat = [None] * (rows * cols)
+    for (r, c), p in probs.items():
+        flat[r * cols + c] = round(p, 6)
+    return {
+        "rows": rows, "cols": cols, "probs": flat,
+        "safe":  sorted([r, c] for (r, c), p in probs.items() if round(p * 100) == 0),
+        "mines": sorted([r, c] for (r, c), p in probs.items() if round(p * 100) == 100),
+        "stats": stats,
+    }
+
+
+def _solve_item(item):
+    text, mines = item
+    try:
+        return solve_encoded(text, mines)
+    except ValueError as e:
+        return {"error": str(e)}
+    except Exception as e:      # 작업자 예외가 요청 전체를 끊지 않게 국면 자리에 남김
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+# ─────────────────────────────────────────────
+#  서버
+# ─────────────────────────────────────────────
+class SolverService:
+    """작업자 풀 + 결과 캐시. HTTP 없이 solve_batch 로 바로 써도 된다."""
+
+    def __init__(self, workers: int = 1, cache_size: int = RESULT_CACHE_SIZE):
+        self.workers = max(1, workers)
+        self._pool   = None
+        if self.workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._cache  = OrderedDict()     # (국면, 지뢰 수) → 결과
+        self._lock   = threading.Lock()
+        self.cache_size = cache_size
+        self.stats   = {"requests": 0, "positions": 0, "cache_hits": 0}
+
+    def solve_batch(self, positions):
+        """[{"board": str, "mines": int}, ...] → 결과 목록 (같은 순서)"""
+        items = []
+        for pos in positions:
+            if not isinstance(pos, dict) or not isinstance(pos.get("board"), str) \
+                    or not isinstance(pos.get("mines"), int):
+                raise ValueError('국면은 {"board": 문자열, "mines": 정수} 형식이어야 합니다')
+            items.append((pos["board"], pos["mines"]))
+
+        results, misses = [None] * len(items), {}
+        with self._lock:
+            self.stats["requests"]  += 1
+            self.stats["positions"] += len(items)
+            for i, key in enumerate(items):
+                hit = self._cache.get(key)
+                if hit is not None:
+                    self._cache.move_to_end(key)
+                    self.stats["cache_hits"] += 1
+                    results[i] = dict(hit, stats=dict(hit["stats"], cached=True))
+                else:
+                    misses.setdefault(key, []).append(i)
+
+        keys = list(misses)
+        if self._pool is not None and len(keys) > 1:
+            chunk  = max(1, len(keys) // (self.workers * 4))
+            solved = list(self._pool.map(_solve_item, keys, chunksize=chunk))
+        else:
+            solved = [_solve_item(key) for key in keys]
+
+        with self._lock:
+            for key, res in zip(keys, solved):
+                if "error" not in res:
+                    res["stats"]["cached"] = False
+                    self._cache[key] = res
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+                for i in misses[key]:
+                    results[i] = res
+        return results
+
+    def health(self) -> dict:
+        with self._lock:
+            return dict(self.stats, workers=self.workers, cache_size=len(self._cache))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service = None      # make_server 가 채움
+
+    def _reply(self, code, obj):
+        body = json.dumps(obj, ensure_ascii=False).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(200, self.service.health())
+        else:
+            self._reply(404, {"error": "없는 경로"})
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._reply(404, {"error": "없는 경로"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            req = json.loads(self.rfile.read(length))
+            positions = req["positions"]
+            if not isinstance(positions, list) or len(positions) > MAX_BATCH:
+                raise ValueError(f"positions 는 최대 {MAX_BATCH}개의 목록이어야 합니다")
+            results = self.service.solve_batch(positions)
+        except (ValueError, KeyError, TypeError) as e:
+            self._reply(400, {"error": str(e)})
+            return
+        except Exception as e:          # 작업자 풀 고장 등
+            self._reply(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._reply(200, {"results": results})
+
+    def log_message(self, fmt, *args):    # 요청마다 stderr 출력하지 않음
+        pass
+
+
+def make_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: int = 1):
+    """ThreadingHTTPServer (server.service 로 SolverService 접근). port=0 이면 빈 포트"""
+    service = SolverService(workers)
+    handler = type("Handler", (_Handler,), {"service": service})
+    server  = ThreadingHTTPServer((host, port), handler)
+    server.service = service
+    return server
+
+
+# ─────────────────────────────────────────────
+#  클라이언트 / 처리량 벤치마크
+# ─────────────────────────────────────────────
+class SolverClient:
+    def __init__(self, url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"):
+        self.url = url.rstrip("/")
+
+    def solve(self, positions):
+        """국면 dict 목록 → 결과 목록"""
+        import urllib.request
+        req = urllib.request.Request(
+            self.url + "/solve", data=json.dumps({"positions": positions}).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(req) as resp:
+            return json.loads(resp.read())["results"]
+
+    def health(self) -> dict:
+        import urllib.request
+        with urllib.request.urlopen(self.url + "/health") as resp:
+            return json.loads(resp.read())
+
+
+def sample_positions(rows: int, cols: int, mines: int, n: int, seed: int = 0):
+    """
+    벤치마크용 국면 n 개: 첫 클릭 뒤 경계의 안전 셀을 0~몇 개 더 열어
+    게임 중반까지 고르게 퍼진 국면 (정답으로 여는 것이라 solver 는 쓰지 않음)
+    """
+    import random
+    from mineboard import generate_board, neighbors, open_cells
+    rng, out = random.Random(seed), []
+    sr, sc = rows // 2, cols // 2
+    while len(out) < n:
+        board, _ = generate_board(rows, cols, mines, sr, sc, rng)
+        cs = [[STATE_CLOSED] * cols for _ in range(rows)]
+        open_cells(board, cs, sr, sc, rows, cols)
+        for _ in range(rng.randrange(0, 12)):
+            edge = [(r, c) for r in range(rows) for c in range(cols)
+                    if cs[r][c] == STATE_CLOSED and board[r][c] != -1
+                    and any(cs[nr][nc] == STATE_OPEN for nr, nc in neighbors(r, c, rows, cols))]
+            if not edge:
+                break
+            open_cells(board, cs, *rng.choice(edge), rows, cols)
+        out.append({"board": encode_position(board, cs), "mines": mines})
+    return out
+
+
+def run_client_bench(client, positions, batch: int = 50) -> dict:
+    """positions 를 batch 개씩 보내 처리량 측정 (positions/s, 요청 지연)"""
+    from simulate import percentile
+    lat = []
+    t0 = time.perf_counter()
+    for i in range(0, len(positions), batch):
+        t = time.perf_counter()
+        client.solve(positions[i:i + batch])
+        lat.append(time.perf_counter() - t)
+    total = time.perf_counter() - t0
+    lat.sort()
+    return {
+        "positions": len(positions), "batch": batch, "requests": len(lat),
+        "time_s": round(total, 3),
+        "positions_per_s": round(len(positions) / total, 1) if total else None,
+        "request_ms": {"p50": round(percentile(lat, 50) * 1e3, 2),
+                       "p95": round(percentile(lat, 95) * 1e3, 2),
+                       "max": round(lat[-1] * 1e3, 2)},
+    }
@@ -0,0 +1,367 @@
+"""
+창 없는 게임 시뮬레이션 / 벤치마크
+==================================
+- play_game: 보드 1판을 solver + ⭐ 전략으로 끝까지 진행
+- run_benchmark: N판을 (선택적으로 여러 프로세스에서) 진행하고
+  games/sec, 클리어율, False Safe 수, solver 지연 백분위, 최대 메모리 집계
+- 같은 seed 면 같은 보드 → 백엔드(SOLVERS)/전략 간 비교 가능
+- 판마다 보드 난이도 지표(metrics.py)를 붙인다. 강제 추측 횟수는 풀이를 한 번
+  더 돌리는 셈이라 (고급 기준 전체 시간의 약 40%) forced_guesses=True 일 때만 세고,
+  그때 결과를 강제 추측 횟수 구간별로 나눠 집계 (시간은 games/sec 에 포함)
+- batch 를 주면 batchsim.play_batch 로 K 판씩 lock-step 진행. 보드 지표는
+  forced_guesses=True 일 때만 seed 로 같은 보드를 다시 만들어 붙인다
+- run_arena: 여러 ⭐ 전략(strategies.py)을 같은 seed 보드에서 진행해
+  클리어율 95% 신뢰구간과 수당 시간 비교
+
+명령줄 진입점은 cli.py (python minesweeper.py bench ...) 참고.
+"""
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+
+try:
+    import resource           # Unix 전용 (최대 RSS)
+except ImportError:           # Windows
+    resource = None
+
+from mineboard import STATE_CLOSED, STATE_FLAG, generate_board, open_cells
+from metrics import board_metrics, guess_bucket
+from solver import calc_probabilities
+from strategies import STRATEGIES, make_strategy
+
+
+class _LocalTier:
+    """
+    국소 패턴 추론 (deduce.LocalDeducer) 을 먼저 쓰는 백엔드. 판마다 하나.
+    확정 셀을 찾으면 그 셀만 0 / 1 인 확률 dict 를 돌려주고 (전체 solver 생략),
+    못 찾으면 fallback 을, fallback 이 없으면 닫힌 셀 전체에 남은 지뢰 밀도를 쓴다.
+    """
+
+    def __init__(self, fallback=None):
+        from deduce import LocalDeducer
+        self._deducer  = LocalDeducer()
+        self._fallback = fallback
+
+    def __call__(self, board, cs, rows, cols, mines, flags):
+        safe, mine = self._deducer.deduce(board, cs, rows, cols)
+        if safe or mine:
+            probs = dict.fromkeys(safe, 0.0)
+            probs.update(dict.fromkeys(mine, 1.0))
+            return probs
+        if self._fallback is not None:
+            return self._fallback(board, cs, rows, cols, mines, flags)
+        closed = [(r, c) for r in range(rows) for c in range(cols)
+                  if cs[r][c] == STATE_CLOSED]
+        return dict.fromkeys(closed, (mines - flags) / max(1, len(closed)))
+
+
+# solver 백엔드: 이름 → 판마다 새로 만드는 함수
+#   (board, cell_state, rows, cols, mines, flags) → 확률 dict
+#   · exact      : 전체 확률 solver
+#   · local      : 국소 패턴 추론 먼저, 막히면 exact (게임 창 자동 풀이와 같은 단계)
+#   · local-only : 국소 패턴 추론만, 막히면 남은 지뢰 밀도로 추측 (exact 가 버는 몫 비교용)
+SOLVERS = {
+    "exact":      lambda: calc_probabilities,
+    "local":      lambda: _LocalTier(calc_probabilities),
+    "local-only": lambda: _LocalTier(),
+}
+
+
+# ─────────────────────────────────────────────
+#  1판 진행
+# ─────────────────────────────────────────────
+def play_game(rows, cols, mines, seed, solver="exact", strategy="min",
+              forced_guesses=False):
+    """
+    한 판 진행 → 결과 dict
+    (won, false_safe, guesses, guess_time_s, solver_calls, latencies[초],
+     seed, time_s, clicks, bbbv, openings, isolated, forced_guesses)
+    forced_guesses 는 forced_guesses=True 일 때만 세고 아니면 None.
+    보드 지표 계산 시간은 time_s 에 포함하지 않는다.
+    """
+    t_start = time.perf_counter()
+    random.seed(seed)          # solver 의 대그룹 무작위 열거까지 재현되도록
+    rng   = random.Random(seed)
+    solve = SOLVERS[solver]()
+    guess = make_strategy(strategy)
+
+    sr, sc = rows // 2, cols // 2
+    board, mask = generate_board(rows, cols, mines, sr, sc, rng)
+    cs     = [[STATE_CLOSED] * cols for _ in range(rows)]
+    opened = len(open_cells(board, cs, sr, sc, rows, cols))
+
+    result = {"won": False, "false_safe": 0, "guesses": 0, "guess_time_s": 0.0,
+              "solver_calls": 0, "latencies": [], "seed": seed,
+              "clicks": 1}
+    try:
+        _play(board, cs, rows, cols, mines, solve, guess, opened, result)
+    finally:
+        result["time_s"] = time.perf_counter() - t_start
+    result.update(_metrics(board, mask, sr, sc, forced_guesses))
+    return result
+
+
+def _metrics(board, mask, sr, sc, forced_guesses):
+    metrics = board_metrics(board, mask, sr, sc, forced_guesses=forced_guesses)
+    del metrics["mines"]
+    return metrics
+
+
+def _play(board, cs, rows, cols, mines, solve, guess, opened, result):
+    """play_game 의 본체: 끝나면 result 를 채우고 반환"""
+    flags = 0
+    goal  = rows * cols - mines
+    while opened < goal:
+        t0 = time.perf_counter()
+        probs = solve(board, cs, rows, cols, mines, flags)
+        result["latencies"].append(time.perf_counter() - t0)
+        result["solver_calls"] += 1
+
+        safe = [k for k, p in probs.items()
+                if round(p * 100) == 0 and cs[k[0]][k[1]] == STATE_CLOSED]
+        mine = [k for k, p in probs.items()
+                if round(p * 100) == 100 and cs[k[0]][k[1]] == STATE_CLOSED]
+
+        for r, c in mine:
+            cs[r][c] = STATE_FLAG
+            flags += 1
+        result["clicks"] += len(mine)
+
+        if safe:
+            for r, c in safe:
+                if cs[r][c] != STATE_CLOSED:
+                    continue
+                result["clicks"] += 1
+                if board[r][c] == -1:
+                    result["false_safe"] += 1
+                    return
+                opened += len(open_cells(board, cs, r, c, rows, cols))
+        elif not mine:
+            t0 = time.perf_counter()
+            cell = guess(board, cs, rows, cols, mines, flags, probs)
+            result["guess_time_s"] += time.perf_counter() - t0
+            if cell is None:
+                return
+            result["guesses"] += 1
+            result["clicks"]  += 1
+            r, c = cell
+            if board[r][c] == -1:
+                return
+            opened += len(open_cells(board, cs, r, c, rows, cols))
+
+    result["won"] = True
+
+
+# ─────────────────────────────────────────────
+#  N판 벤치마크
+# ─────────────────────────────────────────────
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return kb / 1024        # Linux: KB 단위
+
+
+def _run_chunk(rows, cols, mines, seeds, solver, strategy, batch=0, forced_guesses=False):
+    """워커 프로세스 1개 분량 → (결과 목록, 최대 RSS MB)"""
+    if batch:
+        from batchsim import play_batch
+        results = [r for i in range(0, len(seeds), batch)
+                   for r in play_batch(rows, cols, mines, seeds[i:i + batch], strategy)]
+        if forced_guesses:          # play_game 과 같은 보드 (같은 seed) 의 지표
+            sr, sc = rows // 2, cols // 2
+            for r in results:
+                board, mask = generate_board(rows, cols, mines, sr, sc,
+                                             random.Random(r["seed"]))
+                r.update(_metrics(board, mask, sr, sc, True))
+    else:
+        results = [play_game(rows, cols, mines, s, solver, strategy, forced_guesses)
+                   for s in seeds]
+    return results, _peak_rss_mb()
+
+
+def percentile(sorted_vals, q):
+    """정렬된 목록의 q(0~100) 백분위 (최근접 순위)"""
+    if not sorted_vals:
+        return 0.0
+    i = min(len(sorted_vals) - 1, max(0, round(q / 100 * len(sorted_vals)) - 1))
+    return sorted_vals[i]
+
+
+def run_benchmark(rows, cols, mines, games, solver="exact", strategy="min",
+                  workers=1, seed=0, history=None, batch=0, forced_guesses=False):
+    """
+    N판 진행 후 집계 report dict.
+    history (HistoryStore) 를 주면 각 판을 source='sim' 으로 기록.
+    forced_guesses=True 면 판마다 강제 추측 횟수를 세어 구간별 클리어율을 낸다
+    (games/sec 가 그만큼 낮아진다).
+    batch > 0 이면 워커마다 batch 판씩 lock-step 진행 (batchsim, exact solver 고정).
+    batch 결과에는 클릭 수가 없으므로 history 와 같이 쓸 수 없다.
+    """
+    if batch and history is not None:
+        raise ValueError("batch 모드 결과는 게임 기록 DB 에 기록할 수 없습니다")
+    if batch and solver != "exact":
+        raise ValueError(f"batch 모드는 exact solver 만 씁니다 (solver={solver!r})")
+    seeds = [seed + i for i in range(games)]
+    t0 = time.perf_counter()
+    if workers <= 1:
+        chunks = [_run_chunk(rows, cols, mines, seeds, solver, strategy, batch,
+                             forced_guesses)]
+    else:
+        parts = [seeds[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futs = [ex.submit(_run_chunk, rows, cols, mines, p, solver, strategy, batch,
+                              forced_guesses)
+                    for p in parts if p]
+            chunks = [f.result() for f in futs]
+    elapsed = time.perf_counter() - t0
+
+    results = [r for res, _ in chunks for r in res]
+    if history is not None:
+        now = time.time()
+        history.record_many(
+            (now, rows, cols, mines, int(r["won"]), r["time_s"], r["clicks"],
+             r["bbbv"], 0, r["seed"], "sim")
+            for r in results
+        )
+        history.flush()
+    lat     = sorted(x for r in results for x in r["latencies"])
+    mems    = [m for _, m in chunks if m is not None]
+    wins    = sum(r["won"] for r in results)
+    buckets = {}
+    for r in results:
+        if r.get("forced_guesses") is None:
+            continue
+        b = buckets.setdefault(guess_bucket(r["forced_guesses"]), [0, 0])
+        b[0] += 1
+        b[1] += r["won"]
+    return {
+        "rows": rows, "cols": cols, "mines": mines,
+        "games": games, "solver": solver, "strategy": strategy,
+        "workers": workers, "seed": seed, "batch": batch,
+        "forced_guesses": forced_guesses,
+        "elapsed_s":     round(elapsed, 4),
+        "games_per_sec": round(games / elapsed, 3) if elapsed else None,
+        "wins":          wins,
+        "win_rate":      round(wins / games, 4) if games else 0.0,
+        "false_safe":    sum(r["false_safe"] for r in results),
+        "guesses":       sum(r["guesses"] for r in results),
+        "solver_calls":  len(lat),
+        "latency_ms": {
+            "p50": round(percentile(lat, 50) * 1e3, 3),
+            "p95": round(percentile(lat, 95) * 1e3, 3),
+            "p99": round(percentile(lat, 99) * 1e3, 3),
+            "max": round(lat[-1] * 1e3, 3) if lat else 0.0,
+        },
+        "peak_rss_mb": round(max(mems), 1) if mems else None,
+        "by_forced_guesses": {
+            name: {"games": n, "wins": w, "win_rate": round(w / n, 4)}
+            for name, (n, w) in sorted(buckets.items())
+        },
+    }
+
+
+def format_report(rep: dict) -> str:
+    """사람이 읽는 텍스트 형식"""
+    lat = rep["latency_ms"]
+    mem = f"{rep['peak_rss_mb']} MB" if rep["peak_rss_mb"] is not None else "측정 불가"
+    by_guess = " · ".join(
+        f"{name}회 {b['win_rate'] * 100:.1f}% ({b['wins']}/{b['games']})"
+        for name, b in rep["by_forced_guesses"].items()
+    )
+    return "\n".join([
+        f"[벤치마크] {rep['rows']}×{rep['cols']}, 지뢰 {rep['mines']}개, {rep['games']}게임 "
+        f"(solver={rep['solver']}, 전략={rep['strategy']}, 워커={rep['workers']}, seed={rep['seed']}"
+        + (f", 묶음={rep['batch']})" if rep.get("batch") else ")"),
+        f"  소요 시간  : {rep['elapsed_s']:.2f}초  ({rep['games_per_sec']} games/sec)",
+        f"  클리어율   : {rep['win_rate'] * 100:.1f}% ({rep['wins']}/{rep['games']})",
+        f"  False Safe : {rep['false_safe']}건  |  ⭐ 추측 {rep['guesses']}회",
+        f"  solver 호출: {rep['solver_calls']}회  |  지연 p50 {lat['p50']}ms · "
+        f"p95 {lat['p95']}ms · p99 {lat['p99']}ms · max {lat['max']}ms",
+        f"  최대 메모리: {mem}",
+        f"  강제 추측별: {by_guess or ('-' if rep.get('forced_guesses') else '- (--metrics 로 계산)')}",
+    ])
+
+
+# ─────────────────────────────────────────────
+#  ⭐ 전략 아레나
+# ─────────────────────────────────────────────
+def wilson_interval(wins, n, z=1.96):
+    """클리어율의 Wilson 점수 신뢰구간 (기본 95%) → (하한, 상한)"""
+    if not n:
+        return 0.0, 0.0
+    p      = wins / n
+    denom  = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half   = z * sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def run_arena(rows, cols, mines, games, strategies=None, solver="exact",
+              workers=1, seed=0):
+    """
+    전략마다 같은 seed 목록(= 같은 보드)으로 games 판 진행 → 전략별 비교 report.
+    (전략, seed 묶음) 작업을 한 프로세스 풀에 나눠 넣는다.
+    """
+    names = list(strategies or STRATEGIES)
+    seeds = [seed + i for i in range(games)]
+    parts = [seeds[i::max(1, workers)] for i in range(max(1, workers))]
+    tasks = [(name, p) for name in names for p in parts if p]
+    t0 = time.perf_counter()
+    if workers <= 1:
+        chunks = [_run_chunk(rows, cols, mines, p, solver, name) for name, p in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futs = [ex.submit(_run_chunk, rows, cols, mines, p, solver, name)
+                    for name, p in tasks]
+            chunks = [f.result() for f in futs]
+    elapsed = time.perf_counter() - t0
+
+    by_name = {name: [] for name in names}
+    for (name, _), (res, _) in zip(tasks, chunks):
+        by_name[name].extend(res)
+
+    out = []
+    for name, results in by_name.items():
+        n       = len(results)
+        wins    = sum(r["won"] for r in results)
+        clicks  = sum(r["clicks"] for r in results)
+        guesses = sum(r["guesses"] for r in results)
+        lo, hi  = wilson_interval(wins, n)
+        out.append({
+            "strategy":     name,
+            "games":        n,
+            "wins":         wins,
+            "win_rate":     round(wins / n, 4) if n else 0.0,
+            "ci95":         [round(lo, 4), round(hi, 4)],
+            "guesses":      guesses,
+            "ms_per_move":  round(sum(r["time_s"] for r in results) / max(1, clicks) * 1e3, 3),
+            "ms_per_guess": round(sum(r["guess_time_s"] for r in results)
+                                  / max(1, guesses) * 1e3, 3),
+        })
+    out.sort(key=lambda s: (-s["win_rate"], s["ms_per_move"]))
+    return {
+        "rows": rows, "cols": cols, "mines": mines, "games": games,
+        "solver": solver, "workers": workers, "seed": seed,
+        "elapsed_s":  round(elapsed, 4),
+        "strategies": out,
+    }
+
+
+def format_arena(rep: dict) -> str:
+    """아레나 결과 표 (클리어율 순)"""
+    lines = [
+        f"[아레나] {rep['rows']}×{rep['cols']}, 지뢰 {rep['mines']}개, 전략당 {rep['games']}게임 "
+        f"(seed={rep['seed']}, 워커={rep['workers']}, {rep['elapsed_s']:.1f}초)",
+        f"  {'전략':<15} {'클리어율':>8}  {'95% 신뢰구간':<15} {'⭐ 추측':>7} {'ms/수':>8} {'ms/⭐':>8}",
+    ]
+    for s in rep["strategies"]:
+        lo, hi = s["ci95"]
+        lines.append(
+            f"  {s['strategy']:<15} {s['win_rate'] * 100:7.1f}%  "
+            f"[{lo * 100:5.1f}, {hi * 100:5.1f}]  {s['guesses']:7d} "
+            f"{s['ms_per_move']:8.2f} {s['ms_per_guess']:8.2f}"
+        )
+    return "\n".join(lines)
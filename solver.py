@@ -0,0 +1,709 @@
+"""
+지뢰 확률 계산 엔진
+===================
+완전 열거 (조합 탐색) + 독립 그룹 분리 방식.
+tkinter 와 무관하게 (board, cell_state) 만으로 동작하므로
+게임 창, 시뮬레이션, 노게스 보드 검증이 모두 같은 엔진을 쓴다.
+
+[알고리즘]
+1. 제약 수집 (닫힌 셀 · 깃발 마스크의 3×3 박스 합)
+2. 제약 전파(Propagation): 확정 안전/지뢰 셀 선행 확정
+3. Union-Find 로 독립 그룹 분리
+4. 그룹 계수: 분기 후 끊어진 성분은 따로 세서 곱하고 성분 결과를 캐시
+   (#SAT 식, 노드 한도 초과 시 대그룹은 무작위 부분 열거, 그 외 로컬 추정 폴백)
+5. 그룹 간 Convolution + C(nf,k) 가중치
+6. 셀별 정확 확률 계산 (그룹별 셀 × 지뢰 수 집계 행렬 · 가중치 벡터)
+"""
+
+import random
+from math import comb, gcd
+
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG, box_sum_bytes
+
+MAX_GROUP_SIZE = 100        # 이 이상인 그룹 → 무작위 순서 부분 열거
+MAX_BT_NODES   = 2_000_000  # 백트래킹 노드 한도 (속도 보호)
+
+
+def safe_comb(n, k):
+    return comb(n, k) if 0 <= k <= n else 0
+
+
+# ─────────────────────────────────────────────
+#  1. 제약 수집
+# ─────────────────────────────────────────────
+# 셀 상태 바이트 → 0/1 마스크 (bytes.translate 표)
+_CLOSED_MASK = bytes(int(i == STATE_CLOSED) for i in range(256))
+_FLAG_MASK   = bytes(int(i == STATE_FLAG) for i in range(256))
+
+
+def collect_constraints(board, cell_state, rows, cols, conflicts=None):
+    """
+    열린 숫자 셀마다 (잔여지뢰수, 인접닫힌셀 frozenset) 제약 생성.
+    → (중복 제거된 제약 목록, 전체 닫힌 셀 수)
+    셀 상태를 행마다 bytes 로 바꿔 닫힌 셀 / 깃발 마스크의 3×3 박스 합
+    (mineboard.box_sum_bytes) 한 번씩으로 셀마다 닫힌 이웃 수 · 깃발 이웃 수를
+    구하고 (열린 셀 자신은 어느 마스크에도 없음), 닫힌 이웃이 있는 제약만
+    셀 집합을 만든다. 닫힌 이웃 없이 숫자가 남는 셀은 conflicts 에 기록한다.
+    """
+    srows    = [bytes(row) for row in cell_state]
+    closed   = [b.translate(_CLOSED_MASK) for b in srows]
+    n_closed = box_sum_bytes(closed, cols)
+    n_flag   = box_sum_bytes([b.translate(_FLAG_MASK) for b in srows], cols)
+    total_closed = sum(b.count(STATE_CLOSED) for b in srows)
+
+    raw = []
+    for r, b in enumerate(srows):
+        brow, crow, frow = board[r], n_closed[r], n_flag[r]
+        r0, r1 = max(0, r - 1), min(rows, r + 2)
+        c = b.find(STATE_OPEN)
+        while c >= 0:
+            val = brow[c]
+            if val >= 0:
+                rem = val - frow[c]
+                if crow[c]:
+                    c0, c1 = max(0, c - 1), min(cols, c + 2)
+                    raw.append((rem, frozenset(
+                        (nr, nc) for nr in range(r0, r1)
+                        for nc in range(c0, c1) if closed[nr][nc]
+                    )))
+                elif rem and conflicts is not None:
+                    conflicts.append((rem, frozenset()))
+            c = b.find(STATE_OPEN, c + 1)
+    return list(set(raw)), total_closed
+
+
+# ─────────────────────────────────────────────
+#  2. 제약 전파 + Gaussian Elimination
+# ─────────────────────────────────────────────
+def propagate(cst_set, conflicts=None):
+    """
+    제약 전파 + Gaussian Elimination.
+    확정 셀을 더 이상 찾을 수 없을 때까지 반복 →
+    (defi_safe, defi_mine, 남은 제약 목록)
+    모순 제약은 건너뛰며, conflicts 리스트를 주면 거기에 기록한다.
+    """
+    defi_safe = set()
+    defi_mine = set()
+    changed = True
+    while changed:
+        changed = False
+
+        # (a) 기본 전파: rem=0 → safe, rem=len → mine
+        new_cst = []
+        for rem, cl in cst_set:
+            cl2  = frozenset(c for c in cl if c not in defi_safe and c not in defi_mine)
+            rem2 = rem - sum(1 for c in cl if c in defi_mine)
+            if rem2 < 0 or rem2 > len(cl2):
+                if conflicts is not None:
+                    conflicts.append((rem, cl))
+                continue
+            if rem2 == 0 and cl2:
+                defi_safe.update(cl2);  changed = True
+            elif cl2 and rem2 == len(cl2):
+                defi_mine.update(cl2);  changed = True
+            elif cl2:
+                new_cst.append((rem2, cl2))
+        cst_set = new_cst
+
+        # (b) Gaussian elimination: 정수 행렬 행 축소
+        if not cst_set:
+            break
+
+        # 변수(셀) 인덱싱
+        all_cells_g = set()
+        for _, cl in cst_set:
+            all_cells_g.update(cl)
+        cell_list = sorted(all_cells_g)
+        cell_idx  = {c: i for i, c in enumerate(cell_list)}
+        n_vars    = len(cell_list)
+        n_rows    = len(cst_set)
+
+        # 행렬 구축: [계수들 | 나머지값]
+        matrix = []
+        for rem, cl in cst_set:
+            row = [0] * (n_vars + 1)
+            for c in cl:
+                row[cell_idx[c]] = 1
+            row[n_vars] = rem
+            matrix.append(row)
+
+        # 정수 가우스 소거 (피벗 열 순서대로)
+        pivot_row_idx = 0
+        for col in range(n_vars):
+            if pivot_row_idx >= n_rows:
+                break
+            # 피벗 행 찾기
+            pr = None
+            for r in range(pivot_row_idx, n_rows):
+                if matrix[r][col] != 0:
+                    pr = r
+                    break
+            if pr is None:
+                continue
+            matrix[pivot_row_idx], matrix[pr] = matrix[pr], matrix[pivot_row_idx]
+            pv = matrix[pivot_row_idx][col]  # 피벗 값
+
+            # 다른 행에서 이 열 소거
+            for r in range(n_rows):
+                if r == pivot_row_idx or matrix[r][col] == 0:
+                    continue
+                factor = matrix[r][col]
+                for j in range(n_vars + 1):
+                    matrix[r][j] = matrix[r][j] * pv - factor * matrix[pivot_row_idx][j]
+                # GCD 정규화 (계수 폭발 방지)
+                row_gcd = 0
+                for j in range(n_vars + 1):
+                    row_gcd = gcd(row_gcd, abs(matrix[r][j]))
+                if row_gcd > 1:
+                    for j in range(n_vars + 1):
+                        matrix[r][j] //= row_gcd
+            pivot_row_idx += 1
+
+        # 축소된 행렬에서 확정 셀 도출
+        for row in matrix:
+            coeffs = row[:n_vars]
+            rem_val = row[n_vars]
+            pos_cells = [cell_list[i] for i in range(n_vars) if coeffs[i] > 0]
+            neg_cells = [cell_list[i] for i in range(n_vars) if coeffs[i] < 0]
+            pos_sum   = sum(coeffs[i] for i in range(n_vars) if coeffs[i] > 0)
+            neg_sum   = sum(-coeffs[i] for i in range(n_vars) if coeffs[i] < 0)
+
+            if not pos_cells and not neg_cells:
+                if rem_val != 0 and conflicts is not None:
+                    conflicts.append((rem_val, frozenset()))
+                continue
+            if conflicts is not None and not -neg_sum <= rem_val <= pos_sum:
+                conflicts.append((rem_val, frozenset(pos_cells + neg_cells)))
+
+            # sum(pos*x) - sum(neg*x) = rem_val
+            # 최솟값: 0 - neg_sum = -neg_sum
+            # 최댓값: pos_sum - 0 = pos_sum
+
+            if len(pos_cells) + len(neg_cells) == 0:
+                continue
+
+            # 모든 계수가 +1인 경우 (서브셋 추론 포함)
+            if not neg_cells and all(coeffs[cell_idx[c]] == 1 for c in pos_cells):
+                if rem_val == 0:
+                    defi_safe.update(pos_cells); changed = True
+                elif rem_val == len(pos_cells):
+                    defi_mine.update(pos_cells); changed = True
+
+            # 단일 변수: coeff * x = rem → x = rem / coeff
+            non_zero = [(i, coeffs[i]) for i in range(n_vars) if coeffs[i] != 0]
+            if len(non_zero) == 1:
+                i, c = non_zero[0]
+                if c != 0 and rem_val % c == 0:
+                    v = rem_val // c
+                    if v == 0:
+                        defi_safe.add(cell_list[i]); changed = True
+                    elif v == 1:
+                        defi_mine.add(cell_list[i]); changed = True
+
+            # ±1 혼합: 극단값 체크
+            # pos_cells 전부 1 + neg_cells 전부 0 → rem = pos_sum
+            # pos_cells 전부 0 + neg_cells 전부 1 → rem = -neg_sum
+            if pos_cells and neg_cells:
+                if rem_val == pos_sum:
+                    # pos 전부 mine, neg 전부 safe
+                    defi_mine.update(pos_cells); changed = True
+                    defi_safe.update(neg_cells); changed = True
+                elif rem_val == -neg_sum:
+                    # pos 전부 safe, neg 전부 mine
+                    defi_safe.update(pos_cells); changed = True
+                    defi_mine.update(neg_cells); changed = True
+
+    if conflicts is not None and defi_safe & defi_mine:
+        conflicts.append((-1, frozenset(defi_safe & defi_mine)))
+    return defi_safe, defi_mine, cst_set
+
+
+# ─────────────────────────────────────────────
+#  그룹 열거 (전방 검사 백트래킹)
+# ─────────────────────────────────────────────
+def _frontier_order(cells, cst):
+    """
+    변수 순서: frontier 를 따라가며 열린 제약(일부만 배정된 제약)이 적게
+    유지되도록, 남은 셀이 가장 적은 열린 제약의 셀을 다음으로 고른다.
+    열린 제약이 없으면 제약 수가 가장 적은 셀 (경계의 끝) 에서 새로 시작.
+    """
+    cst_of = {cell: [] for cell in cells}
+    for ci, (_, cl) in enumerate(cst):
+        for c in cl:
+            cst_of[c].append(ci)
+    left    = [len(cl) for _, cl in cst]
+    open_ci = set()             # 일부만 배정된 제약
+    order   = []
+    todo    = set(cells)
+    while todo:
+        if open_ci:
+            best = min(open_ci, key=lambda ci: (left[ci], ci))
+            nxt  = min(c for c in cst[best][1] if c in todo)
+        else:
+            nxt = min(todo, key=lambda c: (len(cst_of[c]), c))
+        todo.discard(nxt)
+        order.append(nxt)
+        for ci in cst_of[nxt]:
+            left[ci] -= 1
+            if left[ci]:
+                open_ci.add(ci)
+            else:
+                open_ci.discard(ci)
+    return order
+
+
+def enumerate_group(cells, cst, randomize=False, bounds=None, stats=None):
+    """
+    독립 그룹 하나의 모든 배치 → (배치 목록 [(배정 tuple, 지뢰 수)], 셀 순서)
+    배치 목록이 비면 모순, 노드 한도를 넘고 배치가 하나도 없으면 None.
+
+    - 변수 순서: _frontier_order
+    - 배정할 때마다 단위 전파: 남은 지뢰 0 → 나머지 안전, 남은 지뢰 = 남은
+      셀 수 → 나머지 지뢰 (연쇄적으로 반복, 되돌리기는 trail)
+    - bounds=(lo, hi): 그룹 지뢰 수 범위. 배정된 지뢰가 hi 를 넘거나
+      배정 지뢰 + 미배정 셀 수가 lo 에 못 미치면 가지치기
+    - randomize: 값 시도 순서를 무작위로 (대그룹 부분 열거의 편향 감소)
+    - stats dict 를 주면 "nodes" 에 방문 노드 수를 더한다
+    """
+    cells = _frontier_order(cells, cst)
+    n     = len(cells)
+    idx   = {cell: i for i, cell in enumerate(cells)}
+    members = [[idx[c] for c in cl] for _, cl in cst]
+    cst_of  = [[] for _ in range(n)]
+    for ci, mem in enumerate(members):
+        for i in mem:
+            cst_of[i].append(ci)
+    need = [rem for rem, _ in cst]        # 제약별 아직 필요한 지뢰 수
+    free = [len(mem) for mem in members]  # 제약별 미배정 셀 수
+    lo, hi = bounds if bounds is not None else (0, n)
+
+    val     = [-1] * n
+    trail   = []              # 제약 갱신까지 끝난 셀 (되돌리기 순서)
+    results = []
+    n_mines = 0
+    nodes   = 0
+    aborted = False
+
+    def assign(i, v):
+        """i ← v 후 단위 전파. 모순이거나 범위를 벗어나면 False (되돌리기는 호출 측)"""
+        nonlocal n_mines
+        val[i] = v
+        stack  = [i]
+        ok     = True
+        while stack and ok:
+            i = stack.pop()
+            v = val[i]
+            trail.append(i)
+            n_mines += v
+            for ci in cst_of[i]:
+                fr = free[ci] - 1
+                nd = need[ci] - v
+                free[ci] = fr
+                need[ci] = nd
+                if nd < 0 or nd > fr:
+                    ok = False
+                elif fr and ok and (nd == 0 or nd == fr):
+                    fv = 1 if nd else 0
+                    for j in members[ci]:
+                        if val[j] < 0:
+                            val[j] = fv
+                            stack.append(j)
+        for j in stack:             # 값만 정하고 전파 전에 멈춘 셀
+            val[j] = -1
+        return ok and n_mines <= hi and n_mines + n - len(trail) >= lo
+
+    def undo(mark):
+        nonlocal n_mines
+        while len(trail) > mark:
+            i = trail.pop()
+            v = val[i]
+            for ci in cst_of[i]:
+                free[ci] += 1
+                need[ci] += v
+            n_mines -= v
+            val[i] = -1
+
+    def bt(pos):
+        nonlocal nodes, aborted
+        if aborted:
+            return
+        nodes += 1
+        if nodes > MAX_BT_NODES:
+            aborted = True
+            return
+        while pos < n and val[pos] >= 0:
+            pos += 1
+        if pos == n:
+            results.append((tuple(val), n_mines))
+            return
+        vals = (0, 1)
+        if randomize:
+            vals = (0, 1) if random.random() < 0.5 else (1, 0)
+        for v in vals:
+            mark = len(trail)
+            if assign(pos, v):
+                bt(pos + 1)
+            undo(mark)
+
+    if lo <= hi:
+        bt(0)
+    if stats is not None:
+        stats["nodes"] = stats.get("nodes", 0) + nodes
+    if not results and aborted:
+        return None
+    return results, cells
+
+
+# ─────────────────────────────────────────────
+#  그룹 계수 (#SAT 식 성분 분할 + 캐시)
+# ─────────────────────────────────────────────
+# 배치를 하나하나 나열하지 않고 세기만 한다. 결과는 지뢰 수 m 별 배치 수
+# (dist[m]) 와 셀별로 "그 셀이 지뢰인 배치 수" (tally[cell][m]) 다항식.
+# 분기 후 남은 제약 그래프가 끊어지면 성분별로 따로 세서 곱(Convolution)
+# 하고, 성분 결과는 남은 제약 자체(셀 좌표 포함)를 키로 캐시한다.
+# 같은 제약 집합이면 국면과 무관하게 결과가 같으므로 호출 사이에도 재사용.
+# 한 번의 계수 중 새로 센 성분은 counter["new"] 에 모았다가 계수 전체가 끝난
+# 뒤에만 전역 캐시에 넣는다 (노드 한도로 중단된 계수의 일부 결과가 남으면
+# 같은 국면을 다시 풀 때 결과가 호출 이력에 따라 달라지므로).
+COMPONENT_CACHE_SIZE = 20_000     # 넘으면 비움
+_component_cache = {}
+
+
+class _NodeLimit(Exception):
+    pass
+
+
+def _conv(a, b):
+    """다항식 곱 (list: 지뢰 수 → 배치 수)"""
+    if not a or not b:
+        return []
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+
+def _add_into(acc, poly, shift):
+    """acc += poly · x^shift"""
+    if len(acc) < len(poly) + shift:
+        acc.extend([0] * (len(poly) + shift - len(acc)))
+    for i, x in enumerate(poly):
+        acc[i + shift] += x
+
+
+def _simplify(cst, fixed):
+    """
+    fixed (셀 → 0/1) 를 대입하고 단위 전파. 강제된 셀은 fixed 에 추가.
+    → 남은 제약 목록, 모순이면 None
+    """
+    pending = dict(fixed)
+    while pending:
+        nxt, new = [], {}
+        for need, cl in cst:
+            hit = cl & pending.keys()
+            if hit:
+                need -= sum(pending[c] for c in hit)
+                cl = cl - hit
+            if need < 0 or need > len(cl):
+                return None
+            if not cl:
+                continue
+            if need == 0 or need == len(cl):
+                v = 1 if need else 0
+                for c in cl:
+                    if new.setdefault(c, v) != v:
+                        return None
+                continue
+            nxt.append((need, cl))
+        fixed.update(new)
+        pending, cst = new, nxt
+    return cst
+
+
+def _components(cst):
+    """셀을 공유하는 제약끼리 묶은 연결 성분 목록"""
+    by_cell = {}
+    for i, (_, cl) in enumerate(cst):
+        for c in cl:
+            by_cell.setdefault(c, []).append(i)
+    seen  = [False] * len(cst)
+    comps = []
+    for i in range(len(cst)):
+        if seen[i]:
+            continue
+        seen[i] = True
+        stack, comp = [i], []
+        while stack:
+            j = stack.pop()
+            comp.append(cst[j])
+            for c in cst[j][1]:
+                for k in by_cell[c]:
+                    if not seen[k]:
+                        seen[k] = True
+                        stack.append(k)
+        comps.append(comp)
+    return comps
+
+
+def _count_component(cst, counter):
+    """연결된 제약 목록 → (dist, {셀: tally}). 배치가 없으면 ([], {})"""
+    key = frozenset(cst)
+    hit = counter["new"].get(key)
+    if hit is None:
+        hit = _component_cache.get(key)
+    if hit is not None:
+        counter["hits"] += 1
+        return hit
+    counter["nodes"] += 1
+    if counter["nodes"] > counter["limit"]:
+        raise _NodeLimit
+
+    # 분기 변수: frontier 경로 순서의 첫 셀 → 한쪽 끝부터 잘라 나가므로
+    # 남은 제약이 "경계 지뢰 수" 만 다른 꼴이 되어 캐시에 잘 걸린다
+    rank  = counter["rank"]
+    tally = {c: [] for _, cl in cst for c in cl}
+    x     = min(tally, key=rank.__getitem__)
+    dist  = []
+    for v in (0, 1):
+        fixed = {x: v}
+        rest  = _simplify(cst, fixed)
+        if rest is None:
+            continue
+        parts = [_count_component(comp, counter) for comp in _components(rest)]
+        if any(not d for d, _ in parts):
+            continue
+        base = sum(fixed.values())
+        # 성분 i 를 뺀 나머지 곱 = prefix[i] · suffix[i+1]
+        prefix = [[1]]
+        for d, _ in parts:
+            prefix.append(_conv(prefix[-1], d))
+        suffix = [[1]]
+        for d, _ in reversed(parts):
+            suffix.append(_conv(suffix[-1], d))
+        suffix.reverse()
+        branch = prefix[-1]
+        _add_into(dist, branch, base)
+        for c, val in fixed.items():
+            if val:
+                _add_into(tally[c], branch, base)
+        for i, (_, t) in enumerate(parts):
+            others = _conv(prefix[i], suffix[i + 1])
+            for c, tc in t.items():
+                _add_into(tally[c], _conv(tc, others), base)
+
+    result = (dist, tally) if any(dist) else ([], {})
+    counter["new"][key] = result
+    return result
+
+
+def count_group(cells, cst, stats=None):
+    """
+    독립 그룹 하나를 세기 → (dist, tally, 셀 목록)
+      dist[m]       : 지뢰 m 개인 배치 수
+      tally[i][m]   : 그 중 cells[i] 가 지뢰인 배치 수
+    배치가 없으면 dist 가 빈 목록, 노드 한도(MAX_BT_NODES)를 넘으면 None.
+    stats dict 를 주면 "nodes" / "hits" (캐시 적중) 를 더한다.
+    """
+    order   = _frontier_order(cells, cst)
+    counter = {"nodes": 0, "hits": 0, "limit": MAX_BT_NODES,
+               "rank": {c: i for i, c in enumerate(order)}, "new": {}}
+    cells   = sorted(cells)
+    try:
+        dist, tally = _count_component(list(cst), counter)
+    except _NodeLimit:
+        dist = None
+    else:
+        if len(_component_cache) + len(counter["new"]) > COMPONENT_CACHE_SIZE:
+            _component_cache.clear()
+        _component_cache.update(counter["new"])
+    if stats is not None:
+        for k in ("nodes", "hits"):
+            stats[k] = stats.get(k, 0) + counter[k]
+    if dist is None:
+        return None
+    return dist, [tally.get(c, []) for c in cells], cells
+
+
+def _tally_configs(configs, cells):
+    """enumerate_group 의 배치 목록 → count_group 과 같은 (dist, tally, 셀 목록)"""
+    dist  = []
+    tally = [[] for _ in cells]
+    for asgn, m in configs:
+        _add_into(dist, [1], m)
+        for i, v in enumerate(asgn):
+            if v:
+                _add_into(tally[i], [1], m)
+    return dist, tally, cells
+
+
+# ─────────────────────────────────────────────
+#  전체 확률 계산
+# ─────────────────────────────────────────────
+def calc_probabilities(board, cell_state, rows, cols, mine_count, flags_count) -> dict:
+    """닫힌 셀 (r, c) → 지뢰 확률 dict"""
+    return solve_position(board, cell_state, rows, cols, mine_count, flags_count)[0]
+
+
+def solve_position(board, cell_state, rows, cols, mine_count, flags_count, stats=None):
+    """
+    → (확률 dict, 가중치)
+    가중치는 현재 국면과 모순 없는 전체 지뢰 배치 수 (국면이 모순이면 0).
+    같은 국면에서 갈라진 가상 국면들의 상대 빈도 비교에 사용한다.
+    stats dict 를 주면 "constraints" / "frontier" / "groups" / "fallback" (폴백 셀 수)
+    와 count_group 의 "nodes" / "hits" 를 더한다.
+    """
+    conflicts = []
+    cst_set, total_closed = collect_constraints(board, cell_state, rows, cols, conflicts)
+    total_remaining = mine_count - flags_count
+    global_prob     = total_remaining / max(1, total_closed)
+
+    # 제약이 없으면 글로벌 확률
+    if not cst_set:
+        return ({(r, c): global_prob
+                 for r in range(rows) for c in range(cols)
+                 if cell_state[r][c] == STATE_CLOSED},
+                0 if conflicts else safe_comb(total_closed, total_remaining))
+
+    # ── 2. 제약 전파 + Gaussian Elimination ────────────
+    defi_safe, defi_mine, cst_set = propagate(cst_set, conflicts)
+    if stats is not None:
+        stats["constraints"] = stats.get("constraints", 0) + len(cst_set)
+
+    # ── 3. 확정 셀 제외 후 frontier 재구성 ──────────
+    frontier = set()
+    for _, cl in cst_set:
+        frontier.update(cl)
+
+    # ── 4. Union-Find 그룹 분리 ──────────────────────
+    parent = {cell: cell for cell in frontier}
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    def union(x, y):
+        px, py = find(x), find(y)
+        if px != py:
+            parent[px] = py
+
+    for _, cl in cst_set:
+        it = iter(cl); f = next(it)
+        for cell in it:
+            union(f, cell)
+
+    groups = {}
+    for cell in frontier:
+        groups.setdefault(find(cell), []).append(cell)
+    group_cst = {root: [] for root in groups}
+    for rem, cl in cst_set:
+        group_cst[find(next(iter(cl)))].append((rem, cl))
+
+    # ── 6. 그룹별 계산 ───────────────────────────────
+    # 그룹마다 count_group 으로 정확히 센다. 노드 한도를 넘은 대그룹만
+    # 무작위 순서 부분 열거, 그 밖에는 로컬 추정 폴백.
+    # 작은 그룹부터 세며, 끝난 그룹의 최소·최대 지뢰 수와 남은 전역 지뢰 수로
+    # 그룹 지뢰 수 범위를 구해 범위 밖 항을 버린다 (어떤 조합에서도
+    # C(nf, ·) = 0 이므로 확률·가중치는 같고, 다음 그룹 범위가 좁아진다).
+    group_data     = {}             # 그룹 → (셀 목록, 셀별 tally)
+    group_dists    = {}             # 그룹 → {지뢰 수: 배치 수} (범위 안)
+    fallback_cells = set()
+    infeasible     = bool(conflicts)   # 모순 국면 → 가중치 0 으로 보고
+    over_budget    = False             # 전역 지뢰 수에 맞는 배치가 없음
+
+    rem_base = total_remaining - len(defi_mine)
+    free_nf  = total_closed - len(frontier) - len(defi_safe) - len(defi_mine)
+    pending  = sum(len(cells) for cells in groups.values())
+    lo_done = hi_done = 0
+    for root, cells in sorted(groups.items(), key=lambda kv: (len(kv[1]), min(kv[1]))):
+        pending -= len(cells)
+        # 아직 안 푼 그룹은 0 ~ 셀 수 (폴백되어도 같은 범위)
+        lo = rem_base - free_nf - hi_done - pending
+        hi = rem_base - lo_done
+        result = count_group(cells, group_cst[root], stats)
+        if result is None and len(cells) > MAX_GROUP_SIZE:
+            partial = enumerate_group(cells, group_cst[root], randomize=True, bounds=(lo, hi))
+            if partial is not None and partial[0]:
+                result = _tally_configs(*partial)
+        if result is None or not result[0]:
+            infeasible = infeasible or result is not None
+            fallback_cells.update(cells)
+            pending += len(cells)      # 폴백 셀은 비-frontier 로 계산
+            continue
+        dist, tally, sorted_cells = result
+        support = [m for m, cnt in enumerate(dist) if cnt and lo <= m <= hi]
+        if not support:
+            over_budget = True          # 가중치 0: 나머지 셀은 전역 확률
+            break
+        group_data[root] = (sorted_cells, tally)
+        group_dists[root] = {m: dist[m] for m in support}
+        lo_done += support[0]
+        hi_done += support[-1]
+
+    if stats is not None:
+        for k, v in (("frontier", len(frontier)), ("groups", len(groups)),
+                     ("fallback", len(fallback_cells))):
+            stats[k] = stats.get(k, 0) + v
+
+    # ── 7. Convolution + C(nf,k) 가중치 ─────────────
+    def convolve(d1, d2):
+        out = {}
+        for m1, c1 in d1.items():
+            for m2, c2 in d2.items():
+                k = m1 + m2
+                out[k] = out.get(k, 0) + c1 * c2
+        return out
+
+    total_dist = {0: 1}
+    for d in group_dists.values():
+        total_dist = convolve(total_dist, d)
+
+    adj_nf = max(0, (total_closed - len(frontier) - len(defi_safe) - len(defi_mine))
+                 + len(fallback_cells))
+
+    total_weight = 0 if over_budget else sum(
+        cnt * safe_comb(adj_nf, total_remaining - len(defi_mine) - m)
+        for m, cnt in total_dist.items()
+    )
+
+    probs = {}
+    for cell in defi_safe:
+        probs[cell] = 0.0
+    for cell in defi_mine:
+        probs[cell] = 1.0
+
+    if total_weight > 0:
+        for j_root, (j_cells, j_tally) in group_data.items():
+            other_dist = {0: 1}
+            for k_root, k_dist in group_dists.items():
+                if k_root != j_root:
+                    other_dist = convolve(other_dist, k_dist)
+
+            # 그룹 지뢰 수 m 별 가중치 벡터: Σ_o other_dist[o] · C(nf, rem − m − o)
+            weight_by_m = {
+                m_j: sum(c_o * safe_comb(adj_nf, rem_base - m_j - m_o)
+                         for m_o, c_o in other_dist.items())
+                for m_j in group_dists[j_root]
+            }
+            # 셀 × 지뢰 수 집계 행렬 · 가중치 벡터
+            for cell, t in zip(j_cells, j_tally):
+                probs[cell] = sum(t[m] * w for m, w in weight_by_m.items()
+                                  if m < len(t)) / total_weight
+
+        # 비-frontier / fallback 셀 확률
+        nf_w = sum(cnt * safe_comb(adj_nf - 1, rem_base - m - 1)
+                   for m, cnt in total_dist.items()) if adj_nf > 0 else 0
+        nf_prob = nf_w / total_weight if adj_nf > 0 else 0.0
+    else:
+        nf_prob = global_prob
+
+    for r in range(rows):
+        for c in range(cols):
+            if cell_state[r][c] != STATE_CLOSED:
+                continue
+            cell = (r, c)
+            if cell not in probs:
+                probs[cell] = nf_prob
+
+    return probs, (0 if infeasible else total_weight)
@@ -0,0 +1,144 @@
+"""
+⭐ 추측 전략 (플러그인)
+=======================
+0% 셀이 없는 교착 상태에서 어떤 셀을 열지 고르는 정책.
+
+전략 = 게임마다 새로 만드는 팩토리가 돌려주는 추측 함수
+    guess(board, cell_state, rows, cols, mines, flags, probs) → (r, c) 또는 None
+- board 는 열린 셀의 숫자만 읽어야 한다 (닫힌 셀 값은 정답)
+- probs 는 solver 확률 dict (닫힌 셀만 후보로 볼 것)
+- 팩토리는 게임마다 호출되므로 전치표 같은 상태는 함수 안에 둔다
+
+@register("이름") 으로 STRATEGIES 에 추가하면 게임 창 🎲 자동 플레이 (메뉴),
+simulate (bench / arena), test_star 가 모두 같은 이름으로 쓸 수 있다.
+"""
+
+from math import log2
+
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG, neighbors
+
+TIE_EPS        = 1e-9    # 이 차이 이내 확률은 같은 것으로 보고 동점 처리
+INFO_TOLERANCE = 0.05    # info: 최저 확률 + 이 값 이내 셀만 후보
+INFO_MAX_CANDS = 6       # info: 평가할 후보 수
+
+# 이름 → 팩토리
+STRATEGIES = {}
+
+
+def register(name: str):
+    """팩토리 등록 데코레이터"""
+    def deco(factory):
+        STRATEGIES[name] = factory
+        return factory
+    return deco
+
+
+def make_strategy(name: str):
+    """이름 → 새 추측 함수 (없는 이름이면 KeyError)"""
+    return STRATEGIES[name]()
+
+
+def _closed_probs(cs, probs):
+    return {k: p for k, p in probs.items() if cs[k[0]][k[1]] == STATE_CLOSED}
+
+
+# ─────────────────────────────────────────────
+#  기본 전략
+# ─────────────────────────────────────────────
+def _min_prob_guess(board, cs, rows, cols, mines, flags, probs):
+    closed = _closed_probs(cs, probs)
+    return min(closed, key=lambda k: (closed[k], k)) if closed else None
+
+
+@register("min")
+def min_probability():
+    """최저 확률 (동점이면 행 우선 첫 셀)"""
+    return _min_prob_guess
+
+
+@register("corner")
+def corner_edge():
+    """
+    최저 확률, 동점이면 이웃이 적은 셀 (모서리 3 → 가장자리 5 → 안쪽 8).
+    이웃이 적을수록 0 이 나와 연쇄로 열릴 가능성이 크다.
+    """
+    def guess(board, cs, rows, cols, mines, flags, probs):
+        closed = _closed_probs(cs, probs)
+        if not closed:
+            return None
+        p_min = min(closed.values())
+        ties  = [k for k, p in closed.items() if p - p_min <= TIE_EPS]
+        return min(ties, key=lambda k: (len(neighbors(*k, rows, cols)), k))
+    return guess
+
+
+@register("info")
+def information_gain():
+    """
+    생존확률 × (1 + 나올 숫자의 엔트로피[bit]) 최대 셀.
+    숫자 k 의 분포는 (셀 열림, 숫자 k) 가상 국면의 배치 수 비율
+    (solver.solve_position 가중치). 후보는 최저 확률 + INFO_TOLERANCE 이내.
+    """
+    from solver import solve_position
+
+    def guess(board, cs, rows, cols, mines, flags, probs):
+        closed = _closed_probs(cs, probs)
+        if not closed:
+            return None
+        order = sorted(closed, key=lambda k: (closed[k], k))
+        p_lim = closed[order[0]] + INFO_TOLERANCE
+        cands = [k for k in order if closed[k] <= p_lim and closed[k] < 1.0][:INFO_MAX_CANDS]
+        if len(cands) <= 1:
+            return order[0]
+
+        vis = [[v if s == STATE_OPEN else 0 for v, s in zip(vrow, srow)]
+               for vrow, srow in zip(board, cs)]
+        work = [row[:] for row in cs]
+        best, best_score = order[0], -1.0
+        for cell in cands:
+            r, c = cell
+            nbrs = neighbors(r, c, rows, cols)
+            lo   = sum(1 for nr, nc in nbrs if work[nr][nc] == STATE_FLAG)
+            hi   = lo + sum(1 for nr, nc in nbrs if work[nr][nc] == STATE_CLOSED)
+            weights = []
+            work[r][c] = STATE_OPEN
+            for k in range(lo, hi + 1):
+                vis[r][c] = k
+                w = solve_position(vis, work, rows, cols, mines, flags)[1]
+                if w > 0:
+                    weights.append(w)
+            work[r][c], vis[r][c] = STATE_CLOSED, 0
+            total   = sum(weights)
+            entropy = -sum(w / total * log2(w / total) for w in weights) if total else 0.0
+            score   = (1.0 - closed[cell]) * (1.0 + entropy)
+            if score > best_score + TIE_EPS:
+                best, best_score = cell, score
+        return best
+    return guess
+
+
+@register("lookahead")
+def lookahead():
+    """lookahead.LookaheadEngine (시간 제한 탐색, 전치표는 게임 내내 유지)"""
+    from lookahead import LookaheadEngine
+    engine = LookaheadEngine()
+
+    def guess(board, cs, rows, cols, mines, flags, probs):
+        return engine.choose(board, cs, rows, cols, mines, flags, probs=probs)
+    guess.engine = engine
+    return guess
+
+
+@register("lookahead-fixed")
+def lookahead_fixed():
+    """
+    lookahead 를 시간 대신 solver 호출 수 예산 (lookahead.FIXED_MAX_SOLVES) 으로
+    자른 것. random.seed 를 고정하면 같은 보드에서 같은 수 (테스트 · 벤치마크용)
+    """
+    from lookahead import LookaheadEngine, FIXED_MAX_SOLVES
+    engine = LookaheadEngine(max_solves=FIXED_MAX_SOLVES)
+
+    def guess(board, cs, rows, cols, mines, flags, probs):
+        return engine.choose(board, cs, rows, cols, mines, flags, probs=probs)
+    guess.engine = engine
+    return guess
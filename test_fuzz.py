@@ -0,0 +1,408 @@
+"""
+확률 엔진 차등 퍼저 (solver vs 완전 열거)
+==========================================
+- 작은 무작위 국면을 만들어 solver.solve_position (= _calc_probabilities) 결과를
+  국면과 모순 없는 모든 지뢰 배치의 완전 열거와 비교
+    · 셀별 확률: Fraction 으로 구한 정답을 float 로 바꾼 값과 비트 단위 일치
+    · 가중치: 모순 없는 배치 수와 정확히 일치
+    · 국소 패턴 추론 (deduce.LocalDeducer): 확정 안전/지뢰가 정답 0 / 1 과 일치
+- 케이스마다 solver 소요 시간 기록 → p50/p95/max, 가장 느린 케이스
+- 불일치 국면은 행/열 잘라내기, 셀 닫기, 깃발 제거, 지뢰 제거를 반복해
+  더 이상 줄일 수 없는 최소 재현 국면으로 축소한 뒤 회귀 코퍼스(JSON)에 저장
+- --max-nodes / --max-group 으로 solver 한도를 낮추면 폴백(fallback_cells)·
+  무작위 부분 열거 경로도 검사할 수 있다
+- 반복 검사: 낮은 노드 한도 (--repeat-nodes) 에서 같은 국면을 두 번 풀어
+  결과가 같은지 (중단된 계수가 성분 캐시에 흔적을 남기지 않는지) 확인
+- 깃발 토글 검사: 한 LocalDeducer 로 깃발 / 물음표를 꽂았다 빼며 계속 추론해
+  매번 새 LocalDeducer 결과와 같은지 (이전 국면에서 찾은 셀이 남지 않는지) 확인
+
+python test_fuzz.py                 # 기본 2000 케이스 + 코퍼스 재실행
+python test_fuzz.py -n 500 --max-nodes 50 --corpus /tmp/corpus
+python test_fuzz.py --replay        # 코퍼스만 재실행
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+from fractions import Fraction
+from itertools import combinations
+
+import solver
+from deduce import LocalDeducer
+from mineboard import (
+    STATE_CLOSED, STATE_OPEN, STATE_FLAG, STATE_QUESTION, neighbors, numbers_from_mask,
+    open_cells,
+)
+from simulate import percentile
+
+CORPUS_DIR       = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fuzz_corpus")
+MAX_BRUTE_CELLS  = 16     # 완전 열거할 닫힌 셀 수 상한 (2^16 이하)
+MAX_SIZE         = 6      # 무작위 국면 최대 행/열
+
+
+# ─────────────────────────────────────────────
+#  국면 생성
+# ─────────────────────────────────────────────
+def random_case(rng):
+    """
+    무작위 국면 → {"mask", "cs"} (rows/cols 는 mask 크기).
+    실제 게임처럼 열기는 연쇄 열기, 깃발은 진짜 지뢰에만 꽂는다.
+    """
+    while True:
+        rows, cols = rng.randint(2, MAX_SIZE), rng.randint(2, MAX_SIZE)
+        n = rng.randint(1, rows * cols - 1)
+        flat = [1] * n + [0] * (rows * cols - n)
+        rng.shuffle(flat)
+        mask  = [flat[r * cols:(r + 1) * cols] for r in range(rows)]
+        board = numbers_from_mask(mask)
+        cs    = [[STATE_CLOSED] * cols for _ in range(rows)]
+        safe  = [(r, c) for r in range(rows) for c in range(cols) if not mask[r][c]]
+        for r, c in rng.sample(safe, rng.randint(1, max(1, len(safe) // 2))):
+            open_cells(board, cs, r, c, rows, cols)
+        flag_p = rng.choice((0.0, 0.0, 0.3, 0.7))
+        for r in range(rows):
+            for c in range(cols):
+                if mask[r][c] and rng.random() < flag_p:
+                    cs[r][c] = STATE_FLAG
+        closed = sum(row.count(STATE_CLOSED) for row in cs)
+        if 0 < closed <= MAX_BRUTE_CELLS:
+            return {"mask": mask, "cs": cs}
+
+
+# ─────────────────────────────────────────────
+#  완전 열거 (정답)
+# ─────────────────────────────────────────────
+def brute_force(board, cs, rows, cols, mine_count, flags_count):
+    """
+    닫힌 셀의 모든 배치 중 열린 숫자와 남은 지뢰 수를 만족하는 것만 집계
+    → ({셀: Fraction 확률}, 배치 수). 배치가 없으면 ({}, 0).
+    """
+    closed = [(r, c) for r in range(rows) for c in range(cols) if cs[r][c] == STATE_CLOSED]
+    bit    = {cell: 1 << i for i, cell in enumerate(closed)}
+    checks = []
+    for r in range(rows):
+        for c in range(cols):
+            if cs[r][c] != STATE_OPEN or board[r][c] < 0:
+                continue
+            nbrs = neighbors(r, c, rows, cols)
+            need = board[r][c] - sum(1 for nr, nc in nbrs if cs[nr][nc] == STATE_FLAG)
+            checks.append((sum(bit.get(n, 0) for n in nbrs), need))
+
+    remaining = mine_count - flags_count
+    counts, total = [0] * len(closed), 0
+    if 0 <= remaining <= len(closed):
+        for combo in combinations(range(len(closed)), remaining):
+            bits = 0
+            for i in combo:
+                bits |= 1 << i
+            if all((bits & m).bit_count() == need for m, need in checks):
+                total += 1
+                for i in combo:
+                    counts[i] += 1
+    if not total:
+        return {}, 0
+    return {cell: Fraction(counts[i], total) for i, cell in enumerate(closed)}, total
+
+
+# ─────────────────────────────────────────────
+#  비교
+# ─────────────────────────────────────────────
+def check_case(case, seed=0):
+    """
+    → (불일치 설명 또는 None, solver 소요 초).
+    모순 국면 (정답 배치 0개) 은 비교 대상이 아니므로 None.
+    성분 캐시를 비우고 풀어서 결과가 앞서 푼 국면에 좌우되지 않게 한다
+    (shrink · run_replay 도 이 함수를 거치므로 같은 조건).
+    """
+    mask, cs = case["mask"], case["cs"]
+    rows, cols = len(mask), len(mask[0])
+    board = numbers_from_mask(mask)
+    mines = sum(map(sum, mask))
+    flags = sum(row.count(STATE_FLAG) for row in cs)
+
+    random.seed(seed)          # 대그룹 무작위 열거 재현
+    solver._component_cache.clear()
+    t0 = time.perf_counter()
+    probs, weight = solver.solve_position(board, cs, rows, cols, mines, flags)
+    elapsed = time.perf_counter() - t0
+
+    exact, total = brute_force(board, cs, rows, cols, mines, flags)
+    if not total:
+        return None, elapsed
+    if weight != total:
+        return f"가중치 {weight} ≠ 정답 {total}", elapsed
+    for cell, p in exact.items():
+        got = probs.get(cell)
+        if got is None or got != float(p):
+            return f"셀 {cell}: {got!r} ≠ 정답 {p} ({float(p)!r})", elapsed
+    extra = set(probs) - set(exact)
+    if extra:
+        return f"닫히지 않은 셀 확률 반환: {sorted(extra)[:3]}", elapsed
+
+    safe, mine = LocalDeducer().deduce(board, cs, rows, cols)
+    for cell in sorted(safe | mine):
+        want = 0 if cell in safe else 1
+        if exact.get(cell) != want:
+            return f"국소 추론 셀 {cell}: {want} ≠ 정답 {exact.get(cell)}", elapsed
+    return None, elapsed
+
+
+def check_repeat(case, seed=0):
+    """
+    성분 캐시를 비우고 같은 국면을 두 번 풀기 → 결과가 다르면 설명, 같으면 None.
+    첫 풀이가 노드 한도로 폴백했더라도 두 번째 풀이는 같은 결과여야 한다.
+    """
+    mask, cs = case["mask"], case["cs"]
+    rows, cols = len(mask), len(mask[0])
+    board = numbers_from_mask(mask)
+    mines = sum(map(sum, mask))
+    flags = sum(row.count(STATE_FLAG) for row in cs)
+
+    solver._component_cache.clear()
+    out = []
+    for _ in range(2):
+        random.seed(seed)
+        out.append(solver.solve_position(board, cs, rows, cols, mines, flags))
+    if out[0] == out[1]:
+        return None
+    diff = sorted(k for k in out[0][0] if out[0][0][k] != out[1][0].get(k))
+    return f"두 번째 풀이가 다름: 가중치 {out[0][1]} → {out[1][1]}, 셀 {diff[:3]}"
+
+
+def check_toggle(case, rng, steps=6):
+    """
+    닫힌 셀에 깃발 / 물음표를 꽂았다 빼며 (틀린 깃발 포함) 같은 LocalDeducer 로
+    계속 추론 → 새 LocalDeducer 와 결과가 다르면 설명, 같으면 None.
+    마지막에 원래 국면으로 되돌린 결과는 정답 0 / 1 과도 맞아야 한다.
+    """
+    mask, cs = case["mask"], [row[:] for row in case["cs"]]
+    rows, cols = len(mask), len(mask[0])
+    board = numbers_from_mask(mask)
+    closed = [(r, c) for r in range(rows) for c in range(cols) if cs[r][c] == STATE_CLOSED]
+    if not closed:
+        return None
+
+    deducer = LocalDeducer()
+    deducer.deduce(board, cs, rows, cols)
+    marked = []
+    for step in range(steps + 1):
+        if step == steps:                       # 원래 국면으로 되돌림
+            for r, c in marked:
+                cs[r][c] = STATE_CLOSED
+        else:
+            r, c = rng.choice(closed)
+            if cs[r][c] == STATE_CLOSED:
+                cs[r][c] = rng.choice((STATE_FLAG, STATE_QUESTION))
+                marked.append((r, c))
+            else:
+                cs[r][c] = STATE_CLOSED
+        got  = deducer.deduce(board, cs, rows, cols)
+        want = LocalDeducer().deduce(board, cs, rows, cols)
+        if got != want:
+            return f"{step + 1}번째 토글 뒤 증분 {got} ≠ 새로 {want}"
+        if any(cs[r][c] != STATE_CLOSED for r, c in got[0] | got[1]):
+            return f"{step + 1}번째 토글 뒤 닫히지 않은 셀 반환: {got}"
+
+    exact, total = brute_force(board, cs, rows, cols, sum(map(sum, mask)),
+                               sum(row.count(STATE_FLAG) for row in cs))
+    for cell in sorted(got[0] | got[1]):
+        want = 0 if cell in got[0] else 1
+        if total and exact.get(cell) != want:
+            return f"되돌린 뒤 국소 추론 셀 {cell}: {want} ≠ 정답 {exact.get(cell)}"
+    return None
+
+
+# ─────────────────────────────────────────────
+#  축소 (최소 재현 국면)
+# ─────────────────────────────────────────────
+def _crops(case):
+    mask, cs = case["mask"], case["cs"]
+    rows, cols = len(mask), len(mask[0])
+    if rows > 1:
+        yield {"mask": mask[1:],  "cs": cs[1:]}
+        yield {"mask": mask[:-1], "cs": cs[:-1]}
+    if cols > 1:
+        yield {"mask": [r[1:] for r in mask],  "cs": [r[1:] for r in cs]}
+        yield {"mask": [r[:-1] for r in mask], "cs": [r[:-1] for r in cs]}
+
+
+def _edits(case):
+    """셀 하나만 바꾼 후보: 열린 셀 닫기 → 깃발 제거 → 닫힌 지뢰 제거"""
+    mask, cs = case["mask"], case["cs"]
+    for want, change in ((STATE_OPEN, "close"), (STATE_FLAG, "unflag"),
+                         (STATE_CLOSED, "unmine")):
+        for r, row in enumerate(cs):
+            for c, st in enumerate(row):
+                if st != want or (change == "unmine" and not mask[r][c]):
+                    continue
+                new_cs   = [list(x) for x in cs]
+                new_mask = [list(x) for x in mask]
+                if change == "unmine":
+                    new_mask[r][c] = 0
+                else:
+                    new_cs[r][c] = STATE_CLOSED
+                yield {"mask": new_mask, "cs": new_cs}
+
+
+def shrink(case, seed=0):
+    """check_case 가 계속 실패하는 동안 국면을 줄여 나감"""
+    changed = True
+    while changed:
+        changed = False
+        for cand in (*_crops(case), *_edits(case)):
+            if not any(STATE_CLOSED in row for row in cand["cs"]):
+                continue
+            if check_case(cand, seed)[0] is not None:
+                case, changed = cand, True
+                break
+    return case
+
+
+# ─────────────────────────────────────────────
+#  회귀 코퍼스
+# ─────────────────────────────────────────────
+def _limits():
+    return {"max_nodes": solver.MAX_BT_NODES, "max_group": solver.MAX_GROUP_SIZE}
+
+
+def _set_limits(limits):
+    solver.MAX_BT_NODES   = limits["max_nodes"]
+    solver.MAX_GROUP_SIZE = limits["max_group"]
+
+
+def save_case(case, seed, detail, corpus_dir=CORPUS_DIR):
+    """축소된 국면을 내용 해시 이름의 JSON 으로 저장 → 경로"""
+    entry = {"mask": case["mask"], "cs": case["cs"], "seed": seed,
+             "limits": _limits(), "detail": detail}
+    key  = json.dumps([entry["mask"], entry["cs"], entry["limits"]])
+    path = os.path.join(corpus_dir, f"case_{hashlib.sha1(key.encode()).hexdigest()[:12]}.json")
+    os.makedirs(corpus_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, ensure_ascii=False)
+    return path
+
+
+def run_replay(corpus_dir=CORPUS_DIR):
+    """코퍼스의 모든 국면을 저장 당시 solver 한도로 다시 검사 → 실패 수"""
+    if not os.path.isdir(corpus_dir):
+        print("  코퍼스 없음")
+        return 0
+    saved, fails = _limits(), 0
+    names = sorted(n for n in os.listdir(corpus_dir) if n.endswith(".json"))
+    try:
+        for name in names:
+            with open(os.path.join(corpus_dir, name), encoding="utf-8") as f:
+                entry = json.load(f)
+            _set_limits(entry["limits"])
+            err, _ = check_case(entry, entry["seed"])
+            if err is not None:
+                fails += 1
+                print(f"  ❌ {name}: {err}")
+    finally:
+        _set_limits(saved)
+    print(f"  코퍼스 {len(names)}건 중 실패 {fails}건")
+    return fails
+
+
+# ─────────────────────────────────────────────
+#  퍼징
+# ─────────────────────────────────────────────
+def run_fuzz(n_cases, seed=0, corpus_dir=CORPUS_DIR, max_report=5):
+    """무작위 국면 n_cases 개 비교 → 실패 수"""
+    rng = random.Random(seed)
+    times, fails = [], 0
+    slowest = (0.0, None)
+    for i in range(n_cases):
+        case = random_case(rng)
+        err, elapsed = check_case(case, seed + i)
+        times.append(elapsed)
+        if elapsed > slowest[0]:
+            slowest = (elapsed, case)
+        if err is None:
+            continue
+        fails += 1
+        if fails <= max_report:
+            small = shrink(case, seed + i)
+            small_err, _ = check_case(small, seed + i)
+            if small_err is None:        # 축소본이 재현되지 않으면 원래 국면을 저장
+                small, small_err = case, check_case(case, seed + i)[0]
+            if small_err is None:
+                print(f"  ❌ 케이스 {i}: {err}\n     → 다시 풀면 재현되지 않음 (저장 안 함)")
+                continue
+            path = save_case(small, seed + i, small_err, corpus_dir)
+            rows, cols = len(small["mask"]), len(small["mask"][0])
+            print(f"  ❌ 케이스 {i}: {small_err}\n     → {rows}×{cols} 로 축소, {path}")
+
+    times.sort()
+    print(f"  케이스 {n_cases}개 | 불일치 {fails}건 | solver 시간 "
+          f"p50 {percentile(times, 50) * 1e3:.3f}ms · p95 {percentile(times, 95) * 1e3:.3f}ms"
+          f" · max {times[-1] * 1e3:.3f}ms" if times else "  케이스 없음")
+    if slowest[1] is not None:
+        closed = sum(row.count(STATE_CLOSED) for row in slowest[1]["cs"])
+        print(f"  가장 느린 케이스: {len(slowest[1]['mask'])}×{len(slowest[1]['mask'][0])}, "
+              f"닫힌 셀 {closed}개")
+    return fails
+
+
+def run_repeat(n_cases, seed=0, max_nodes=5):
+    """노드 한도 max_nodes 에서 무작위 국면 n_cases 개를 두 번씩 풀기 → 실패 수"""
+    saved = _limits()
+    solver.MAX_BT_NODES = max_nodes
+    rng, fails = random.Random(seed), 0
+    try:
+        for i in range(n_cases):
+            err = check_repeat(random_case(rng), seed + i)
+            if err is not None:
+                fails += 1
+                if fails <= 5:
+                    print(f"  ❌ 반복 케이스 {i}: {err}")
+    finally:
+        _set_limits(saved)
+    print(f"  반복 풀이 {n_cases}개 (노드 한도 {max_nodes}) | 불일치 {fails}건")
+    return fails
+
+
+def run_toggle(n_cases, seed=0):
+    """무작위 국면 n_cases 개에서 깃발 토글 검사 → 실패 수"""
+    rng, fails = random.Random(seed), 0
+    for i in range(n_cases):
+        err = check_toggle(random_case(rng), rng)
+        if err is not None:
+            fails += 1
+            if fails <= 5:
+                print(f"  ❌ 토글 케이스 {i}: {err}")
+    print(f"  깃발 토글 {n_cases}개 | 불일치 {fails}건")
+    return fails
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="확률 엔진 차등 퍼저")
+    ap.add_argument("--cases", "-n", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--corpus", default=CORPUS_DIR, help="회귀 코퍼스 폴더")
+    ap.add_argument("--replay", action="store_true", help="코퍼스만 재실행")
+    ap.add_argument("--max-nodes", type=int, help="solver 백트래킹 노드 한도 (폴백 경로 검사)")
+    ap.add_argument("--max-group", type=int, help="solver 대그룹 기준 (무작위 열거 경로 검사)")
+    ap.add_argument("--repeat-nodes", type=int, default=5,
+                    help="반복 풀이 검사의 노드 한도 (0 이면 건너뜀)")
+    args = ap.parse_args()
+
+    print("=" * 60)
+    print("  확률 엔진 차등 퍼징 (solver vs 완전 열거)")
+    print("=" * 60)
+    t0 = time.time()
+    fails = run_replay(args.corpus)
+    if not args.replay:
+        if args.max_nodes is not None:
+            solver.MAX_BT_NODES = args.max_nodes
+        if args.max_group is not None:
+            solver.MAX_GROUP_SIZE = args.max_group
+        if args.repeat_nodes:
+            fails += run_repeat(min(args.cases, 500), args.seed, args.repeat_nodes)
+        fails += run_toggle(min(args.cases, 500), args.seed)
+        fails += run_fuzz(args.cases, args.seed, args.corpus)
+    print(f"  소요 시간: {time.time() - t0:.1f}초")
+    print(f"  판정: {'✅ PASS' if fails == 0 else '❌ FAIL'}")
+    print("=" * 60)
@@ -6,6 +6,8 @@
 import random
 from math import comb
 
+from mineboard import generate_board, mine_cells
+
 STATE_CLOSED   = 0
 STATE_OPEN     = 1
 STATE_FLAG     = 2
@@ -15,16 +17,9 @@ def neighbors(r, c, rows, cols):
             if (dr,dc)!=(0,0) and 0<=r+dr<rows and 0<=c+dc<cols]
 
 def place_mines(board, rows, cols, n_mines, sr, sc):
-    safe = {(r,c) for r in range(sr-1,sr+2) for c in range(sc-1,sc+2)
-            if 0<=r<rows and 0<=c<cols}
-    pool = [(r,c) for r in range(rows) for c in range(cols) if (r,c) not in safe]
-    mines = set(random.sample(pool, min(n_mines, len(pool))))
-    for r,c in mines: board[r][c] = -1
-    for r in range(rows):
-        for c in range(cols):
-            if board[r][c] == -1: continue
-            board[r][c] = sum(1 for nr,nc in neighbors(r,c,rows,cols) if board[nr][nc]==-1)
-    return mines
+    new_board, mask = generate_board(rows, cols, n_mines, sr, sc)
+    board[:] = new_board
+    return mine_cells(mask)
 
 def open_bfs(board, cs, r, c, rows, cols):
     q, visited = [(r,c)], set()
@@ -5,15 +5,22 @@
 """
 import random
 from test_hint import *
+from noguess import generate_no_guess_board
+from strategies import make_strategy
 
 
-def simulate_with_star(rows, cols, n_mines):
+def simulate_with_star(rows, cols, n_mines, no_guess=False, strategy="min"):
+    """⭐ 셀은 strategies.py 의 전략 (이름) 으로 선택"""
+    guess = make_strategy(strategy)
     board = [[0]*cols for _ in range(rows)]
     cs    = [[STATE_CLOSED]*cols for _ in range(rows)]
     flags = 0
 
     sr, sc_ = rows//2, cols//2
-    place_mines(board, rows, cols, n_mines, sr, sc_)
+    if no_guess:
+        board = generate_no_guess_board(rows, cols, n_mines, sr, sc_)
+    else:
+        place_mines(board, rows, cols, n_mines, sr, sc_)
     open_bfs(board, cs, sr, sc_, rows, cols)
 
     star_attempts = 0    # ⭐ 클릭 횟수
@@ -47,7 +54,7 @@ def simulate_with_star(rows, cols, n_mines):
                            if cs[r][c]==STATE_CLOSED}
             if not closed_probs:
                 break
-            best = min(closed_probs, key=lambda k: closed_probs[k])
+            best = guess(board, cs, rows, cols, n_mines, flags, closed_probs)
             best_p = closed_probs[best]
             star_attempts += 1
             star_probs.append(round(best_p*100))
@@ -68,13 +75,20 @@ def simulate_with_star(rows, cols, n_mines):
     return star_attempts, star_success, star_fail, star_probs
 
 
-def run_star_test(rows, cols, n_mines, n_games, label):
-    print(f"\n[{label}] {rows}×{cols}, 지뢰 {n_mines}개, {n_games}게임")
+def run_star_test(rows, cols, n_mines, n_games, label, no_guess=False,
+                  strategy="min", seed=None):
+    """seed 를 주면 게임 i 마다 seed+i 로 보드를 고정 (정책 간 비교용)"""
+    mode = " (노게스 보드)" if no_guess else ""
+    if strategy != "min":
+        mode += f" (⭐ {strategy})"
+    print(f"\n[{label}{mode}] {rows}×{cols}, 지뢰 {n_mines}개, {n_games}게임")
     total_att = 0; total_suc = 0; total_fail = 0
     all_probs = []; wins = 0
 
     for i in range(n_games):
-        att, suc, fail, ps = simulate_with_star(rows, cols, n_mines)
+        if seed is not None:
+            random.seed(seed + i)
+        att, suc, fail, ps = simulate_with_star(rows, cols, n_mines, no_guess, strategy)
         total_att  += att
         total_suc  += suc
         total_fail += fail
@@ -98,6 +112,7 @@ def run_star_test(rows, cols, n_mines, n_games, label):
         for pct, cnt in sorted(dist.items())[:10]:
             bar = '█' * (cnt * 40 // max(dist.values()))
             print(f"    {pct:3d}% : {cnt:4d}회 {bar}")
+    return win_rate
 
 
 if __name__ == "__main__":
@@ -112,6 +127,20 @@ if __name__ == "__main__":
     run_star_test(16, 16, 40,  300, "중급")
     run_star_test(16, 30, 99,  500, "고급")
 
+    # ⭐ 정책 비교: 같은 보드에서 최저 확률 vs lookahead
+    # (시간 제한 lookahead 는 기계 부하에 따라 수가 달라지므로 solver 호출 수
+    #  예산으로 자른 lookahead-fixed 를 씀 → 같은 seed 면 같은 결과)
+    for rows, cols, n_mines, n_games, label in [(9, 9, 10, 300, "초급"),
+                                                 (16, 16, 40, 100, "중급")]:
+        base = run_star_test(rows, cols, n_mines, n_games, label, seed=1000)
+        look = run_star_test(rows, cols, n_mines, n_games, label, seed=1000,
+                             strategy="lookahead-fixed")
+        print(f"  ▶ [{label}] 클리어율 변화: {base:.1f}% → {look:.1f}% ({look - base:+.1f}%p)")
+
+    # 노게스 보드: ⭐ 클릭이 0회여야 정상
+    run_star_test(9,  9,  10,  200, "초급", no_guess=True)
+    run_star_test(16, 16, 40,  100, "중급", no_guess=True)
+
     print(f"\n{'='*60}")
     print(f"  소요 시간: {time.time()-t0:.1f}초")
     print("="*60)
@@ -0,0 +1,142 @@
+"""
+UI 이벤트 지연 프로파일러 (선택 기능)
+======================================
+python minesweeper.py play --profile 로 켠다. 꺼져 있으면 아무것도 감싸지 않는다.
+
+- 지정한 핸들러(메서드)를 perf_counter 타이머로 감싸 입력부터 다시 그리기
+  완료까지 측정 (가장 바깥 핸들러가 끝나면 update_idletasks 로 캔버스
+  반영까지 기다린 시간을 포함)
+- 한 번의 호출 시간을 solver / canvas / 기타 로 나눔
+    · solver : 확률 계산, lookahead, 국소 추론 호출
+    · canvas : Canvas 의 그리기·삭제 메서드 + 다시 그리기 대기
+- 최근 RING_SIZE 개 표본은 링 버퍼(deque)에, 핸들러별 히스토그램은 누적
+- 종료 시 또는 F9 로 핸들러별 p50/p95/p99 출력
+"""
+
+import sys
+import time
+from collections import deque
+
+RING_SIZE = 4096
+HIST_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)   # 마지막 칸은 그 이상
+
+# Canvas 에서 시간을 재는 메서드
+CANVAS_METHODS = ("create_rectangle", "create_line", "create_text", "create_oval",
+                  "create_polygon", "create_image", "delete", "itemconfig",
+                  "coords", "tag_raise", "tag_lower", "move")
+
+
+class UIProfiler:
+    """Minesweeper 인스턴스 하나를 계측. 표본은 (핸들러, 전체, solver, canvas) 초."""
+
+    def __init__(self, root, ring_size: int = RING_SIZE):
+        self.root    = root
+        self.samples = deque(maxlen=ring_size)
+        self.hist    = {}       # 핸들러 → 구간별 누적 횟수
+        self._stack  = []       # 진행 중인 핸들러의 [solver, canvas] 누적
+        self._active = [False, False]   # solver / canvas 측정 중 여부
+
+    # ──────────────────────────────────────────
+    #  감싸기
+    # ──────────────────────────────────────────
+    def wrap_handler(self, name, func):
+        """핸들러 측정: 가장 바깥 호출이면 다시 그리기 완료까지 포함"""
+        def wrapper(*args, **kwargs):
+            frame = [0.0, 0.0]
+            self._stack.append(frame)
+            t0 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if len(self._stack) == 1:
+                    t1 = time.perf_counter()
+                    self.root.update_idletasks()
+                    frame[1] += time.perf_counter() - t1
+                total = time.perf_counter() - t0
+                self._stack.pop()
+                self._record(name, total, frame[0], frame[1])
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    def _timed(self, func, slot):
+        """
+        solver(0) / canvas(1) 시간: 진행 중인 모든 핸들러에 더함.
+        같은 종류 안에서 중첩 호출되면 바깥 호출만 센다.
+        """
+        def wrapper(*args, **kwargs):
+            if not self._stack or self._active[slot]:
+                return func(*args, **kwargs)
+            self._active[slot] = True
+            t0 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                dt = time.perf_counter() - t0
+                self._active[slot] = False
+                for frame in self._stack:
+                    frame[slot] += dt
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    def instrument(self, obj, handlers, solver_calls=()):
+        """obj 의 핸들러 / solver 메서드를 인스턴스 속성으로 덮어씀"""
+        for name in handlers:
+            setattr(obj, name, self.wrap_handler(name, getattr(obj, name)))
+        for owner, name in solver_calls:
+            setattr(owner, name, self._timed(getattr(owner, name), 0))
+
+    def instrument_canvas(self, canvas):
+        for name in CANVAS_METHODS:
+            setattr(canvas, name, self._timed(getattr(canvas, name), 1))
+
+    # ──────────────────────────────────────────
+    #  기록 / 출력
+    # ──────────────────────────────────────────
+    def _record(self, name, total, solver_s, canvas_s):
+        self.samples.append((name, total, solver_s, canvas_s))
+        h = self.hist.setdefault(name, [0] * (len(HIST_BOUNDS_MS) + 1))
+        ms = total * 1e3
+        for i, bound in enumerate(HIST_BOUNDS_MS):
+            if ms < bound:
+                h[i] += 1
+                break
+        else:
+            h[-1] += 1
+
+    def summary(self) -> dict:
+        """핸들러 → {count, p50, p95, p99, max, solver, canvas} (ms, 링 버퍼 기준)"""
+        from simulate import percentile
+        by_name = {}
+        for name, total, s, c in self.samples:
+            by_name.setdefault(name, []).append((total, s, c))
+        out = {}
+        for name, rows in by_name.items():
+            totals = sorted(t for t, _, _ in rows)
+            n = len(rows)
+            out[name] = {
+                "count":  n,
+                "p50":    percentile(totals, 50) * 1e3,
+                "p95":    percentile(totals, 95) * 1e3,
+                "p99":    percentile(totals, 99) * 1e3,
+                "max":    totals[-1] * 1e3,
+                "solver": sum(s for _, s, _ in rows) / n * 1e3,
+                "canvas": sum(c for _, _, c in rows) / n * 1e3,
+            }
+        return out
+
+    def format(self) -> str:
+        lines = [f"[UI 프로파일] 최근 표본 {len(self.samples)}개 (ms, solver/canvas 는 평균)"]
+        for name, s in sorted(self.summary().items(), key=lambda kv: -kv[1]["p99"]):
+            lines.append(
+                f"  {name:<18} n={s['count']:<5} p50 {s['p50']:7.2f} · p95 {s['p95']:7.2f} · "
+                f"p99 {s['p99']:7.2f} · max {s['max']:7.2f} | solver {s['solver']:6.2f} · "
+                f"canvas {s['canvas']:6.2f}"
+            )
+        labels = [f"<{b}" for b in HIST_BOUNDS_MS] + [f"≥{HIST_BOUNDS_MS[-1]}"]
+        for name, h in sorted(self.hist.items()):
+            cells = " ".join(f"{lab}:{n}" for lab, n in zip(labels, h) if n)
+            lines.append(f"  히스토그램 {name}: {cells}")
+        return "\n".join(lines)
+
+    def dump(self, file=None):
+        print(self.format(), file=file or sys.stdout, flush=True)
@@ -0,0 +1,313 @@
+"""
+무한 월드 모드 (청크 단위 지연 생성)
+====================================
+크기가 정해진 rows×cols 보드 대신, 좌표가 한없이 이어지는 월드.
+
+- 지뢰: 청크 (CHUNK×CHUNK) 마다 seed 와 청크 좌표로 만든 난수로 셀별 독립
+  확률 density 로 생성 → 같은 seed 면 어디를 먼저 가든 같은 월드. 지뢰 층은
+  저장하지 않고 필요할 때 다시 만든다 (LRU 캐시).
+- 첫 클릭 주변 3×3 은 지뢰가 없다 (게임 창과 같은 안전지대).
+- 셀 상태: 손댄 청크만 dict 에 (희소). 상주 청크가 max_resident 를 넘으면
+  마지막 수에서 먼 청크부터 SQLite 파일로 내보내고, 다시 필요하면 읽어 온다.
+- 연쇄 열기: 전역 좌표로 BFS 하므로 청크 경계를 그대로 넘는다. 0 영역이
+  끝나지 않는 일이 없도록 density 는 MIN_DENSITY 이상 ((1−d)^9 가 8방향 격자의
+  자리 스며듦 문턱 ≈ 0.41 보다 작음), 혹시 몰라 한 번에 FLOOD_LIMIT 셀까지만.
+- 확률: 지정한 셀 주변 창 (반지름 WINDOW_RADIUS) 의 열린 숫자만으로 제약을 만들어
+  solver 의 propagate / count_group 으로 센다. 전체 지뢰 수가 없으므로 배치 가중치는
+  셀마다 독립인 사전확률 (d/(1−d))^지뢰수 이고, 제약 밖 셀은 density.
+
+메모리는 상주 청크 + 지뢰 층 캐시, 한 수의 비용은 연 셀 수 + 창 크기로 묶인다
+(탐험한 넓이와 무관). 디스크에는 손댄 청크만 쌓인다.
+"""
+
+import random
+import sqlite3
+from collections import OrderedDict
+
+from mineboard import STATE_CLOSED, STATE_OPEN, STATE_FLAG
+
+CHUNK           = 16
+DEFAULT_DENSITY = 0.18
+MIN_DENSITY     = 0.12
+MAX_RESIDENT    = 256       # 메모리에 둘 청크 상태 수
+MINE_CACHE_SIZE = 1024      # 다시 만들 수 있는 지뢰 층 캐시
+FLOOD_LIMIT     = 100_000   # 한 번의 연쇄 열기 최대 셀 수
+WINDOW_RADIUS   = 8         # 확률 계산 창 반지름 (셀)
+
+_OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+
+class World:
+    """무한 월드 한 판. 좌표 (r, c) 는 음수도 된다."""
+
+    def __init__(self, seed: int = 0, density: float = DEFAULT_DENSITY,
+                 path: str = ":memory:", max_resident: int = MAX_RESIDENT):
+        if not MIN_DENSITY <= density < 1:
+            raise ValueError(f"density 는 {MIN_DENSITY} 이상 1 미만이어야 합니다")
+        self.seed, self.density = seed, density
+        self.max_resident = max_resident
+        self.safe   = frozenset()            # 첫 클릭 안전지대
+        self.started = False
+        self._chunks = OrderedDict()         # 청크 → 상태 bytearray (LRU)
+        self._mines  = OrderedDict()         # 청크 → 지뢰 bytearray (LRU, 다시 생성 가능)
+        self._absent = OrderedDict()         # 저장된 적 없는 청크 (LRU, DB 조회 생략)
+        self._focus  = (0, 0)                # 마지막 수의 청크 (내보내기 기준)
+        self.open_count = self.flags_count = 0
+        self.stats = {"evicted": 0, "loaded": 0}
+        self._db = sqlite3.connect(path)
+        self._db.execute("CREATE TABLE IF NOT EXISTS chunks ("
+                         "cr INTEGER, cc INTEGER, state BLOB, PRIMARY KEY (cr, cc))")
+
+    # ──────────────────────────────────────────
+    #  지뢰 층 (저장하지 않음)
+    # ──────────────────────────────────────────
+    def _mine_layer(self, key):
+        layer = self._mines.get(key)
+        if layer is not None:
+            self._mines.move_to_end(key)
+            return layer
+        rng, d = random.Random(f"{self.seed}/{key[0]}/{key[1]}"), self.density
+        layer = bytearray(rng.random() < d for _ in range(CHUNK * CHUNK))
+        self._mines[key] = layer
+        if len(self._mines) > MINE_CACHE_SIZE:
+            self._mines.popitem(last=False)
+        return layer
+
+    def is_mine(self, r: int, c: int) -> bool:
+        if (r, c) in self.safe:
+            return False
+        return bool(self._mine_layer((r // CHUNK, c // CHUNK))[(r % CHUNK) * CHUNK + c % CHUNK])
+
+    def number(self, r: int, c: int) -> int:
+        """이웃 지뢰 수 (지뢰 셀이면 -1)"""
+        if self.is_mine(r, c):
+            return -1
+        return sum(self.is_mine(r + dr, c + dc) for dr, dc in _OFFSETS)
+
+    # ──────────────────────────────────────────
+    #  셀 상태 (희소 청크 + SQLite 내보내기)
+    # ──────────────────────────────────────────
+    def _chunk(self, key, create: bool):
+        """청크 상태 bytearray. 손댄 적 없고 create=False 면 None (전부 닫힘)"""
+        st = self._chunks.get(key)
+        if st is not None:
+            self._chunks.move_to_end(key)
+            return st
+        if key in self._absent and not create:
+            return None
+        row = self._db.execute("SELECT state FROM chunks WHERE cr = ? AND cc = ?", key).fetchone()
+        if row is not None:
+            st = bytearray(row[0])
+            self.stats["loaded"] += 1
+        elif create:
+            st = bytearray(CHUNK * CHUNK)            # STATE_CLOSED == 0
+        else:
+            self._absent[key] = None
+            if len(self._absent) > MINE_CACHE_SIZE:
+                self._absent.popitem(last=False)
+            return None
+        self._absent.pop(key, None)
+        self._chunks[key] = st
+        return st
+
+    def state(self, r: int, c: int) -> int:
+        st = self._chunk((r // CHUNK, c // CHUNK), False)
+        return STATE_CLOSED if st is None else st[(r % CHUNK) * CHUNK + c % CHUNK]
+
+    def _set(self, r: int, c: int, new: int):
+        st = self._chunk((r // CHUNK, c // CHUNK), True)
+        st[(r % CHUNK) * CHUNK + c % CHUNK] = new
+
+    def _evict(self):
+        """상주 청크가 한도를 넘으면 마지막 수에서 먼 청크부터 3/4 까지 내보냄"""
+        if len(self._chunks) <= self.max_resident:
+            return
+        fr, fc = self._focus
+        far = sorted(self._chunks, key=lambda k: -max(abs(k[0] - fr), abs(k[1] - fc)))
+        rows = [(k[0], k[1], bytes(self._chunks.pop(k)))
+                for k in far[:len(far) - self.max_resident * 3 // 4]]
+        self._db.executemany("INSERT OR REPLACE INTO chunks VALUES (?, ?, ?)", rows)
+        self._db.commit()
+        self.stats["evicted"] += len(rows)
+
+    @property
+    def resident(self) -> int:
+        return len(self._chunks)
+
+    def stored(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    # ──────────────────────────────────────────
+    #  수 두기
+    # ──────────────────────────────────────────
+    def start(self, r: int = 0, c: int = 0):
+        """첫 클릭: 주변 3×3 을 안전지대로 고정하고 연다 → 열린 셀 목록"""
+        self.safe = frozenset((r + dr, c + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+        self.started = True
+        return self.open_many([(r, c)])[0]
+
+    def open_many(self, cells):
+        """
+        여러 셀을 한 번의 연쇄 열기로 (청크 경계를 넘어) 연다.
+        지뢰 대상은 열지 않는다 → (새로 열린 셀 목록, 행 우선 첫 지뢰 또는 None)
+        """
+        hit, queue, opened = None, [], []
+        for r, c in sorted(set(cells)):
+            if self.state(r, c) != STATE_CLOSED:
+                continue
+            if not self.is_mine(r, c):
+                queue.append((r, c))
+            elif hit is None:
+                hit = (r, c)
+        queue.reverse()             # 스택이므로 행 우선 첫 셀부터 꺼내도록
+        while queue and len(opened) < FLOOD_LIMIT:
+            r, c = queue.pop()
+            if self.state(r, c) != STATE_CLOSED:
+                continue
+            self._set(r, c, STATE_OPEN)
+            opened.append((r, c))
+            if self.number(r, c) == 0:
+                queue.extend((r + dr, c + dc) for dr, dc in _OFFSETS
+                             if self.state(r + dr, c + dc) == STATE_CLOSED)
+        self.open_count += len(opened)
+        # 보관 기준점: 밟은 지뢰, 없으면 마지막 대상 셀 (지뢰 보고와는 무관)
+        focus = hit or (cells[-1] if cells else None)
+        if focus is not None:
+            self._focus = (focus[0] // CHUNK, focus[1] // CHUNK)
+        self._evict()
+        return opened, hit
+
+    def toggle_flag(self, r: int, c: int) -> bool:
+        """닫힘 ↔ 깃발. 바뀌었으면 True"""
+        st = self.state(r, c)
+        if st == STATE_OPEN:
+            return False
+        self._set(r, c, STATE_FLAG if st == STATE_CLOSED else STATE_CLOSED)
+        self.flags_count += 1 if st == STATE_CLOSED else -1
+        self._focus = (r // CHUNK, c // CHUNK)
+        self._evict()
+        return True
+
+    # ──────────────────────────────────────────
+    #  창 안 확률
+    # ──────────────────────────────────────────
+    def probabilities(self, r: int, c: int, radius: int = WINDOW_RADIUS) -> dict:
+        """
+        (r, c) 중심 창의 열린 숫자로 만든 제약 → 닫힌 셀 (창 + 제약이 닿는 테두리) 확률.
+        그룹은 서로 독립 (전역 지뢰 수 없음), 노드 한도를 넘은 그룹은 density.
+        """
+        from solver import propagate, count_group
+        d = self.density
+        raw, window = set(), []
+        for rr in range(r - radius, r + radius + 1):
+            for cc in range(c - radius, c + radius + 1):
+                st = self.state(rr, cc)
+                if st == STATE_CLOSED:
+                    window.append((rr, cc))
+                if st != STATE_OPEN:
+                    continue
+                val = self.number(rr, cc)
+                if val <= 0:
+                    continue
+                rem, closed = val, []
+                for dr, dc in _OFFSETS:
+                    s = self.state(rr + dr, cc + dc)
+                    if s == STATE_FLAG:
+                        rem -= 1
+                    elif s == STATE_CLOSED:
+                        closed.append((rr + dr, cc + dc))
+                if closed:
+                    raw.add((rem, frozenset(closed)))
+
+        probs = dict.fromkeys(window, d)
+        safe, mine, cst = propagate(list(raw))
+        probs.update(dict.fromkeys(safe, 0.0))
+        probs.update(dict.fromkeys(mine, 1.0))
+
+        # 제약을 공유하는 셀끼리 그룹 (Union-Find)
+        parent = {}
+        def find(x):
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+        for _, cl in cst:
+            it = iter(cl)
+            root = find(next(it))
+            for cell in it:
+                parent[find(cell)] = root
+        groups = {}
+        for rem, cl in cst:
+            groups.setdefault(find(next(iter(cl))), []).append((rem, cl))
+
+        odds = d / (1 - d)
+        for group_cst in groups.values():
+            cells = sorted({cell for _, cl in group_cst for cell in cl})
+            res = count_group(cells, group_cst)
+            if res is None or not res[0]:
+                continue                    # 노드 한도 / 모순 → density 그대로
+            dist, tally, cells = res
+            w = [cnt * odds ** m for m, cnt in enumerate(dist)]
+            total = sum(w)
+            for cell, t in zip(cells, tally):
+                probs[cell] = sum(t[m] * odds ** m for m in range(len(t))) / total
+        return probs
+
+    def close(self):
+        self._db.close()
+
+
+# ─────────────────────────────────────────────
+#  탐험 벤치마크
+# ─────────────────────────────────────────────
+def run_world_bench(moves: int, seed: int = 0, density: float = DEFAULT_DENSITY,
+                    max_resident: int = MAX_RESIDENT, path: str = ":memory:") -> dict:
+    """
+    자동 탐험가: 창 안 0% 셀을 모두 열고 100% 셀에 깃발, 없으면 창 안 최저 확률 셀
+    (동점이면 동쪽) 을 연다. 지뢰를 밟으면 깃발로 표시하고 계속 간다.
+    수가 진행되어도 상주 청크 수와 한 수의 시간이 일정한지 본다.
+    """
+    import time
+    from simulate import percentile
+    world = World(seed, density, path, max_resident)
+    focus = (0, 0)
+    world.start(*focus)
+    lat, hits, peak, max_c = [], 0, 0, 0
+    for _ in range(moves):
+        t0 = time.perf_counter()
+        probs = world.probabilities(*focus)
+        safe  = [k for k, p in probs.items() if p == 0.0]
+        for cell in (k for k, p in probs.items() if p == 1.0):
+            if world.state(*cell) == STATE_CLOSED:
+                world.toggle_flag(*cell)
+        if safe:
+            opened, _ = world.open_many(safe)
+            if opened:
+                focus = max(opened, key=lambda k: (k[1], -abs(k[0])))
+        else:
+            cand = [k for k, p in probs.items() if p < 1.0]
+            if not cand:
+                break
+            focus = min(cand, key=lambda k: (probs[k], -k[1], abs(k[0])))
+            _, hit = world.open_many([focus])
+            if hit:
+                hits += 1
+                world.toggle_flag(*hit)
+        lat.append(time.perf_counter() - t0)
+        peak  = max(peak, world.resident)
+        max_c = max(max_c, focus[1])
+    half = len(lat) // 2
+    first, last = sorted(lat[:half]), sorted(lat[half:])
+    rep = {
+        "moves": len(lat), "opened": world.open_count, "mine_hits": hits,
+        "reached_col": max_c, "peak_resident_chunks": peak,
+        "stored_chunks": world.stored(), "evicted": world.stats["evicted"],
+        "loaded": world.stats["loaded"],
+        "move_ms_first_half": {"p50": round(percentile(first, 50) * 1e3, 2),
+                               "p95": round(percentile(first, 95) * 1e3, 2)},
+        "move_ms_second_half": {"p50": round(percentile(last, 50) * 1e3, 2),
+                                "p95": round(percentile(last, 95) * 1e3, 2)},
+    }
+    world.close()
+    return rep